@@ -1,19 +1,46 @@
 # Enhanced AI-Powered Modern Slavery Assessment Backend with Hybrid Framework + Tavily Integration - FIXED NEWS HANDLING
+import time
+MODULE_IMPORT_STARTED = time.perf_counter()
+
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import time
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 import re
-from urllib.parse import urljoin, urlparse
-import sqlite3
+from urllib.parse import urlparse, parse_qsl, urlencode
 from datetime import datetime, timedelta, date
 import json
-import numpy as np
-from collections import defaultdict
+import gzip
+import copy
+import hashlib
+import bisect
+import sqlite3
+import unicodedata
+from collections import defaultdict, deque, OrderedDict
 import os
-from tavily import TavilyClient  # NEW: Added Tavily import
+import threading
+import tracemalloc
+import sys
+import uuid
+import select
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional faster JSON encoder and brotli compression; stdlib json/gzip are used without them
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+# POSIX only; memory metrics fall back to tracemalloc figures without it (e.g. on Windows)
+try:
+    import resource
+except ImportError:
+    resource = None
 
 app = Flask(__name__)
 CORS(app)
@@ -28,13 +55,14 @@ def get_api_keys():
         'tavily': os.getenv("TAVILY_API_KEY", "")  # NEW: Added Tavily API key
     }
 
-# DEBUG: Let's see what Railway actually provides
-print("🔧 DEBUG: All environment variables with 'API' in name:")
-for key, value in os.environ.items():
-    if 'API' in key.upper():
-        print(f"   {key}: {value[:15]}..." if value else f"   {key}: EMPTY")
+# DEBUG: Let's see what Railway actually provides (opt-in, it slows startup and prints key prefixes)
+if os.getenv("DEBUG_ENV_AT_STARTUP", "false").lower() in ("1", "true", "yes", "on"):
+    print("🔧 DEBUG: All environment variables with 'API' in name:")
+    for key, value in os.environ.items():
+        if 'API' in key.upper():
+            print(f"   {key}: {value[:15]}..." if value else f"   {key}: EMPTY")
 
-print(f"🔧 DEBUG: Total environment variables: {len(os.environ)}")
+    print(f"🔧 DEBUG: Total environment variables: {len(os.environ)}")
 
 # Test API keys at startup
 api_keys = get_api_keys()
@@ -84,6 +112,651 @@ INDUSTRY_RISK_INDEX = {
     "Consumer Goods": 65, "Luxury Goods": 75
 }
 
+# STRICTER high-risk business model keywords
+HIGH_RISK_BUSINESS_MODEL_KEYWORDS = {
+    "fast fashion": 95,
+    "ultra fast fashion": 98,
+    "disposable fashion": 95,
+    "athletic apparel": 88,  # NEW: Nike/Adidas etc
+    "footwear": 90,          # NEW: Shoe manufacturing
+    "sportswear": 88,        # NEW: Sports brands
+    "apparel": 85,           # NEW: General clothing
+    "garment": 90,
+    "textile": 85,
+    "manufacturing": 70,
+    "mining": 88,
+    "construction": 80
+}
+ATHLETIC_APPAREL_TERMS = ("athletic", "sport", "footwear", "apparel", "fashion")
+ATHLETIC_APPAREL_MIN_RISK = 85
+
+def business_model_risk_keywords(business_model):
+    """(keyword, score) for each high-risk keyword in a business model description"""
+    business_model_lower = business_model.lower() if business_model else ""
+    return [(keyword, score) for keyword, score in HIGH_RISK_BUSINESS_MODEL_KEYWORDS.items() if keyword in business_model_lower]
+
+def is_athletic_apparel_industry(industry):
+    industry_lower = industry.lower()
+    return any(term in industry_lower for term in ATHLETIC_APPAREL_TERMS)
+
+def industry_risk_matches(industry):
+    """INDUSTRY_RISK_INDEX entries a free-text industry label matches (by words or substrings)"""
+    industry_lower = industry.lower()
+    industry_words = industry_lower.split()
+    matches = []
+    for risk_industry in INDUSTRY_RISK_INDEX:
+        risk_lower = risk_industry.lower()
+        if (any(word in risk_lower for word in industry_words) or
+            any(word in industry_lower for word in risk_lower.split()) or
+            industry_lower in risk_lower or 
+            risk_lower in industry_lower):
+            matches.append(risk_industry)
+    return matches
+
+# NEW: ISO 3166 alpha-2 codes used by the governance dataset's Headquarters column
+ISO2_COUNTRY_NAMES = {
+    "KP": "North Korea", "AF": "Afghanistan", "ER": "Eritrea", "MR": "Mauritania", "MM": "Myanmar",
+    "IR": "Iran", "SA": "Saudi Arabia", "PK": "Pakistan", "TR": "Turkey", "TJ": "Tajikistan",
+    "BD": "Bangladesh", "CN": "China", "IN": "India", "KH": "Cambodia", "NG": "Nigeria",
+    "IQ": "Iraq", "TH": "Thailand", "VN": "Vietnam", "PH": "Philippines", "ID": "Indonesia",
+    "MY": "Malaysia", "RU": "Russia", "EG": "Egypt", "MX": "Mexico", "BR": "Brazil",
+    "ZA": "South Africa", "MA": "Morocco", "JO": "Jordan", "US": "United States", "JP": "Japan",
+    "GB": "United Kingdom", "AU": "Australia", "CA": "Canada", "DE": "Germany", "FR": "France",
+    "NL": "Netherlands", "DK": "Denmark", "SE": "Sweden", "NO": "Norway", "CH": "Switzerland",
+    "FI": "Finland", "NZ": "New Zealand", "SG": "Singapore", "IE": "Ireland", "IT": "Italy",
+    "ES": "Spain", "BE": "Belgium", "LU": "Luxembourg", "AT": "Austria", "HK": "Hong Kong",
+    "KR": "South Korea", "TW": "Taiwan", "IL": "Israel", "AE": "United Arab Emirates"
+}
+
+# NEW: Per-stage model routing - cheap stages run on the fast tier, scoring-critical stages keep the strong model
+MODEL_TIERS = {
+    "strong": os.getenv("OPENAI_STRONG_MODEL", "gpt-4o"),
+    "fast": os.getenv("OPENAI_FAST_MODEL", "gpt-4o-mini")
+}
+
+DEFAULT_MODEL_ROUTING = {
+    # Scoring-critical stages
+    "company_profile": {"tier": "strong", "timeout": 45, "max_tokens": 1000},
+    "statement_analysis": {"tier": "strong", "timeout": 45, "max_tokens": 800},
+    "operational_assessment": {"tier": "strong", "timeout": 45, "max_tokens": 1000},
+    "comprehensive_analysis": {"tier": "strong", "timeout": 45, "max_tokens": 2000},
+
+    # Presentation/enrichment stages
+    "manufacturing_locations": {"tier": "fast", "timeout": 30, "max_tokens": 1500},
+    "industry_analysis": {"tier": "fast", "timeout": 30, "max_tokens": 2000},
+    "modern_slavery_summary": {"tier": "fast", "timeout": 15, "max_tokens": 200},
+    "connectivity_test": {"tier": "fast", "timeout": 15, "max_tokens": 20},
+
+    "default": {"tier": "strong", "timeout": 45, "max_tokens": 1500}
+}
+
+class ModelRouter:
+    def __init__(self, routing=None):
+        """Initialize stage routing table, applying MODEL_ROUTING_OVERRIDES (JSON) from the environment"""
+        self.lock = threading.Lock()
+        self.routing = {stage: dict(route) for stage, route in (routing or DEFAULT_MODEL_ROUTING).items()}
+
+        env_overrides = os.getenv("MODEL_ROUTING_OVERRIDES", "")
+        if env_overrides:
+            try:
+                overrides = json.loads(env_overrides)
+                self.update(overrides)
+                print(f"🔧 Applied model routing overrides for: {list(overrides.keys())}")
+            except (ValueError, TypeError) as e:
+                print(f"❌ Ignoring invalid MODEL_ROUTING_OVERRIDES: {e}")
+
+    def resolve(self, stage):
+        """Get model, timeout and max_tokens for a pipeline stage"""
+        with self.lock:
+            route = dict(self.routing.get(stage) or self.routing["default"])
+
+        # An explicit model wins over the tier
+        route['model'] = route.get('model') or MODEL_TIERS.get(route.get('tier'), MODEL_TIERS['strong'])
+        return route
+
+    def update(self, overrides):
+        """Merge per-stage overrides into the routing table (raises ValueError on bad input)"""
+        if not isinstance(overrides, dict):
+            raise ValueError("Routing overrides must be an object keyed by stage")
+
+        validated = {}
+        for stage, route in overrides.items():
+            if not isinstance(route, dict):
+                raise ValueError(f"Route for '{stage}' must be an object")
+
+            unknown_keys = set(route) - {'tier', 'model', 'timeout', 'max_tokens'}
+            if unknown_keys:
+                raise ValueError(f"Unknown route settings for '{stage}': {sorted(unknown_keys)}")
+            if 'tier' in route and route['tier'] not in MODEL_TIERS:
+                raise ValueError(f"Unknown tier '{route['tier']}' for '{stage}' (expected one of {list(MODEL_TIERS)})")
+            for key in ('timeout', 'max_tokens'):
+                if key in route and (not isinstance(route[key], (int, float)) or route[key] <= 0):
+                    raise ValueError(f"'{key}' for '{stage}' must be a positive number")
+
+            validated[stage] = route
+
+        with self.lock:
+            for stage, route in validated.items():
+                merged = dict(self.routing.get(stage, self.routing["default"]))
+                merged.update(route)
+                # Choosing a tier clears a previously pinned model
+                if 'tier' in route and 'model' not in route:
+                    merged.pop('model', None)
+                self.routing[stage] = merged
+
+    def snapshot(self):
+        """Current routing table with resolved model names"""
+        with self.lock:
+            stages = list(self.routing.keys())
+        return {stage: self.resolve(stage) for stage in stages}
+
+class StageMetrics:
+    def __init__(self, window_size=500):
+        """Rolling per-stage latency and token counters"""
+        self.lock = threading.Lock()
+        self.window_size = window_size
+        self.stages = {}
+
+    def record(self, stage, duration, model=None, prompt_tokens=0, completion_tokens=0, success=True):
+        """Record one stage execution"""
+        with self.lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = {
+                    'calls': 0,
+                    'errors': 0,
+                    'prompt_tokens': 0,
+                    'completion_tokens': 0,
+                    'models': {},
+                    'latencies': deque(maxlen=self.window_size)
+                }
+                self.stages[stage] = stats
+
+            stats['calls'] += 1
+            if not success:
+                stats['errors'] += 1
+            stats['prompt_tokens'] += prompt_tokens or 0
+            stats['completion_tokens'] += completion_tokens or 0
+            if model:
+                stats['models'][model] = stats['models'].get(model, 0) + 1
+            stats['latencies'].append(duration)
+
+    def snapshot(self):
+        """Summarize latency percentiles and token usage per stage"""
+        with self.lock:
+            summary = {}
+            for stage, stats in self.stages.items():
+                latencies = sorted(stats['latencies'])
+                summary[stage] = {
+                    'calls': stats['calls'],
+                    'errors': stats['errors'],
+                    'models': dict(stats['models']),
+                    'prompt_tokens': stats['prompt_tokens'],
+                    'completion_tokens': stats['completion_tokens'],
+                    'avg_tokens_per_call': round((stats['prompt_tokens'] + stats['completion_tokens']) / stats['calls'], 1),
+                    'latency_ms': {
+                        'avg': round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0,
+                        'p50': round(percentile_of_sorted(latencies, 50) * 1000, 1),
+                        'p95': round(percentile_of_sorted(latencies, 95) * 1000, 1),
+                        'max': round(latencies[-1] * 1000, 1) if latencies else 0
+                    }
+                }
+            return summary
+
+def percentile_of_sorted(values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return 0
+    rank = max(0, min(len(values) - 1, int(round(pct / 100 * len(values) + 0.5)) - 1))
+    return values[rank]
+
+model_router = ModelRouter()
+stage_metrics = StageMetrics()
+
+# NEW: Provider circuit breakers and request-wide assessment deadlines
+class ProviderUnavailableError(Exception):
+    """Raised when a provider call is skipped (open circuit, spent deadline or cancelled assessment)"""
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=5, recovery_timeout=30):
+        """Open after `failure_threshold` consecutive failures, allow one trial call after `recovery_timeout` seconds"""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.lock = threading.Lock()
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self.rejected_calls = 0
+
+    def allow_request(self):
+        """Whether a call to this provider may go out now"""
+        with self.lock:
+            if self.state == "closed":
+                return True
+
+            if self.state == "open" and time.time() - self.opened_at >= self.recovery_timeout:
+                self.state = "half_open"
+                self.trial_in_flight = False
+
+            if self.state == "half_open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+
+            self.rejected_calls += 1
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.consecutive_failures += 1
+            self.trial_in_flight = False
+            if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"🔌 Circuit breaker OPEN for {self.name} after {self.consecutive_failures} failures")
+                self.state = "open"
+                self.opened_at = time.time()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'rejected_calls': self.rejected_calls,
+                'retry_in_seconds': round(max(0, self.recovery_timeout - (time.time() - self.opened_at)), 1) if self.state == "open" else 0
+            }
+
+PROVIDER_BREAKERS = {
+    provider: CircuitBreaker(
+        provider,
+        failure_threshold=int(os.getenv("CIRCUIT_BREAKER_FAILURES", 5)),
+        recovery_timeout=float(os.getenv("CIRCUIT_BREAKER_RECOVERY_SECONDS", 30))
+    )
+    for provider in ('openai', 'tavily', 'newsapi', 'worldbank', 'gdelt', 'nominatim')
+}
+
+# NEW: Provider endpoints are configurable so the pipeline can run against local stubs (see stub_providers.py)
+PROVIDER_BASE_URLS = {
+    'openai': "https://api.openai.com/v1",
+    'tavily': "https://api.tavily.com",
+    'newsapi': "https://newsapi.org/v2",
+    'worldbank': "https://api.worldbank.org/v2",
+    'gdelt': "https://api.gdeltproject.org/api/v2",
+    'nominatim': "https://nominatim.openstreetmap.org"
+}
+
+def provider_url(provider, path):
+    """Build a provider URL, honouring <PROVIDER>_API_BASE or STUB_PROVIDERS_URL overrides"""
+    base_url = os.getenv(f"{provider.upper()}_API_BASE", "")
+    if not base_url and os.getenv("STUB_PROVIDERS_URL", ""):
+        # The stub server mounts every provider under its own prefix
+        base_url = f"{os.getenv('STUB_PROVIDERS_URL').rstrip('/')}/{provider}"
+    return (base_url or PROVIDER_BASE_URLS[provider]).rstrip('/') + path
+
+# NEW: Record/replay HTTP transport for offline, quota-free runs
+SECRET_PARAMS = ('apiKey', 'api_key', 'key')
+VOLATILE_PARAMS = ('from',)  # Date windows computed from "now" would never match on replay
+
+class HttpCassette:
+    def __init__(self, path):
+        """Recorded provider responses, one JSON object per line"""
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = defaultdict(list)
+        self.replay_positions = defaultdict(int)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as cassette_file:
+                for line in cassette_file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.entries[entry['key']].append(entry)
+            print(f"📼 Loaded {sum(len(v) for v in self.entries.values())} recorded responses from {path}")
+
+    @staticmethod
+    def request_key(prepared_request):
+        """Stable key for a request with credentials, volatile dates and ports stripped"""
+        parsed = urlparse(prepared_request.url)
+        query = sorted((k, v) for k, v in parse_qsl(parsed.query) if k not in SECRET_PARAMS + VOLATILE_PARAMS)
+        body = prepared_request.body or b''
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', errors='replace')
+        try:
+            body_json = json.loads(body) if body else None
+            if isinstance(body_json, dict):
+                body_json = {k: v for k, v in body_json.items() if k not in SECRET_PARAMS}
+            body = json.dumps(body_json, sort_keys=True)
+        except ValueError:
+            pass
+        return f"{prepared_request.method} {parsed.hostname}{parsed.path}?{urlencode(query)} {body}"
+
+    def record(self, key, response):
+        entry = {
+            'key': key,
+            'status_code': response.status_code,
+            'headers': {'Content-Type': response.headers.get('Content-Type', 'application/json')},
+            'body': response.content.decode('utf-8', errors='replace')
+        }
+        with self.lock:
+            self.entries[key].append(entry)
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as cassette_file:
+                cassette_file.write(json.dumps(entry) + "\n")
+
+    def replay(self, key):
+        """Next recorded response for this key (cycles when a key was recorded several times)"""
+        with self.lock:
+            entries = self.entries.get(key)
+            if not entries:
+                return None
+            position = self.replay_positions[key]
+            self.replay_positions[key] = position + 1
+            return entries[position % len(entries)]
+
+class RecordReplayAdapter(HTTPAdapter):
+    def __init__(self, cassette, mode):
+        """Transport adapter that records live responses or replays them without touching the network"""
+        super().__init__()
+        self.cassette = cassette
+        self.mode = mode
+
+    def send(self, prepared_request, **kwargs):
+        key = HttpCassette.request_key(prepared_request)
+
+        if self.mode == 'replay':
+            entry = self.cassette.replay(key)
+            if entry is None:
+                raise requests.ConnectionError(f"No recorded response for {key[:200]}")
+            response = requests.Response()
+            response.status_code = entry['status_code']
+            response.headers = CaseInsensitiveDict(entry['headers'])
+            response._content = entry['body'].encode('utf-8')
+            response._content_consumed = True  # Lets iter_lines() serve recorded SSE streams
+            response.encoding = 'utf-8'
+            response.url = prepared_request.url
+            response.request = prepared_request
+            return response
+
+        response = super().send(prepared_request, **kwargs)
+        self.cassette.record(key, response)
+        return response
+
+http_cassettes = {}
+
+def configure_http_transport(session):
+    """Mount the record/replay adapter when HTTP_TRANSPORT_MODE is 'record' or 'replay'"""
+    mode = os.getenv("HTTP_TRANSPORT_MODE", "live").lower()
+    if mode not in ('record', 'replay'):
+        return session
+
+    cassette_path = os.getenv("HTTP_CASSETTE_PATH", "cassettes/providers.jsonl")
+    if cassette_path not in http_cassettes:
+        http_cassettes[cassette_path] = HttpCassette(cassette_path)
+    adapter = RecordReplayAdapter(http_cassettes[cassette_path], mode)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class AssessmentDeadline:
+    def __init__(self, budget_seconds=None):
+        """Request-wide time budget shared by every stage of one assessment"""
+        if budget_seconds is None:
+            budget_seconds = float(os.getenv("ASSESSMENT_DEADLINE_SECONDS", 120))
+        self.budget_seconds = budget_seconds
+        self.expires_at = time.time() + budget_seconds
+        self.cancelled_event = threading.Event()
+        self.cancel_reason = None
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.time())
+
+    def cancel(self, reason):
+        """Stop all further provider work for this assessment"""
+        if not self.cancelled_event.is_set():
+            self.cancel_reason = reason
+            self.cancelled_event.set()
+            print(f"🛑 Assessment cancelled: {reason}")
+
+    def is_cancelled(self):
+        return self.cancelled_event.is_set()
+
+    def exhausted(self):
+        return self.is_cancelled() or self.remaining() <= 0
+
+    def timeout_for(self, stage_timeout):
+        """Clip a stage timeout to the remaining budget (raises once nothing is left)"""
+        if self.is_cancelled():
+            raise ProviderUnavailableError(f"assessment cancelled: {self.cancel_reason}")
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise ProviderUnavailableError(f"assessment deadline of {self.budget_seconds}s exceeded")
+        return min(stage_timeout, remaining)
+
+    def sleep(self, seconds):
+        """Rate-limit pause that returns early when the assessment is cancelled or out of time"""
+        self.cancelled_event.wait(min(seconds, self.remaining()))
+
+# NEW: On-demand request profiling (opt-in per request, see /assess?profile=1)
+class SamplingProfiler:
+    def __init__(self, interval=0.005, max_depth=60):
+        """Wall-clock stack sampler for a single thread"""
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stack_counts = defaultdict(int)
+        self.sample_count = 0
+        self.target_ident = None
+        self.stop_event = threading.Event()
+        self.sampler_thread = None
+        self.started_at = None
+        self.duration = 0.0
+
+    def start(self, target_ident):
+        self.target_ident = target_ident
+        self.started_at = time.perf_counter()
+        self.sampler_thread = threading.Thread(target=self.sample_loop, name="request-profiler", daemon=True)
+        self.sampler_thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.sampler_thread:
+            self.sampler_thread.join()
+        self.duration = time.perf_counter() - self.started_at if self.started_at else 0.0
+
+    def sample_loop(self):
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_ident)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            self.stack_counts[";".join(reversed(stack))] += 1
+            self.sample_count += 1
+
+    def report(self, top_n=25):
+        """Collapsed stacks (flamegraph.pl format) plus top functions by self and total samples"""
+        self_counts = defaultdict(int)
+        total_counts = defaultdict(int)
+        for stack, count in self.stack_counts.items():
+            frames = [f.rsplit(':', 1)[0] for f in stack.split(';')]
+            self_counts[frames[-1]] += count
+            for function in set(frames):
+                total_counts[function] += count
+
+        def top(counts):
+            return [
+                {'function': function, 'samples': count, 'percent': round(count / self.sample_count * 100, 1)}
+                for function, count in sorted(counts.items(), key=lambda item: -item[1])[:top_n]
+            ] if self.sample_count else []
+
+        return {
+            'sample_interval_ms': self.interval * 1000,
+            'samples': self.sample_count,
+            'duration_ms': round(self.duration * 1000, 1),
+            'top_self': top(self_counts),
+            'top_total': top(total_counts),
+            'collapsed_stacks': [f"{stack} {count}" for stack, count in sorted(self.stack_counts.items(), key=lambda item: -item[1])]
+        }
+
+# NEW: Per-assessment memory tracking (MEMORY_TRACKING_ENABLED) for sizing worker counts
+class MemoryTracker:
+    def __init__(self, sample_interval=0.01, window_size=500):
+        """Track traced-memory peaks per assessment and per stage using tracemalloc.
+
+        tracemalloc counts the whole process, so with concurrent assessments each
+        peak is an upper bound that includes overlapping work (see 'concurrent_assessments').
+        """
+        self.enabled = os.getenv("MEMORY_TRACKING_ENABLED", "false").lower() in ("1", "true", "yes", "on")
+        self.sample_interval = sample_interval
+        self.lock = threading.Lock()
+        self.active = []
+        self.sampler_thread = None
+        self.assessment_peaks = deque(maxlen=window_size)
+        self.stage_peaks = defaultdict(lambda: deque(maxlen=window_size))
+        self.assessments_recorded = 0
+        if self.enabled:
+            tracemalloc.start()
+            print("🧮 Memory tracking enabled (tracemalloc)")
+
+    def begin(self):
+        """Start tracking one assessment; returns its record (or None when disabled)"""
+        if not self.enabled:
+            return None
+        current = tracemalloc.get_traced_memory()[0]
+        record = {'baseline': current, 'peak': current, 'stage': None, 'stages': [], 'max_concurrent': 0}
+        with self.lock:
+            self.active.append(record)
+            for active_record in self.active:
+                active_record['max_concurrent'] = max(active_record['max_concurrent'], len(self.active))
+            if self.sampler_thread is None or not self.sampler_thread.is_alive():
+                self.sampler_thread = threading.Thread(target=self.sample_loop, name="memory-sampler", daemon=True)
+                self.sampler_thread.start()
+        return record
+
+    def sample_loop(self):
+        """Poll traced memory while any assessment is running"""
+        while True:
+            current = tracemalloc.get_traced_memory()[0]
+            with self.lock:
+                if not self.active:
+                    self.sampler_thread = None
+                    return
+                for record in self.active:
+                    record['peak'] = max(record['peak'], current)
+                    if record['stage']:
+                        record['stage']['peak'] = max(record['stage']['peak'], current)
+            time.sleep(self.sample_interval)
+
+    def stage_started(self, record, stage):
+        if record is None:
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        with self.lock:
+            record['stage'] = {'stage': stage, 'start': current, 'peak': current}
+
+    def stage_finished(self, record):
+        if record is None or record['stage'] is None:
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        with self.lock:
+            stage = record['stage']
+            stage['peak'] = max(stage['peak'], current)
+            record['peak'] = max(record['peak'], stage['peak'])
+            record['stages'].append({
+                'stage': stage['stage'],
+                'peak_increase_bytes': stage['peak'] - stage['start'],
+                'net_retained_bytes': current - stage['start']
+            })
+            record['stage'] = None
+
+    def finish(self, record):
+        """Stop tracking an assessment and return its memory summary (later calls return the same summary)"""
+        if record is None:
+            return None
+        with self.lock:
+            if record.get('finished'):
+                return record['summary']
+            record['finished'] = True
+            if record in self.active:
+                self.active.remove(record)
+            peak_increase = record['peak'] - record['baseline']
+            self.assessment_peaks.append(peak_increase)
+            self.assessments_recorded += 1
+            for stage in record['stages']:
+                self.stage_peaks[stage['stage']].append(stage['peak_increase_bytes'])
+
+            top_stages = sorted(record['stages'], key=lambda stage: -stage['peak_increase_bytes'])[:5]
+            record['summary'] = {
+                'peak_increase_mb': round(peak_increase / 1048576, 2),
+                'concurrent_assessments': record['max_concurrent'],
+                'top_stages': [
+                    {**stage, 'peak_increase_mb': round(stage['peak_increase_bytes'] / 1048576, 2)}
+                    for stage in top_stages
+                ]
+            }
+            return record['summary']
+
+    def snapshot(self):
+        """Aggregates for the metrics endpoint"""
+        if not self.enabled:
+            return {'enabled': False}
+
+        current, process_peak = tracemalloc.get_traced_memory()
+        with self.lock:
+            peaks = sorted(self.assessment_peaks)
+            stages = {stage: sorted(values) for stage, values in self.stage_peaks.items()}
+            active = len(self.active)
+
+        def mb(value):
+            return round(value / 1048576, 2)
+
+        return {
+            'enabled': True,
+            'assessments_recorded': self.assessments_recorded,
+            'active_assessments': active,
+            'assessment_peak_increase_mb': {
+                'p50': mb(percentile_of_sorted(peaks, 50)),
+                'p95': mb(percentile_of_sorted(peaks, 95)),
+                'max': mb(peaks[-1]) if peaks else 0
+            },
+            'stages': {
+                stage: {
+                    'avg_peak_increase_mb': mb(sum(values) / len(values)),
+                    'p95_peak_increase_mb': mb(percentile_of_sorted(values, 95)),
+                    'max_peak_increase_mb': mb(values[-1])
+                }
+                for stage, values in sorted(stages.items(), key=lambda item: -(sum(item[1]) / len(item[1])))
+            },
+            'process': {
+                'traced_current_mb': mb(current),
+                'traced_peak_mb': mb(process_peak),
+                # ru_maxrss is KB on Linux
+                'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1) if resource else None
+            }
+        }
+
+memory_tracker = MemoryTracker()
+
+def profiling_enabled():
+    return os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes", "on")
+
+def profile_artifact_path(profile_id):
+    return os.path.join(os.getenv("PROFILE_DIR", "profiles"), f"{profile_id}.json")
+
+def save_profile_artifact(profile_id, artifact):
+    path = profile_artifact_path(profile_id)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as artifact_file:
+        json.dump(artifact, artifact_file, default=str)
+    print(f"🔬 Saved request profile {profile_id} to {path}")
+
 def clean_json_response(ai_response):
     """Clean AI response to extract valid JSON"""
     if not ai_response:
@@ -102,19 +775,143 @@ def clean_json_response(ai_response):
     
     return cleaned.strip()
 
+# NEW: Streaming LLM output - emit JSON array elements as soon as each one is complete
+def llm_streaming_enabled():
+    """Streaming is on unless LLM_STREAMING_ENABLED is set to a false value"""
+    return os.getenv("LLM_STREAMING_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+
+class IncrementalJSONArrayParser:
+    def __init__(self, array_key):
+        """Parse elements of the array under `array_key` from a partially received JSON document"""
+        self.array_key = array_key
+        self.buffer = ""
+        self.scan_pos = None  # Position of the next unscanned character inside the array
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.element_start = None
+        self.finished = False
+        self.elements = []
+
+    def feed(self, text):
+        """Add streamed text and return the list of elements completed by it"""
+        if self.finished or not text:
+            return []
+
+        self.buffer += text
+
+        if self.scan_pos is None:
+            match = re.search(r'"' + re.escape(self.array_key) + r'"\s*:\s*\[', self.buffer)
+            if not match:
+                return []
+            self.scan_pos = match.end()
+
+        completed = []
+        buffer = self.buffer
+        pos = self.scan_pos
+        while pos < len(buffer):
+            char = buffer[pos]
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in '{[':
+                if self.depth == 0:
+                    self.element_start = pos
+                self.depth += 1
+            elif char in '}]':
+                if self.depth == 0:
+                    # Closing bracket of the array itself
+                    self.finished = True
+                    pos += 1
+                    break
+                self.depth -= 1
+                if self.depth == 0:
+                    try:
+                        element = json.loads(buffer[self.element_start:pos + 1])
+                        completed.append(element)
+                    except json.JSONDecodeError as e:
+                        print(f"⚠️ Skipping malformed streamed element: {e}")
+                    self.element_start = None
+            pos += 1
+
+        self.scan_pos = pos
+        self.elements.extend(completed)
+        return completed
+
+# NEW: Company entity resolution - "Nike", "Nike Inc." and "NIKE, Inc." share one key and company id
+LEGAL_FORM_SUFFIXES = {
+    'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'ltd', 'limited', 'plc', 'llc', 'llp',
+    'lp', 'ag', 'sa', 'se', 'nv', 'bv', 'gmbh', 'spa', 'ab', 'asa', 'oyj', 'kk', 'pty', 'pte'
+}
+
+def fold_text(text):
+    """Casefolded NFKC text; accents on Latin letters and invisible format characters (soft
+    hyphens, zero-width spaces) are dropped, marks that belong to other scripts (e.g. Japanese
+    dakuten) are kept"""
+    decomposed = unicodedata.normalize('NFKD', str(text or ''))
+    kept = []
+    for char in decomposed:
+        if unicodedata.category(char) == 'Cf' or (unicodedata.combining(char) and kept and kept[-1].isascii()):
+            continue
+        kept.append(char)
+    return unicodedata.normalize('NFKC', ''.join(kept)).casefold()
+
+def normalize_entity_name(company_name):
+    """Entity key: casefolded Unicode words without punctuation, a leading 'the' or trailing legal
+    forms; names with no letters or digits fall back to the stripped casefolded name"""
+    text = re.sub(r"['’‘ʼ]", '', fold_text(company_name).replace('&', ' and '))
+    tokens = re.sub(r'[\W_]+', ' ', text).split()
+    if not tokens:
+        return fold_text(company_name).strip()
+    if len(tokens) > 1 and tokens[0] == 'the':
+        tokens = tokens[1:]
+    while len(tokens) > 1 and tokens[-1] in LEGAL_FORM_SUFFIXES:
+        tokens = tokens[:-1]
+    return ' '.join(tokens)
+
+def company_id_for_key(entity_key):
+    """Stable company id derived from an entity key"""
+    if not entity_key:
+        raise ValueError("Company name required")  # Every blank name would otherwise share one id
+    return "co_" + hashlib.sha1(entity_key.encode('utf-8')).hexdigest()[:12]
+
+BLANK_KEY_COMPANY_ID = "co_" + hashlib.sha1(b'').hexdigest()[:12]  # What every non-Latin name used to map to
+
+def normalize_search_text(text):
+    """Casefolded Unicode words, '&' read as 'and' (legal forms are kept for prefix matching)"""
+    return ' '.join(re.sub(r'[\W_]+', ' ', fold_text(text).replace('&', ' and ')).split())
+
+def assessments_db_path():
+    return os.getenv("ASSESSMENTS_DB_PATH", "assessments.db")
+
 # NEW: Governance Dataset Integration
 class GovernanceDatasetManager:
     def __init__(self, csv_path='governance_assessment_results.csv'):
         """Initialize governance dataset manager"""
         self.governance_df = None
         self.csv_path = csv_path
+        # company_id -> first dataset row with that entity key
+        self.company_index = {}
         self.load_governance_data()
     
     def load_governance_data(self):
         """Load governance assessment results from CSV"""
         try:
             if os.path.exists(self.csv_path):
+                # pandas is only needed here; importing it lazily keeps cold starts fast
+                import pandas as pd
                 self.governance_df = pd.read_csv(self.csv_path)
+                for position, name in enumerate(self.governance_df['Company_Name']):
+                    entity_key = normalize_entity_name(name) if isinstance(name, str) else ''
+                    if entity_key:
+                        self.company_index.setdefault(company_id_for_key(entity_key), position)
                 print(f"✅ Loaded governance data for {len(self.governance_df)} companies")
                 return True
             else:
@@ -124,19 +921,25 @@ class GovernanceDatasetManager:
             print(f"❌ Error loading governance dataset: {e}")
             return False
     
-    def get_company_governance_score(self, company_name):
+    def get_company_governance_score(self, company_name, company_id=None):
         """Get governance score from dataset"""
         if self.governance_df is None:
             return None
         
-        # Exact match first
+        # Resolved company id (covers name variants and registered aliases)
+        entity_key = normalize_entity_name(company_name)
+        position = self.company_index.get(company_id or (company_id_for_key(entity_key) if entity_key else None))
+        if position is not None:
+            return self.governance_df.iloc[position].to_dict()
+        
+        # Exact match
         exact_match = self.governance_df[self.governance_df['Company_Name'] == company_name]
         if not exact_match.empty:
             return exact_match.iloc[0].to_dict()
         
         # Fuzzy match
         fuzzy_match = self.governance_df[
-            self.governance_df['Company_Name'].str.contains(company_name, case=False, na=False)
+            self.governance_df['Company_Name'].str.contains(company_name, case=False, na=False, regex=False)
         ]
         if not fuzzy_match.empty:
             return fuzzy_match.iloc[0].to_dict()
@@ -147,48 +950,2490 @@ class GovernanceDatasetManager:
         """Check if governance dataset is available"""
         return self.governance_df is not None
 
-class EnhancedModernSlaveryAssessment:
+# NEW: One shared, lazily loaded governance dataset instead of a CSV load per request
+shared_governance_manager = None
+governance_manager_lock = threading.Lock()
+STARTUP_REPORT = {'import_seconds': None, 'governance_warmup_seconds': None, 'first_health_seconds': None}
+
+def get_governance_manager(wait=True):
+    """Return the shared dataset manager, loading it on first use.
+
+    With wait=False, returns None instead of loading (or waiting for the warm-up).
+    """
+    global shared_governance_manager
+    if shared_governance_manager is None:
+        if not wait:
+            return None
+        with governance_manager_lock:
+            if shared_governance_manager is None:
+                started = time.perf_counter()
+                shared_governance_manager = GovernanceDatasetManager()
+                STARTUP_REPORT['governance_warmup_seconds'] = round(time.perf_counter() - started, 3)
+    return shared_governance_manager
+
+class CompanyResolver:
+    def __init__(self, governance_manager, db_path=None):
+        """Resolve company names to stable ids from the governance dataset names, previously
+        assessed companies and manual aliases (the last two persisted in the company_aliases table)"""
+        self.db_path = db_path or assessments_db_path()
+        self.lock = threading.Lock()
+        self.aliases = {}                  # entity key -> company_id
+        self.names = {}                    # company_id -> {'name', 'source', 'industry', 'headquarters', 'coverage'}
+        self.keys_by_id = defaultdict(set)
+        # Sorted (text, company_id, word position) for every word-start suffix of every known name
+        self.search_entries = []
+        
+        if governance_manager.is_available():
+            columns = ['Company_Name', 'Sectors', 'Headquarters', 'Record_Count', 'Years_Tracked']
+            for name, sectors, headquarters, record_count, years_tracked in governance_manager.governance_df[columns].itertuples(index=False):
+                if not isinstance(name, str):
+                    continue
+                entity_key = normalize_entity_name(name)
+                if entity_key and entity_key not in self.aliases:
+                    self.remember(entity_key, company_id_for_key(entity_key), name, 'governance_dataset', {
+                        'industry': sectors if isinstance(sectors, str) else 'Unknown',
+                        'headquarters': ISO2_COUNTRY_NAMES.get(headquarters, headquarters),
+                        'coverage': int(record_count or 0) + int(years_tracked or 0)
+                    }, sort=False)
+        self.load_aliases()
+        self.search_entries.sort()
+
+    def connect(self):
+        connection = sqlite3.connect(self.db_path, timeout=5)
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS company_aliases (
+                alias_key TEXT PRIMARY KEY,
+                company_id TEXT NOT NULL,
+                display_name TEXT,
+                source TEXT,
+                created_at TEXT
+            )
+        """)
+        return connection
+
+    def load_aliases(self):
+        try:
+            with self.connect() as connection:
+                rows = connection.execute(
+                    "SELECT alias_key, company_id, display_name, source FROM company_aliases"
+                ).fetchall()
+            for alias_key, company_id, display_name, source in rows:
+                # Keys saved by the older ASCII-only normalization are recomputed from the name;
+                # non-Latin names it reduced to '' all shared one id and get their own again
+                entity_key = normalize_entity_name(display_name) if display_name else alias_key
+                if not entity_key:
+                    continue
+                if company_id == BLANK_KEY_COMPANY_ID:
+                    company_id = company_id_for_key(entity_key)
+                self.remember(entity_key, company_id, display_name, source, sort=False)
+            if rows:
+                print(f"✅ Loaded {len(rows)} company aliases")
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not load company aliases: {e}")
+
+    def remember(self, entity_key, company_id, display_name, source, details=None, sort=True):
+        self.aliases[entity_key] = company_id
+        self.keys_by_id[company_id].add(entity_key)
+        self.names.setdefault(company_id, {
+            'name': display_name, 'source': source, 'industry': 'Unknown', 'headquarters': None, 'coverage': 0,
+            **(details or {})
+        })
+        
+        words = normalize_search_text(display_name).split()
+        for position in range(len(words)):
+            entry = (' '.join(words[position:]), company_id, position)
+            if sort:
+                bisect.insort(self.search_entries, entry)
+            else:
+                self.search_entries.append(entry)
+
+    def persist(self, entity_key, company_id, display_name, source):
+        try:
+            with self.connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO company_aliases VALUES (?, ?, ?, ?, ?)",
+                    (entity_key, company_id, display_name, source, datetime.now().isoformat(timespec='seconds'))
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not save company alias: {e}")
+
+    def resolve(self, company_name, register=False):
+        """Return {'company_id', 'canonical_name', 'source'}; register=True remembers new companies"""
+        entity_key = normalize_entity_name(company_name)
+        if not entity_key:
+            raise ValueError("Company name required")
+        with self.lock:
+            company_id = self.aliases.get(entity_key)
+            if company_id is None:
+                company_id = company_id_for_key(entity_key)
+                if register and entity_key:
+                    self.remember(entity_key, company_id, company_name.strip(), 'assessed')
+                    self.persist(entity_key, company_id, company_name.strip(), 'assessed')
+            known = self.names.get(company_id, {'name': company_name.strip(), 'source': 'new'})
+        return {'company_id': company_id, 'canonical_name': known['name'], 'source': known['source']}
+
+    def add_alias(self, alias, company_id):
+        """Point another name (e.g. a brand or former name) at an existing company id"""
+        entity_key = normalize_entity_name(alias)
+        with self.lock:
+            if company_id not in self.names:
+                raise KeyError(company_id)
+            self.remember(entity_key, company_id, alias.strip(), 'alias')
+            self.persist(entity_key, company_id, alias.strip(), 'alias')
+        return entity_key
+
+    def search(self, query, limit=10, max_candidates=500):
+        """Prefix search over known names and word starts, best matches and best dataset coverage first"""
+        results = self.prefix_matches(normalize_search_text(query), max_candidates)
+        if not results:
+            # "Nike Inc" should still find "Nike"
+            results = self.prefix_matches(normalize_entity_name(query), max_candidates)
+        
+        ranked = sorted(results.items(), key=lambda item: (
+            -item[1],
+            self.names[item[0]]['source'] != 'governance_dataset',
+            -self.names[item[0]]['coverage'],
+            len(self.names[item[0]]['name'])
+        ))
+        return [{'company_id': company_id, 'match': match, **self.names[company_id]} for company_id, match in ranked[:limit]]
+
+    def prefix_matches(self, prefix, max_candidates):
+        """company_id -> match quality (3 exact name, 2 name prefix, 1 later-word prefix)"""
+        matches = {}
+        if not prefix:
+            return matches
+        with self.lock:
+            start = bisect.bisect_left(self.search_entries, (prefix,))
+            for index in range(start, min(start + max_candidates, len(self.search_entries))):
+                text, company_id, position = self.search_entries[index]
+                if not text.startswith(prefix):
+                    break
+                quality = 3 if position == 0 and text == prefix else 2 if position == 0 else 1
+                if quality > matches.get(company_id, 0):
+                    matches[company_id] = quality
+        return matches
+
+    def mentions(self, company_id, company_name, text):
+        """Whether text mentions the company under any of its known names (whole words)"""
+        normalized_text = f" {normalize_search_text(text)} "
+        with self.lock:
+            entity_keys = set(self.keys_by_id.get(company_id, ()))
+        entity_keys.add(normalize_entity_name(company_name))
+        return any(f" {entity_key} " in normalized_text for entity_key in entity_keys if entity_key)
+
+shared_company_resolver = None
+company_resolver_lock = threading.Lock()
+
+def get_company_resolver():
+    """Shared company resolver, built on first use from the governance dataset and alias table"""
+    global shared_company_resolver
+    if shared_company_resolver is None:
+        governance_manager = get_governance_manager()
+        with company_resolver_lock:
+            if shared_company_resolver is None:
+                shared_company_resolver = CompanyResolver(governance_manager)
+    return shared_company_resolver
+
+# NEW: Per-sector governance score distributions from the dataset, plus statement-scored assessed companies
+ALL_SECTORS = 'All sectors'
+SECTOR_BENCHMARK_MIN_COMPANIES = int(os.getenv("SECTOR_BENCHMARK_MIN_COMPANIES", "10"))
+SECTOR_MATCH_CACHE_SIZE = 2048
+# The AI industry benchmark (common risks, practices, regulation) costs an LLM call per assessment
+INDUSTRY_BENCHMARK_LLM_ENABLED = os.getenv("INDUSTRY_BENCHMARK_LLM_ENABLED", "false").lower() not in ("0", "false", "no", "off")
+SECTOR_STOPWORDS = {'and', 'of', 'the', 'general', 'other', 'service', 'product', 'provider', 'industry', 'sector'}
+# Words the AI profile uses for industries -> words of the dataset's sector names
+SECTOR_SYNONYMS = {
+    'apparel': 'clothing', 'garment': 'clothing', 'fashion': 'clothing', 'sportswear': 'sporting',
+    'shoe': 'footwear', 'bank': 'banking', 'financial': 'finance', 'automotive': 'automobile',
+    'car': 'automobile', 'vehicle': 'automobile', 'grocery': 'supermarket', 'drug': 'pharmaceutical',
+    'drink': 'beverage', 'telecommunication': 'telecom', 'semiconductor': 'electronic',
+    'petroleum': 'oil', 'airline': 'aircraft', 'aviation': 'aircraft', 'logistic': 'freight',
+    'farming': 'agriculture', 'hospitality': 'hotel', 'healthcare': 'health', 'commerce': 'retail'
+}
+
+def split_sectors(sectors):
+    """Dataset 'Sectors' cell -> list of sector names (';'-separated, 'Unknown' dropped)"""
+    if not isinstance(sectors, str):
+        return []
+    return [sector.strip() for sector in sectors.split(';') if sector.strip() and sector.strip() != 'Unknown']
+
+def sector_words(text):
+    words = set()
+    for word in re.sub(r'[^a-z0-9]+', ' ', str(text).lower()).split():
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        word = SECTOR_SYNONYMS.get(word, word)
+        if word not in SECTOR_STOPWORDS:
+            words.add(word)
+    return words
+
+class SectorBenchmarkIndex:
+    def __init__(self, governance_manager):
+        """Sorted governance scores per sector; percentile and peer-average lookups are a bisect
+        and a running total, and new scores are inserted in place"""
+        self.lock = threading.Lock()
+        self.scores = defaultdict(list)    # sector -> sorted Total_Dataset_Score values
+        self.totals = defaultdict(float)   # sector -> sum of scores, for the average
+        self.company_sectors = {}          # company_id -> dataset sectors
+        self.assessed = {}                 # company_id -> (sectors, score) added from assessments
+        self.matched_sectors = OrderedDict()  # industry label -> sector name or None (LRU, SECTOR_MATCH_CACHE_SIZE)
+        
+        if governance_manager.is_available():
+            df = governance_manager.governance_df
+            for sectors, score in df[['Sectors', 'Total_Dataset_Score']].itertuples(index=False):
+                if score == score:  # Skip NaN
+                    for sector in split_sectors(sectors) + [ALL_SECTORS]:
+                        self.scores[sector].append(float(score))
+                        self.totals[sector] += float(score)
+            for company_id, position in governance_manager.company_index.items():
+                self.company_sectors[company_id] = split_sectors(df['Sectors'].iat[position])
+        for values in self.scores.values():
+            values.sort()
+        self.sector_words = {sector: sector_words(sector) for sector in self.scores if sector != ALL_SECTORS}
+
+    def match_sector(self, industry):
+        """Dataset sector best matching a free-text industry label (most shared words, then largest)"""
+        with self.lock:
+            if industry in self.matched_sectors:
+                self.matched_sectors.move_to_end(industry)
+                return self.matched_sectors[industry]
+        words = sector_words(industry)
+        best, best_key = None, (0, 0.0, 0)
+        for sector, sector_word_set in self.sector_words.items():
+            shared = len(words & sector_word_set)
+            if shared:
+                key = (shared, shared / len(sector_word_set), len(self.scores[sector]))
+                if key > best_key:
+                    best, best_key = sector, key
+        # Labels come from profiles and the public ?industry= parameter, so the cache is bounded
+        with self.lock:
+            self.matched_sectors[industry] = best
+            while len(self.matched_sectors) > SECTOR_MATCH_CACHE_SIZE:
+                self.matched_sectors.popitem(last=False)
+        return best
+
+    def sectors_for(self, company_id=None, industries=()):
+        """Dataset sectors for a dataset company, otherwise the sectors matching its industry labels"""
+        sectors = list(self.company_sectors.get(company_id) or [])
+        if not sectors:
+            for industry in industries:
+                sector = self.match_sector(industry) if industry else None
+                if sector and sector not in sectors:
+                    sectors.append(sector)
+        return sectors
+
+    def add_assessed(self, company_id, industries, score):
+        """Add (or update) an assessed company's governance score; dataset companies are already counted"""
+        if company_id in self.company_sectors:
+            return
+        sectors = self.sectors_for(industries=industries) + [ALL_SECTORS]
+        with self.lock:
+            previous = self.assessed.pop(company_id, None)
+            if previous:
+                for sector in previous[0]:
+                    values = self.scores[sector]
+                    del values[bisect.bisect_left(values, previous[1])]
+                    self.totals[sector] -= previous[1]
+            for sector in sectors:
+                bisect.insort(self.scores[sector], float(score))
+                self.totals[sector] += float(score)
+            self.assessed[company_id] = (sectors, float(score))
+
+    def distribution(self, sector):
+        """Count, average and quartiles of a sector's governance scores (None if unknown)"""
+        with self.lock:
+            values = self.scores.get(sector)
+            if not values:
+                return None
+            count = len(values)
+            return {
+                'sector': sector,
+                'companies': count,
+                'average_score': round(self.totals[sector] / count, 1),
+                'median_score': values[count // 2],
+                'p25_score': values[count // 4],
+                'p75_score': values[(3 * count) // 4],
+                'min_score': values[0],
+                'max_score': values[-1]
+            }
+
+    def percentile(self, sector, score):
+        """Share of the sector scoring below score, counting ties as half (0-100)"""
+        with self.lock:
+            values = self.scores.get(sector)
+            if not values:
+                return None
+            below = bisect.bisect_left(values, score)
+            equal = bisect.bisect_right(values, score) - below
+            return round(100.0 * (below + 0.5 * equal) / len(values), 1)
+
+    def benchmark_sector(self, company_id=None, industries=()):
+        """The company's first sector with at least SECTOR_BENCHMARK_MIN_COMPANIES scores, else all sectors"""
+        candidates = self.sectors_for(company_id, industries) + [ALL_SECTORS]
+        return next(s for s in candidates if s == ALL_SECTORS or len(self.scores.get(s, ())) >= SECTOR_BENCHMARK_MIN_COMPANIES)
+
+    def benchmark(self, score, company_id=None, industries=()):
+        """Compare a governance score (0-35, higher is better) with the company's sector peers;
+        sectors with fewer than SECTOR_BENCHMARK_MIN_COMPANIES scores fall back to all sectors"""
+        sector = self.benchmark_sector(company_id, industries)
+        distribution = self.distribution(sector)
+        if distribution is None:
+            return None
+        percentile = self.percentile(sector, score)
+        return {
+            **distribution,
+            'governance_score': score,
+            'percentile': percentile,
+            'percentile_ranking': f"Top {max(1, round(100 - percentile))}% of {distribution['companies']} {sector} companies (governance score)",
+            'source': 'governance_dataset'
+        }
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'sectors': len(self.scores) - (ALL_SECTORS in self.scores),
+                'companies': len(self.scores.get(ALL_SECTORS, ())),
+                'assessed_companies': len(self.assessed)
+            }
+
+shared_sector_benchmarks = None
+sector_benchmarks_lock = threading.Lock()
+
+def get_sector_benchmarks():
+    """Shared sector benchmark index, built on first use from the governance dataset"""
+    global shared_sector_benchmarks
+    if shared_sector_benchmarks is None:
+        governance_manager = get_governance_manager()
+        with sector_benchmarks_lock:
+            if shared_sector_benchmarks is None:
+                shared_sector_benchmarks = SectorBenchmarkIndex(governance_manager)
+    return shared_sector_benchmarks
+
+# NEW: Local peer-company finder over dataset and assessed companies (no network calls)
+PEER_FEATURE_WEIGHTS = {'sector': 1.0, 'headquarters': 0.5, 'score': 0.5}
+PEER_SCORE_BAND_WIDTH = 7  # Governance score bands of 7 points over 0-35
+
+class PeerFinder:
+    def __init__(self, governance_manager):
+        """Companies as sparse feature vectors (sectors, headquarters, governance score band),
+        L2-normalised and stored as an inverted index so cosine similarity for a batch of queries
+        is one weighted bincount over the postings of the query features"""
+        import numpy as np
+        self.lock = threading.Lock()
+        self.feature_ids = {}
+        self.company_ids = []      # row -> company_id
+        self.details = []          # row -> {'name', 'sectors', 'headquarters', 'governance_score', 'source'}
+        self.rows = {}             # company_id -> row
+        self.assessed_features = {}  # row -> [(feature_id, value)] for assessed companies
+        self.assessed_postings = defaultdict(dict)  # feature_id -> {row: value}, updated in place
+        self.assessed_arrays = {}    # feature_id -> (rows, values) of assessed_postings, rebuilt per touched feature
+        
+        coo_rows, coo_features, coo_values = [], [], []
+        if governance_manager.is_available():
+            df = governance_manager.governance_df
+            columns = [df[column].to_numpy() for column in ('Company_Name', 'Sectors', 'Headquarters', 'Total_Dataset_Score')]
+            for company_id, position in governance_manager.company_index.items():
+                name, sectors, headquarters, score = (column[position] for column in columns)
+                details = {
+                    'name': name,
+                    'sectors': split_sectors(sectors),
+                    'headquarters': ISO2_COUNTRY_NAMES.get(headquarters, headquarters) if isinstance(headquarters, str) else None,
+                    'governance_score': float(score) if score == score else None,
+                    'source': 'governance_dataset'
+                }
+                row = self.add_row(company_id, details)
+                for feature_id, value in self.vectorize(details['sectors'], details['headquarters'], details['governance_score']):
+                    coo_rows.append(row)
+                    coo_features.append(feature_id)
+                    coo_values.append(value)
+        self.base_coo = (np.array(coo_rows, dtype=np.int64), np.array(coo_features, dtype=np.int64),
+                         np.array(coo_values, dtype=np.float32))
+        self.build_postings()
+
+    def add_row(self, company_id, details):
+        row = len(self.company_ids)
+        self.company_ids.append(company_id)
+        self.details.append(details)
+        self.rows[company_id] = row
+        return row
+
+    def feature_id(self, feature, add=True):
+        """Feature's id; with add=False unseen features are None instead of being registered"""
+        if not add:
+            return self.feature_ids.get(feature)
+        return self.feature_ids.setdefault(feature, len(self.feature_ids))
+
+    def vectorize(self, sectors, headquarters, governance_score, add_features=True):
+        """[(feature_id, value)] of one company's unit-length feature vector.
+
+        Queries pass add_features=False: features no company has still count towards the norm
+        (so similarities stay true cosines) but are dropped rather than registered.
+        """
+        blocks = []
+        if sectors:
+            weight = PEER_FEATURE_WEIGHTS['sector'] / len(sectors) ** 0.5
+            blocks += [(self.feature_id(('sector', sector), add_features), weight) for sector in sectors]
+        if headquarters:
+            blocks.append((self.feature_id(('headquarters', str(headquarters).lower()), add_features), PEER_FEATURE_WEIGHTS['headquarters']))
+        if governance_score is not None:
+            band = min(int(governance_score // PEER_SCORE_BAND_WIDTH), 35 // PEER_SCORE_BAND_WIDTH - 1)
+            blocks.append((self.feature_id(('score', band), add_features), PEER_FEATURE_WEIGHTS['score']))
+        norm = sum(value * value for _, value in blocks) ** 0.5
+        return [(feature_id, value / norm) for feature_id, value in blocks if feature_id is not None] if norm else []
+
+    def build_postings(self):
+        """Sort the dataset's (row, feature, value) entries by feature; offsets[f]:offsets[f + 1] are f's postings"""
+        import numpy as np
+        rows, features, values = self.base_coo
+        order = np.argsort(features, kind='stable')
+        self.posting_rows = rows[order]
+        self.posting_values = values[order]
+        self.posting_offsets = np.searchsorted(features[order], np.arange(len(self.feature_ids) + 1))
+
+    def feature_postings(self, feature_id):
+        """(rows, values) of every company with the feature: dataset postings plus assessed ones"""
+        import numpy as np
+        parts = []
+        if feature_id + 1 < len(self.posting_offsets):
+            start, end = self.posting_offsets[feature_id], self.posting_offsets[feature_id + 1]
+            parts.append((self.posting_rows[start:end], self.posting_values[start:end]))
+        if self.assessed_postings.get(feature_id):
+            if feature_id not in self.assessed_arrays:
+                postings = self.assessed_postings[feature_id]
+                self.assessed_arrays[feature_id] = (np.fromiter(postings.keys(), dtype=np.int64, count=len(postings)),
+                                                    np.fromiter(postings.values(), dtype=np.float32, count=len(postings)))
+            parts.append(self.assessed_arrays[feature_id])
+        return parts
+
+    def add_assessed(self, company_id, name, sectors, headquarters, governance_score):
+        """Add or update an assessed company that is not in the dataset; only its features' postings change"""
+        with self.lock:
+            row = self.rows.get(company_id)
+            if row is not None and row not in self.assessed_features:
+                return  # Dataset companies keep their dataset features
+            details = {'name': name, 'sectors': list(sectors), 'headquarters': headquarters,
+                       'governance_score': governance_score, 'source': 'assessed'}
+            if row is None:
+                row = self.add_row(company_id, details)
+            else:
+                self.details[row] = details
+            for feature_id, _ in self.assessed_features.get(row, ()):
+                self.assessed_postings[feature_id].pop(row, None)
+                self.assessed_arrays.pop(feature_id, None)
+            vector = self.vectorize(sectors, headquarters, governance_score)
+            for feature_id, value in vector:
+                self.assessed_postings[feature_id][row] = value
+                self.assessed_arrays.pop(feature_id, None)
+            self.assessed_features[row] = vector
+
+    def find_peers_batch(self, queries, k=10):
+        """Top-k peers for each query, by cosine similarity over all companies at once.
+
+        Each query is {'company_id'} for an indexed company, or {'sectors', 'headquarters',
+        'governance_score'} describing one that is not indexed.
+        """
+        import numpy as np
+        with self.lock:
+            row_count = len(self.company_ids)
+            index_parts, weight_parts, own_rows = [], [], []
+            for query_number, query in enumerate(queries):
+                row = self.rows.get(query.get('company_id'))
+                own_rows.append(row)
+                if row is not None:
+                    vector = self.assessed_features.get(row) or self.vectorize(
+                        self.details[row]['sectors'], self.details[row]['headquarters'], self.details[row]['governance_score'],
+                        add_features=False)
+                else:
+                    vector = self.vectorize(query.get('sectors') or [], query.get('headquarters'), query.get('governance_score'),
+                                            add_features=False)
+                for feature_id, value in vector:
+                    for posting_rows, posting_values in self.feature_postings(feature_id):
+                        index_parts.append(posting_rows + query_number * row_count)
+                        weight_parts.append(posting_values * value)
+        
+        if not queries or row_count == 0:
+            return [[] for _ in queries]
+        if index_parts:
+            similarities = np.bincount(np.concatenate(index_parts), weights=np.concatenate(weight_parts),
+                                       minlength=len(queries) * row_count).reshape(len(queries), row_count)
+        else:
+            similarities = np.zeros((len(queries), row_count))
+        for query_number, row in enumerate(own_rows):
+            if row is not None:
+                similarities[query_number, row] = -1.0  # Never a peer of itself
+        
+        k = min(k, row_count)
+        candidates = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        results = []
+        for query_number in range(len(queries)):
+            top = candidates[query_number][np.argsort(-similarities[query_number, candidates[query_number]], kind='stable')]
+            results.append([
+                {'company_id': self.company_ids[row], 'similarity': round(float(similarities[query_number, row]), 3), **self.details[row]}
+                for row in top if similarities[query_number, row] > 0
+            ])
+        return results
+
+    def find_peers(self, k=10, **query):
+        return self.find_peers_batch([query], k)[0]
+
+    def snapshot(self):
+        with self.lock:
+            return {'companies': len(self.company_ids), 'assessed_companies': len(self.assessed_features),
+                    'features': len(self.feature_ids)}
+
+shared_peer_finder = None
+peer_finder_lock = threading.Lock()
+
+def get_peer_finder():
+    """Shared peer finder, built on first use from the governance dataset"""
+    global shared_peer_finder
+    if shared_peer_finder is None:
+        governance_manager = get_governance_manager()
+        with peer_finder_lock:
+            if shared_peer_finder is None:
+                shared_peer_finder = PeerFinder(governance_manager)
+    return shared_peer_finder
+
+# NEW: Precomputed industry x country inherent-risk matrix for lookups, heatmaps and bulk screening
+HQ_RISK_WEIGHT = 0.6          # Headquarters vs average operating-country risk
+OPERATIONS_RISK_WEIGHT = 1 - HQ_RISK_WEIGHT
+DEFAULT_COUNTRY_RISK = 50     # Countries missing from the index
+NEUTRAL_INDUSTRY_RISK = 50    # calculate_industry_risk only counts matches above this
+
+class RiskMatrix:
+    def __init__(self, country_index, industry_index):
+        """Inherent risk = (geographic + industry) / 2 as arrays over the canonical index entries"""
+        import numpy as np
+        self.countries = list(country_index)
+        self.industries = list(industry_index)
+        # Scoring matches countries exactly, like COUNTRY_RISK_INDEX.get in calculate_geographic_risk;
+        # only slice() lookups from the API ignore case
+        self.country_positions = {country: i for i, country in enumerate(self.countries)}
+        self.country_lookup = {country.lower(): i for i, country in enumerate(self.countries)}
+        self.industry_positions = {industry.lower(): i for i, industry in enumerate(self.industries)}
+        # Trailing entry stands for any country/industry not in the index
+        self.country_scores = np.array([country_index[c] for c in self.countries] + [DEFAULT_COUNTRY_RISK], dtype=np.float64)
+        self.industry_scores = np.maximum(
+            np.array([industry_index[i] for i in self.industries] + [NEUTRAL_INDUSTRY_RISK], dtype=np.float64),
+            NEUTRAL_INDUSTRY_RISK
+        )
+        # Companies headquartered and operating in one country: rows are industries, columns countries
+        self.matrix = (self.industry_scores[:-1, None] + self.country_scores[None, :-1]) / 2
+
+    def country_position(self, country):
+        return self.country_positions.get(country, len(self.countries)) if country else len(self.countries)
+
+    def industry_position(self, industry):
+        return self.industry_positions.get(str(industry).lower())
+
+    def slice(self, industry=None, country=None):
+        """One cell, a row (industry across countries) or a column (country across industries)"""
+        import numpy as np
+        row = self.industry_position(industry) if industry else None
+        column = self.country_lookup.get(str(country).lower()) if country else None
+        if industry and row is None:
+            raise KeyError(industry)
+        if country and column is None:
+            raise KeyError(country)
+        if row is not None and column is not None:
+            return {'industry': self.industries[row], 'country': self.countries[column],
+                    'inherent_risk_score': round(float(self.matrix[row, column]), 1)}
+        if row is not None:
+            return {'industry': self.industries[row], 'scores': dict(zip(self.countries, np.round(self.matrix[row], 1).tolist()))}
+        return {'country': self.countries[column], 'scores': dict(zip(self.industries, np.round(self.matrix[:, column], 1).tolist()))}
+
+    def screen(self, companies, arrays=False):
+        """Vectorized inherent risk for many companies.
+
+        Each company is {'headquarters', 'operating_countries', 'industries'} using index names,
+        plus an optional 'industry_floor'; weighting and defaults follow calculate_geographic_risk
+        and calculate_industry_risk. arrays=True returns the (geographic, industry) score arrays.
+        """
+        import numpy as np
+        count = len(companies)
+        industry_mask = np.zeros((count, len(self.industries)), dtype=bool)
+        # Scores that do not come from the index (business model keywords, apparel minimum)
+        industry_floor = np.array([company.get('industry_floor') or NEUTRAL_INDUSTRY_RISK for company in companies], dtype=np.float64)
+        unmatched_industries = []
+        
+        for row, company in enumerate(companies):
+            for industry in company.get('industries') or []:
+                position = self.industry_position(industry)
+                if position is None:
+                    unmatched_industries.append(industry)
+                else:
+                    industry_mask[row, position] = True
+        
+        geographic = geographic_scores(*self.geographic_inputs(companies))
+        industry = np.where(industry_mask, self.industry_scores[None, :-1], NEUTRAL_INDUSTRY_RISK).max(axis=1, initial=NEUTRAL_INDUSTRY_RISK)
+        industry = np.maximum(industry, industry_floor)
+        inherent = (geographic + industry) / 2
+        if arrays:
+            return geographic, industry
+        
+        return [
+            {
+                **({'name': company['name']} if company.get('name') else {}),
+                'geographic_risk_score': float(geographic[row]),
+                'industry_risk_score': float(industry[row]),
+                'inherent_risk_score': round(float(inherent[row]), 1),
+                'inherent_risk_level': risk_score_level(inherent[row])
+            }
+            for row, company in enumerate(companies)
+        ], sorted(set(unmatched_industries))
+
+    def geographic_inputs(self, companies):
+        """(HQ risk, average operating-country risk, operating country count, has HQ) arrays"""
+        import numpy as np
+        count = len(companies)
+        hq_positions = np.full(count, len(self.countries))
+        has_hq = np.zeros(count, dtype=bool)
+        operations = np.zeros((count, len(self.country_scores)))
+        for row, company in enumerate(companies):
+            headquarters = company.get('headquarters')
+            has_hq[row] = bool(headquarters)
+            hq_positions[row] = self.country_position(headquarters)
+            for country in company.get('operating_countries') or []:
+                if country != headquarters:  # HQ is not double counted as an operating country
+                    operations[row, self.country_position(country)] += 1
+        
+        operation_counts = operations.sum(axis=1)
+        average_operations = (operations @ self.country_scores) / np.maximum(operation_counts, 1)
+        return self.country_scores[hq_positions], average_operations, operation_counts, has_hq
+
+    def snapshot(self):
+        import numpy as np
+        return {
+            'industries': self.industries,
+            'countries': self.countries,
+            'matrix': np.round(self.matrix, 1).tolist(),
+            'weights': {'headquarters': HQ_RISK_WEIGHT, 'operations': OPERATIONS_RISK_WEIGHT}
+        }
+
+def geographic_scores(hq_risk, average_operations, operation_counts, has_hq, hq_weight=None):
+    """calculate_geographic_risk over arrays from RiskMatrix.geographic_inputs"""
+    import numpy as np
+    hq_weight = HQ_RISK_WEIGHT if hq_weight is None else hq_weight
+    geographic = np.where(operation_counts > 0,
+                          np.floor(hq_weight * hq_risk + (1 - hq_weight) * average_operations),
+                          hq_risk)
+    # No geographic data at all scores the neutral 50, as in calculate_geographic_risk
+    return np.where(~has_hq & (operation_counts == 0), DEFAULT_COUNTRY_RISK, geographic)
+
+def risk_score_level(score):
+    """Inherent risk level with the NEW thresholds (very-low < 20 <= low < 35 <= medium < 55 <= high < 75)"""
+    if score >= 75:
+        return "very-high"
+    elif score >= 55:
+        return "high"
+    elif score >= 35:
+        return "medium"
+    elif score >= 20:
+        return "low"
+    return "very-low"
+
+shared_risk_matrix = None
+
+def get_risk_matrix():
+    global shared_risk_matrix
+    get_risk_indexes()  # Apply the active index version before building
+    risk_matrix = shared_risk_matrix
+    if risk_matrix is None:
+        risk_matrix = shared_risk_matrix = RiskMatrix(COUNTRY_RISK_INDEX, INDUSTRY_RISK_INDEX)
+    return risk_matrix
+
+# NEW: Hybrid scoring constants, shared by calculate_hybrid_risk_assessment and batch re-scoring
+HYBRID_SCORING_PARAMS = {
+    'hq_weight': HQ_RISK_WEIGHT,
+    # Points per mitigation component; they add up to the maximum mitigation score of 100
+    'component_max_scores': {'governance': 35, 'due_diligence': 30, 'supply_chain_mapping': 20, 'worker_protection': 15},
+    'history_modifier': None,      # None uses each company's own modifier, a number overrides it
+    'max_risk_reduction': 0.5,
+    'final_score_bounds': (5, 95),
+    'risk_level_thresholds': ((75, "Very High"), (55, "High"), (35, "Medium"), (20, "Low")),
+    'grade_thresholds': ((0.4, 'A'), (0.3, 'B'), (0.2, 'C'), (0.1, 'D'))
+}
+
+def threshold_label(value, thresholds, default):
+    """First label whose (descending) threshold value reaches"""
+    for threshold, label in thresholds:
+        if value >= threshold:
+            return label
+    return default
+
+def round_scores(values, digits=1):
+    """np.round, except that values on a midpoint after scaling are rounded like Python's round.
+
+    np.round scales first, so 19.95 (stored just below it) becomes 199.5 and rounds to 20.0,
+    while round(19.95, 1) uses the exact value and gives 19.9, as a fresh assessment does.
+    """
+    import numpy as np
+    rounded = np.round(values, digits)
+    scaled = np.asarray(values) * 10 ** digits
+    midpoints = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    if len(midpoints):
+        rounded[midpoints] = [round(float(values[i]), digits) for i in midpoints]
+    return rounded
+
+def score_hybrid_batch(geographic, industry, governance, due_diligence, supply_chain_mapping,
+                       worker_protection, history_modifier, params=None):
+    """calculate_hybrid_risk_assessment's scoring as array math over saved component scores"""
+    import numpy as np
+    params = params or HYBRID_SCORING_PARAMS
+    # Components are saved on the default point split; rescale them to the one in params
+    default_max, component_max = HYBRID_SCORING_PARAMS['component_max_scores'], params['component_max_scores']
+    mitigation = sum(
+        scores * (component_max[component] / default_max[component])
+        for component, scores in (('governance', governance), ('due_diligence', due_diligence),
+                                  ('supply_chain_mapping', supply_chain_mapping), ('worker_protection', worker_protection))
+    )
+    if params['history_modifier'] is not None:
+        history_modifier = params['history_modifier']
+    mitigation = mitigation * history_modifier
+    max_mitigation_score = sum(component_max.values())
+    reduction = np.minimum(mitigation / max_mitigation_score * params['max_risk_reduction'],
+                           params['max_risk_reduction'])
+    inherent = (geographic + industry) / 2
+    final = np.clip(inherent * (1 - reduction), *params['final_score_bounds'])
+    
+    def labels(values, thresholds, default):
+        return np.select([values >= threshold for threshold, _ in thresholds],
+                         [label for _, label in thresholds], default)
+    
+    return {
+        'inherent_risk_score': round_scores(inherent),
+        'risk_reduction_factor': reduction,
+        'final_risk_score': round_scores(final),
+        'final_risk_level': labels(final, params['risk_level_thresholds'], "Very Low"),
+        'mitigation_grade': labels(reduction, params['grade_thresholds'], 'F')
+    }
+
+# NEW: Versioned country/industry risk indexes; stored assessments are re-scored when they change
+BUILTIN_RISK_INDEXES = {'country': dict(COUNTRY_RISK_INDEX), 'industry': dict(INDUSTRY_RISK_INDEX)}
+RESCORE_BATCH_SIZE = int(os.getenv("RESCORE_BATCH_SIZE", "5000"))
+
+def risk_index_hash(indexes):
+    return hashlib.sha1(json.dumps(indexes, sort_keys=True).encode('utf-8')).hexdigest()
+
+def industry_risk_inputs(industries, business_model):
+    """(matched INDUSTRY_RISK_INDEX names, floor score) - what calculate_industry_risk needs to be
+    recomputed with different index scores"""
+    if not industries:
+        return [], NEUTRAL_INDUSTRY_RISK
+    matches = sorted({match for industry in industries for match in industry_risk_matches(industry)})
+    floor = max([NEUTRAL_INDUSTRY_RISK] + [score for _, score in business_model_risk_keywords(business_model)] +
+                [ATHLETIC_APPAREL_MIN_RISK for industry in industries if is_athletic_apparel_industry(industry)])
+    return matches, floor
+
+class RiskIndexRegistry:
+    def __init__(self, db_path=None):
+        """Risk index versions in the risk_index_versions table; the newest one is active.
+
+        A release whose built-in indexes differ from the last recorded release adds a version,
+        and admins can publish adjusted indexes on top of the active one.
+        """
+        self.db_path = db_path or assessments_db_path()
+        self.lock = threading.Lock()
+        self.active_version = None
+        self.active = {'version': None, 'source': 'builtin', 'note': None, 'created_at': None,
+                       'content_hash': risk_index_hash(BUILTIN_RISK_INDEXES)}
+        self.industry_names = {}  # version -> industry names, to know when labels must be re-matched
+        self.load()
+
+    def connect(self):
+        connection = sqlite3.connect(self.db_path, timeout=5)
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS risk_index_versions (
+                version INTEGER PRIMARY KEY AUTOINCREMENT,
+                content_hash TEXT NOT NULL,
+                source TEXT,
+                note TEXT,
+                created_at TEXT,
+                country_index TEXT,
+                industry_index TEXT
+            )
+        """)
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS assessment_scoring_inputs (
+                assessment_id TEXT PRIMARY KEY,
+                company_id TEXT,
+                company_name TEXT,
+                assessed_at TEXT,
+                headquarters TEXT,
+                operating_countries TEXT,
+                industries TEXT,
+                business_model TEXT,
+                industry_matches TEXT,
+                industry_floor REAL,
+                governance_score REAL,
+                due_diligence_score REAL,
+                supply_chain_mapping_score REAL,
+                worker_protection_score REAL,
+                history_modifier REAL,
+                risk_index_version INTEGER,
+                geographic_risk_score REAL,
+                industry_risk_score REAL,
+                inherent_risk_score REAL,
+                final_risk_score REAL,
+                final_risk_level TEXT,
+                mitigation_grade TEXT,
+                rescored_at TEXT
+            )
+        """)
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scoring_inputs_version ON assessment_scoring_inputs (risk_index_version)"
+        )
+        return connection
+
+    def load(self):
+        builtin_hash = risk_index_hash(BUILTIN_RISK_INDEXES)
+        try:
+            with self.connect() as connection:
+                last_release = connection.execute(
+                    "SELECT content_hash FROM risk_index_versions WHERE source = 'release' ORDER BY version DESC LIMIT 1"
+                ).fetchone()
+                if last_release is None or last_release[0] != builtin_hash:
+                    self.insert(connection, BUILTIN_RISK_INDEXES, 'release', 'Built-in indexes of this release')
+                row = connection.execute(
+                    "SELECT version, source, note, created_at, content_hash, country_index, industry_index "
+                    "FROM risk_index_versions ORDER BY version DESC LIMIT 1"
+                ).fetchone()
+            self.apply(row)
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not load risk index versions, using built-in indexes: {e}")
+
+    def insert(self, connection, indexes, source, note):
+        connection.execute(
+            "INSERT INTO risk_index_versions (content_hash, source, note, created_at, country_index, industry_index) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (risk_index_hash(indexes), source, note, datetime.now().isoformat(timespec='seconds'),
+             json.dumps(indexes['country']), json.dumps(indexes['industry']))
+        )
+
+    def apply(self, row):
+        """Make a version the live index for all scoring"""
+        global shared_risk_matrix, COUNTRY_RISK_INDEX, INDUSTRY_RISK_INDEX
+        version, source, note, created_at, content_hash, country_index, industry_index = row
+        industry_index = json.loads(industry_index)
+        with self.lock:
+            # Rebound rather than mutated, so scoring already iterating the old dicts is unaffected
+            COUNTRY_RISK_INDEX = json.loads(country_index)
+            INDUSTRY_RISK_INDEX = industry_index
+            self.active_version = version
+            self.active = {'version': version, 'source': source, 'note': note, 'created_at': created_at,
+                           'content_hash': content_hash}
+            self.industry_names[version] = frozenset(industry_index)
+            shared_risk_matrix = None
+        print(f"✅ Risk index version {version} active ({source})")
+
+    def publish(self, country_updates, industry_updates, note=None):
+        """Add a version with the given scores changed (None removes an entry) and make it active"""
+        indexes = {'country': dict(COUNTRY_RISK_INDEX), 'industry': dict(INDUSTRY_RISK_INDEX)}
+        for kind, updates in (('country', country_updates), ('industry', industry_updates)):
+            for name, score in (updates or {}).items():
+                if score is None:
+                    indexes[kind].pop(name, None)
+                elif isinstance(score, (int, float)) and not isinstance(score, bool) and 0 <= score <= 100:
+                    indexes[kind][name] = score
+                else:
+                    raise ValueError(f"{kind} risk for '{name}' must be a number between 0 and 100")
+        
+        with self.connect() as connection:
+            self.insert(connection, indexes, 'admin', note)
+            row = connection.execute(
+                "SELECT version, source, note, created_at, content_hash, country_index, industry_index "
+                "FROM risk_index_versions ORDER BY version DESC LIMIT 1"
+            ).fetchone()
+        self.apply(row)
+        return self.active
+
+    def version_industry_names(self, version):
+        if version not in self.industry_names:
+            with self.connect() as connection:
+                row = connection.execute(
+                    "SELECT industry_index FROM risk_index_versions WHERE version = ?", (version,)
+                ).fetchone()
+            self.industry_names[version] = frozenset(json.loads(row[0])) if row else frozenset()
+        return self.industry_names[version]
+
+    def versions(self):
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT version, source, note, created_at, content_hash, country_index, industry_index "
+                "FROM risk_index_versions ORDER BY version DESC"
+            ).fetchall()
+        return [{'version': version, 'source': source, 'note': note, 'created_at': created_at,
+                 'content_hash': content_hash, 'countries': len(json.loads(country_index)),
+                 'industries': len(json.loads(industry_index))}
+                for version, source, note, created_at, content_hash, country_index, industry_index in rows]
+
+    def version_indexes(self, version):
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT country_index, industry_index FROM risk_index_versions WHERE version = ?", (version,)
+            ).fetchone()
+        return {'country': json.loads(row[0]), 'industry': json.loads(row[1])} if row else None
+
+class AssessmentRescorer:
+    def __init__(self, registry):
+        """Saves each assessment's scoring inputs and re-scores stored assessments in the
+        background, in batches of array math, whenever the active index version changes"""
+        self.registry = registry
+        self.lock = threading.Lock()
+        self.thread = None
+        self.status = {'state': 'idle', 'target_version': None, 'rescored': 0, 'started_at': None,
+                       'seconds': None, 'error': None}
+
+    def record(self, assessment_id, company_id, company_name, profile, hybrid_assessment,
+               geographic_risk_score, industry_risk_score):
+        """Store what calculate_hybrid_risk_assessment needs to be recomputed without any LLM call"""
+        industries = profile.get('all_industries', [])
+        matches, floor = industry_risk_inputs(industries, profile.get('business_model', ''))
+        mitigation = hybrid_assessment['mitigation_assessment']
+        operational = mitigation['operational_assessment']
+        try:
+            with self.registry.connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO assessment_scoring_inputs VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (assessment_id, company_id, company_name, datetime.now().isoformat(timespec='seconds'),
+                     profile.get('headquarters'), json.dumps(profile.get('operating_countries', [])),
+                     json.dumps(industries), profile.get('business_model', ''), json.dumps(matches), floor,
+                     float(mitigation['governance_score']), float(operational['due_diligence_score']),
+                     float(operational['supply_chain_mapping_score']), float(operational['worker_protection_score']),
+                     float(mitigation['history_modifier']), hybrid_assessment['assessment_metadata'].get('risk_index_version'),
+                     float(geographic_risk_score), float(industry_risk_score), float(hybrid_assessment['inherent_risk_score']),
+                     float(hybrid_assessment['final_risk_score']), hybrid_assessment['final_risk_level'],
+                     mitigation['mitigation_grade'], None)
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"⚠️ Could not save scoring inputs: {e}")
+
+    def counts(self):
+        with self.registry.connect() as connection:
+            total, stale = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(risk_index_version IS NOT ?), 0) FROM assessment_scoring_inputs",
+                (self.registry.active_version,)
+            ).fetchone()
+        return {'stored_assessments': total, 'stale_assessments': stale}
+
+    def start(self):
+        """Start a background re-scoring run; False if one is already running"""
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return False
+            self.status = {'state': 'running', 'target_version': self.registry.active_version, 'rescored': 0,
+                           'started_at': datetime.now().isoformat(timespec='seconds'), 'seconds': None, 'error': None}
+            self.thread = threading.Thread(target=self.run, name="assessment-rescorer", daemon=True)
+            self.thread.start()
+            return True
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            while True:
+                rescored = self.rescore_batch()
+                if not rescored:
+                    break
+                self.status['rescored'] += rescored
+            self.status['state'] = 'completed'
+        except Exception as e:
+            print(f"❌ Re-scoring failed: {e}")
+            self.status.update(state='failed', error=str(e))
+        self.status['seconds'] = round(time.perf_counter() - started, 3)
+        print(f"🔁 Re-scored {self.status['rescored']} stored assessments in {self.status['seconds']}s")
+
+    def rescore_batch(self):
+        """Re-score up to RESCORE_BATCH_SIZE assessments not yet on the active version"""
+        import numpy as np
+        target_version = self.registry.active_version
+        risk_matrix = get_risk_matrix()
+        with self.registry.connect() as connection:
+            rows = connection.execute(
+                "SELECT assessment_id, headquarters, operating_countries, industries, business_model, industry_matches, "
+                "industry_floor, governance_score, due_diligence_score, supply_chain_mapping_score, "
+                "worker_protection_score, history_modifier, risk_index_version "
+                "FROM assessment_scoring_inputs WHERE risk_index_version IS NOT ? LIMIT ?",
+                (target_version, RESCORE_BATCH_SIZE)
+            ).fetchall()
+            if not rows:
+                return 0
+            
+            companies = []
+            target_names = self.registry.version_industry_names(target_version)
+            for _, headquarters, countries, industries, business_model, matches, floor, *_, version in rows:
+                if version is None or self.registry.version_industry_names(version) != target_names:
+                    # Index entries were added or removed: match the saved labels again (string work only)
+                    matches, floor = industry_risk_inputs(json.loads(industries), business_model)
+                else:
+                    matches = json.loads(matches)
+                companies.append({'headquarters': headquarters, 'operating_countries': json.loads(countries),
+                                  'industries': matches, 'industry_floor': floor})
+            
+            geographic, industry = risk_matrix.screen(companies, arrays=True)
+            components = np.array([row[7:12] for row in rows], dtype=np.float64)
+            scores = score_hybrid_batch(geographic, industry, *components.T)
+            rescored_at = datetime.now().isoformat(timespec='seconds')
+            connection.executemany(
+                "UPDATE assessment_scoring_inputs SET industry_matches = ?, industry_floor = ?, risk_index_version = ?, "
+                "geographic_risk_score = ?, industry_risk_score = ?, inherent_risk_score = ?, final_risk_score = ?, "
+                "final_risk_level = ?, mitigation_grade = ?, rescored_at = ? WHERE assessment_id = ?",
+                [(json.dumps(company['industries']), company['industry_floor'], target_version,
+                  float(geographic[i]), float(industry[i]), float(scores['inherent_risk_score'][i]),
+                  float(scores['final_risk_score'][i]), str(scores['final_risk_level'][i]),
+                  str(scores['mitigation_grade'][i]), rescored_at, rows[i][0])
+                 for i, company in enumerate(companies)]
+            )
+        return len(rows)
+
+# NEW: What-if re-scoring of the stored portfolio under alternative hybrid scoring parameters
+RISK_LEVEL_ORDER = ["Very Low", "Low", "Medium", "High", "Very High"]
+SCENARIO_MAX_CHANGES = int(os.getenv("SCENARIO_MAX_CHANGES", "200"))
+
+def scenario_params(overrides):
+    """HYBRID_SCORING_PARAMS with overrides applied; raises ValueError for invalid values"""
+    params = copy.deepcopy(HYBRID_SCORING_PARAMS)
+    overrides = overrides or {}
+    if not isinstance(overrides, dict):
+        raise ValueError("params must be an object of scoring parameters")
+    for key in ('component_max_scores', 'risk_level_thresholds', 'grade_thresholds'):
+        if overrides.get(key) is not None and not isinstance(overrides[key], dict):
+            raise ValueError(f"{key} must be an object of label: value pairs")
+    unknown = set(overrides) - set(params)
+    if unknown:
+        raise ValueError(f"Unknown scoring parameters: {', '.join(sorted(unknown))}")
+    
+    def number(name, value, low, high):
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or not low <= value <= high:
+            raise ValueError(f"{name} must be a number between {low} and {high}")
+        return value
+    
+    if 'hq_weight' in overrides:
+        params['hq_weight'] = number('hq_weight', overrides['hq_weight'], 0, 1)
+    if 'max_risk_reduction' in overrides:
+        params['max_risk_reduction'] = number('max_risk_reduction', overrides['max_risk_reduction'], 0, 1)
+    if overrides.get('history_modifier') is not None:
+        params['history_modifier'] = number('history_modifier', overrides['history_modifier'], 0, 5)
+    if 'final_score_bounds' in overrides:
+        bounds = overrides['final_score_bounds']
+        if not isinstance(bounds, (list, tuple)) or len(bounds) != 2:
+            raise ValueError("final_score_bounds must be [low, high]")
+        low, high = (number('final_score_bounds', bound, 0, 100) for bound in bounds)
+        if low >= high:
+            raise ValueError("final_score_bounds low must be below high")
+        params['final_score_bounds'] = (low, high)
+    for component, points in (overrides.get('component_max_scores') or {}).items():
+        if component not in params['component_max_scores']:
+            raise ValueError(f"Unknown mitigation component '{component}'")
+        params['component_max_scores'][component] = number(component, points, 0, 100)
+    if sum(params['component_max_scores'].values()) <= 0:
+        raise ValueError("component_max_scores must not all be zero")
+    
+    for key in ('risk_level_thresholds', 'grade_thresholds'):
+        thresholds = {label: threshold for threshold, label in params[key]}
+        for label, threshold in (overrides.get(key) or {}).items():
+            if label not in thresholds:
+                raise ValueError(f"Unknown {key} label '{label}'")
+            thresholds[label] = number(key, threshold, 0, 100)
+        values = list(thresholds.values())
+        if values != sorted(values, reverse=True):
+            raise ValueError(f"{key} must decrease in the order {', '.join(thresholds)}")
+        params[key] = tuple((threshold, label) for label, threshold in thresholds.items())
+    return params
+
+class ScenarioPortfolio:
+    def __init__(self, registry):
+        """Latest stored assessment per company as arrays, reloaded only when the stored data changes"""
+        self.registry = registry
+        self.lock = threading.Lock()
+        self.cache_key = None
+        self.arrays = None
+
+    def load(self):
+        import numpy as np
+        with self.registry.connect() as connection:
+            cache_key = (self.registry.active_version,) + connection.execute(
+                "SELECT COUNT(*), MAX(rowid), MAX(rescored_at) FROM assessment_scoring_inputs"
+            ).fetchone()
+            with self.lock:
+                if cache_key == self.cache_key:
+                    return self.arrays
+            rows = connection.execute(
+                "SELECT company_id, company_name, headquarters, operating_countries, industry_matches, industry_floor, "
+                "governance_score, due_diligence_score, supply_chain_mapping_score, worker_protection_score, history_modifier "
+                "FROM assessment_scoring_inputs WHERE rowid IN "
+                "(SELECT MAX(rowid) FROM assessment_scoring_inputs GROUP BY company_id)"
+            ).fetchall()
+        
+        companies = [{'headquarters': headquarters, 'operating_countries': json.loads(countries),
+                      'industries': json.loads(matches), 'industry_floor': floor}
+                     for _, _, headquarters, countries, matches, floor, *_ in rows]
+        risk_matrix = get_risk_matrix()
+        arrays = {
+            'company_ids': np.array([row[0] for row in rows], dtype=object),
+            'company_names': [row[1] for row in rows],
+            'geographic_inputs': risk_matrix.geographic_inputs(companies),
+            'industry': risk_matrix.screen(companies, arrays=True)[1] if rows else np.zeros(0),
+            'components': np.array([row[6:11] for row in rows], dtype=np.float64).reshape(len(rows), 5)
+        }
+        with self.lock:
+            self.cache_key, self.arrays = cache_key, arrays
+        return arrays
+
+    def run(self, params, company_ids=None, max_changes=SCENARIO_MAX_CHANGES):
+        """Baseline vs scenario score distributions and the companies whose risk level changes"""
+        import numpy as np
+        started = time.perf_counter()
+        arrays = self.load()
+        selected = np.isin(arrays['company_ids'], list(company_ids)) if company_ids else np.ones(len(arrays['company_ids']), dtype=bool)
+        
+        geographic_inputs = [values[selected] for values in arrays['geographic_inputs']]
+        industry, components = arrays['industry'][selected], arrays['components'][selected].T
+        baseline = score_hybrid_batch(geographic_scores(*geographic_inputs), industry, *components)
+        scenario = score_hybrid_batch(geographic_scores(*geographic_inputs, hq_weight=params['hq_weight']),
+                                      industry, *components, params=params)
+        
+        def level_ranks(levels):
+            labels, inverse = np.unique(levels, return_inverse=True)
+            return np.array([RISK_LEVEL_ORDER.index(label) for label in labels], dtype=np.int64)[inverse]
+        
+        def summary(scores):
+            final = scores['final_risk_score']
+            levels, level_counts = np.unique(scores['final_risk_level'], return_counts=True)
+            grades, grade_counts = np.unique(scores['mitigation_grade'], return_counts=True)
+            return {
+                'mean_score': round(float(final.mean()), 2) if len(final) else None,
+                'median_score': round(float(np.median(final)), 2) if len(final) else None,
+                'p10_score': round(float(np.percentile(final, 10)), 2) if len(final) else None,
+                'p90_score': round(float(np.percentile(final, 90)), 2) if len(final) else None,
+                'level_counts': dict(zip(levels.tolist(), level_counts.tolist())),
+                'grade_counts': dict(zip(grades.tolist(), grade_counts.tolist()))
+            }
+        
+        delta = scenario['final_risk_score'] - baseline['final_risk_score']
+        changed = np.flatnonzero(baseline['final_risk_level'] != scenario['final_risk_level'])
+        transitions = defaultdict(dict)
+        if len(changed):
+            pairs, counts = np.unique(np.stack([baseline['final_risk_level'][changed], scenario['final_risk_level'][changed]]),
+                                      axis=1, return_counts=True)
+            for (from_level, to_level), count in zip(pairs.T.tolist(), counts.tolist()):
+                transitions[from_level][to_level] = count
+        
+        company_ids_selected = arrays['company_ids'][selected]
+        names_selected = [name for name, keep in zip(arrays['company_names'], selected) if keep]
+        largest = changed[np.argsort(-np.abs(delta[changed]), kind='stable')][:max_changes]
+        return {
+            'companies': int(selected.sum()),
+            'params': params,
+            'baseline': summary(baseline),
+            'scenario': summary(scenario),
+            'mean_shift': round(float(delta.mean()), 2) if len(delta) else None,
+            'level_changes': {
+                'total': len(changed),
+                'up': int((level_ranks(scenario['final_risk_level'][changed]) > level_ranks(baseline['final_risk_level'][changed])).sum()),
+                'transitions': transitions
+            },
+            'changed_companies': [
+                {
+                    'company_id': company_ids_selected[i],
+                    'company_name': names_selected[i],
+                    'baseline_score': float(baseline['final_risk_score'][i]),
+                    'scenario_score': float(scenario['final_risk_score'][i]),
+                    'baseline_level': str(baseline['final_risk_level'][i]),
+                    'scenario_level': str(scenario['final_risk_level'][i]),
+                    'delta': round(float(delta[i]), 1)
+                }
+                for i in largest
+            ],
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+
+# NEW: Durable per-company assessment history in the assessments table
+ASSESSMENT_HISTORY_COLUMNS = {
+    'assessment_id': 'TEXT',
+    'company_id': 'TEXT',
+    'assessment_tier': 'TEXT',
+    'final_risk_score': 'REAL',
+    'geographic_risk_score': 'REAL',
+    'industry_risk_score': 'REAL',
+    'inherent_risk_score': 'REAL',
+    'governance_score': 'REAL',
+    'operational_score': 'REAL',
+    'mitigation_grade': 'TEXT',
+    'risk_index_version': 'INTEGER',
+    'full_results_gz': 'BLOB'
+}
+HISTORY_COMPONENTS = ('final_risk_score', 'geographic_risk_score', 'industry_risk_score', 'inherent_risk_score',
+                      'governance_score', 'operational_score')
+HISTORY_MAX_POINTS = int(os.getenv("HISTORY_MAX_POINTS", "500"))
+
+class AssessmentHistory:
+    def __init__(self, db_path=None):
+        """One row per completed assessment: compact component scores for trend queries and
+        the full result as gzip-compressed JSON (legacy rows keep their plain full_results)"""
+        self.db_path = db_path or assessments_db_path()
+        self.migrate()
+
+    def connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def migrate(self):
+        with self.connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS assessments (
+                    id INTEGER PRIMARY KEY,
+                    company_name TEXT,
+                    assessment_date TEXT,
+                    risk_score INTEGER,
+                    risk_level TEXT,
+                    countries TEXT,
+                    industries TEXT,
+                    data_sources TEXT,
+                    full_results TEXT
+                )
+            """)
+            existing = {row[1] for row in connection.execute("PRAGMA table_info(assessments)")}
+            for column, column_type in ASSESSMENT_HISTORY_COLUMNS.items():
+                if column not in existing:
+                    connection.execute(f"ALTER TABLE assessments ADD COLUMN {column} {column_type}")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_assessments_company_date ON assessments (company_id, assessment_date)"
+            )
+            connection.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_assessments_assessment_id ON assessments (assessment_id)"
+            )
+            
+            # Rows written before company ids existed: resolve their names once
+            legacy = connection.execute(
+                "SELECT id, company_name, risk_score FROM assessments WHERE company_id IS NULL "
+                "AND TRIM(COALESCE(company_name, '')) != ''"
+            ).fetchall()
+            if legacy:
+                resolver = get_company_resolver()
+                connection.executemany(
+                    "UPDATE assessments SET company_id = ?, final_risk_score = COALESCE(final_risk_score, ?) WHERE id = ?",
+                    [(resolver.resolve(name)['company_id'], risk_score, row_id) for row_id, name, risk_score in legacy]
+                )
+                print(f"✅ Linked {len(legacy)} earlier assessments to company ids")
+
+    def record(self, assessment, hybrid_assessment, tier):
+        mitigation = hybrid_assessment['mitigation_assessment']
+        operational = mitigation['operational_assessment']
+        full_results = json.dumps(assessment, separators=(',', ':'), default=str).encode('utf-8')
+        try:
+            with self.connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO assessments (company_name, assessment_date, risk_score, risk_level, countries, "
+                    "industries, data_sources, assessment_id, company_id, assessment_tier, final_risk_score, "
+                    "geographic_risk_score, industry_risk_score, inherent_risk_score, governance_score, operational_score, "
+                    "mitigation_grade, risk_index_version, full_results_gz) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (assessment['company_name'], assessment['assessment_date'], int(round(hybrid_assessment['final_risk_score'])),
+                     hybrid_assessment['final_risk_level'], json.dumps(assessment['geographic_risk']['operating_countries']),
+                     json.dumps(assessment['industry_risk']['industries']), json.dumps(assessment['data_sources'], default=str),
+                     assessment['assessment_id'], assessment['company_id'], tier,
+                     float(hybrid_assessment['final_risk_score']), float(assessment['geographic_risk']['score']),
+                     float(assessment['industry_risk']['score']), float(hybrid_assessment['inherent_risk_score']),
+                     float(mitigation['governance_score']),
+                     float(operational['due_diligence_score'] + operational['supply_chain_mapping_score'] +
+                           operational['worker_protection_score']),
+                     mitigation['mitigation_grade'], hybrid_assessment['assessment_metadata'].get('risk_index_version'),
+                     sqlite3.Binary(gzip.compress(full_results)))
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"⚠️ Could not save assessment history: {e}")
+
+    def trend(self, company_id, since=None, until=None, limit=HISTORY_MAX_POINTS):
+        """Chronological points for one company with deltas to the previous point; scores
+        re-computed under a newer risk index version are returned alongside"""
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT a.assessment_id, a.assessment_date, a.risk_level, a.assessment_tier, a.mitigation_grade, "
+                "a.risk_index_version, " + ", ".join(f"a.{component}" for component in HISTORY_COMPONENTS) + ", "
+                "s.final_risk_score, s.final_risk_level, s.risk_index_version "
+                "FROM assessments a LEFT JOIN assessment_scoring_inputs s ON s.assessment_id = a.assessment_id "
+                "WHERE a.company_id = ? AND a.assessment_date >= ? AND a.assessment_date <= ? "
+                "ORDER BY a.assessment_date DESC, a.id DESC LIMIT ?",
+                # A date-only (or any partial) upper bound covers every time that starts with it
+                (company_id, since or '', (until or '') + '\uffff', limit)
+            ).fetchall()
+        
+        points, previous = [], None
+        for row in reversed(rows):
+            assessment_id, assessment_date, level, tier, grade, version = row[:6]
+            level = level.title() if level else level  # Legacy rows stored lowercase levels
+            scores = dict(zip(HISTORY_COMPONENTS, row[6:6 + len(HISTORY_COMPONENTS)]))
+            rescored_score, rescored_level, rescored_version = row[6 + len(HISTORY_COMPONENTS):]
+            point = {
+                'assessment_id': assessment_id,
+                'assessment_date': assessment_date,
+                'final_risk_level': level,
+                'assessment_tier': tier,
+                'mitigation_grade': grade,
+                'risk_index_version': version,
+                **scores,
+                'delta': {
+                    component: round(value - previous[component], 1)
+                    for component, value in scores.items()
+                    if previous is not None and value is not None and previous[component] is not None
+                },
+                'level_changed': previous is not None and level != previous['final_risk_level']
+            }
+            if rescored_version is not None and rescored_version != version:
+                point['current_index'] = {'risk_index_version': rescored_version, 'final_risk_score': rescored_score,
+                                          'final_risk_level': rescored_level}
+            points.append(point)
+            previous = point
+        return points
+
+    def full_result(self, assessment_id):
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT full_results_gz, full_results FROM assessments WHERE assessment_id = ?", (assessment_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(gzip.decompress(row[0]) if row[0] is not None else row[1] or 'null')
+
+shared_assessment_history = None
+assessment_history_lock = threading.Lock()
+
+def get_assessment_history():
+    global shared_assessment_history
+    if shared_assessment_history is None:
+        get_risk_indexes()  # The trend query joins re-scored results
+        with assessment_history_lock:
+            if shared_assessment_history is None:
+                shared_assessment_history = AssessmentHistory()
+    return shared_assessment_history
+
+shared_risk_indexes = None
+assessment_rescorer = None
+scenario_portfolio = None
+risk_indexes_lock = threading.Lock()
+
+def get_risk_indexes():
+    """Shared risk index registry; on first use applies the active version and starts re-scoring
+    stored assessments if they were scored with another one"""
+    global shared_risk_indexes, assessment_rescorer, scenario_portfolio
+    if shared_risk_indexes is None:
+        with risk_indexes_lock:
+            if shared_risk_indexes is None:
+                registry = RiskIndexRegistry()
+                assessment_rescorer = AssessmentRescorer(registry)
+                scenario_portfolio = ScenarioPortfolio(registry)
+                shared_risk_indexes = registry
+                try:
+                    if assessment_rescorer.counts()['stale_assessments']:
+                        assessment_rescorer.start()
+                except sqlite3.Error as e:
+                    print(f"⚠️ Could not check stored assessments for re-scoring: {e}")
+    return shared_risk_indexes
+
+def start_background_warmup():
+    """Load pandas, the governance dataset and the company resolver off the serving path"""
+    if os.getenv("BACKGROUND_WARMUP", "true").lower() in ("0", "false", "no", "off"):
+        return None
+    warmup_thread = threading.Thread(target=get_company_resolver, name="governance-warmup", daemon=True)
+    warmup_thread.start()
+    return warmup_thread
+
+# NEW: Shared TTL caches for expensive sub-stages, with concurrent misses coalesced onto one computation
+class StageCache:
+    def __init__(self, name, ttl_seconds, max_entries=1000):
+        """LRU cache with a TTL; one caller computes a missing key while the others wait for it"""
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = os.getenv("STAGE_CACHE_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.coalesced = 0
+
+    def get_or_compute(self, key, compute, should_cache=None, wait_timeout=None):
+        """Return a cached copy of the value for key, computing it at most once at a time"""
+        if not self.enabled:
+            return compute()
+        
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and time.monotonic() - entry[0] <= self.ttl_seconds:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            pending = self.pending.get(key)
+            leader = pending is None
+            if leader:
+                pending = self.pending[key] = threading.Event()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        
+        if not leader:
+            if pending.wait(wait_timeout):
+                with self.lock:
+                    entry = self.entries.get(key)
+                if entry:
+                    return copy.deepcopy(entry[1])
+            # The leader failed, produced an uncacheable value, or is taking longer than our deadline
+            return compute()
+        
+        try:
+            value = compute()
+            if should_cache is None or should_cache(value):
+                with self.lock:
+                    self.entries[key] = (time.monotonic(), copy.deepcopy(value))
+                    self.entries.move_to_end(key)
+                    while len(self.entries) > self.max_entries:
+                        self.entries.popitem(last=False)
+            return value
+        finally:
+            with self.lock:
+                self.pending.pop(key, None)
+            pending.set()
+
+    def state(self, key):
+        """'cached', 'pending' or None for key, without counting a hit or miss"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and time.monotonic() - entry[0] <= self.ttl_seconds:
+                return 'cached'
+            return 'pending' if key in self.pending else None
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced
+            }
+
+STAGE_CACHES = {
+    'company_profile': StageCache('company_profile', 3600),
+    'news_search': StageCache('news_search', 900),
+    'industry_analysis': StageCache('industry_analysis', 6 * 3600),
+    'geocode': StageCache('geocode', 24 * 3600, max_entries=5000)
+}
+
+# NEW: Concurrent /assess calls for the same company and options share one running assessment
+class AssessmentFlight:
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class SingleFlight:
     def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.started = self.coalesced = 0
+
+    def run(self, key, deadline, func, *args, watch_client=True):
+        """Run func(*args) once per key at a time; concurrent callers wait for the same result.
+
+        Returns (result, coalesced), or (None, coalesced) if this caller's client disconnected.
+        The shared deadline is cancelled only when every waiting client has gone. Background
+        callers (watch_client=False) have no client and always wait for the result.
+        """
+        with self.lock:
+            flight = self.flights.get(key)
+            coalesced = flight is not None
+            if coalesced:
+                self.coalesced += 1
+            else:
+                flight = self.flights[key] = AssessmentFlight(deadline)
+                self.started += 1
+            flight.waiters += 1
+        
+        if not coalesced:
+            threading.Thread(target=self.execute, args=(key, flight, func, args),
+                             name="assessment-worker", daemon=True).start()
+        
+        while not flight.done.wait(0.5):
+            if watch_client and client_disconnected():
+                with self.lock:
+                    flight.waiters -= 1
+                    if flight.waiters == 0:
+                        flight.deadline.cancel("client disconnected")
+                        # New requests must not attach to a cancelled run
+                        if self.flights.get(key) is flight:
+                            del self.flights[key]
+                return None, coalesced
+        
+        if flight.error is not None:
+            raise flight.error
+        return (dict(flight.result) if coalesced else flight.result), coalesced
+
+    def execute(self, key, flight, func, args):
+        try:
+            flight.result = func(*args)
+        except Exception as e:
+            flight.error = e
+        finally:
+            with self.lock:
+                if self.flights.get(key) is flight:
+                    del self.flights[key]
+            flight.done.set()
+
+    def snapshot(self):
+        with self.lock:
+            return {'in_flight': len(self.flights), 'started': self.started, 'coalesced': self.coalesced}
+
+assessment_flights = SingleFlight()
+
+def assessment_flight_key(company_id, plan, news_window_days):
+    """Single-flight key shared by /assess and scheduled re-assessments"""
+    return (company_id, tuple(sorted(plan.items())), news_window_days)
+
+# NEW: Speculative company profile warm-up while the user is still on the search box
+class ProfilePrefetcher:
+    def __init__(self):
+        """Small bounded pool that fills the company_profile stage cache ahead of /assess"""
+        self.enabled = os.getenv("PREFETCH_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+        self.max_pending = int(os.getenv("PREFETCH_MAX_PENDING", 4))
+        self.budget_seconds = float(os.getenv("PREFETCH_BUDGET_SECONDS", 30))
+        # Real assessments take priority: no new prefetches while this many are running
+        self.max_active_assessments = int(os.getenv("PREFETCH_MAX_ACTIVE_ASSESSMENTS", 2))
+        # Per-client sliding window, since the endpoint is public
+        self.rate_limit_per_minute = int(os.getenv("PREFETCH_RATE_LIMIT_PER_MINUTE", 30))
+        self.max_tracked_clients = int(os.getenv("PREFETCH_MAX_TRACKED_CLIENTS", 10000))
+        self.executor = ThreadPoolExecutor(max_workers=int(os.getenv("PREFETCH_WORKERS", 1)),
+                                           thread_name_prefix="prefetch")
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.client_requests = OrderedDict()  # client -> deque of request times in the last minute (LRU)
+        self.counts = {'queued': 0, 'completed': 0, 'failed': 0, 'skipped': 0, 'rate_limited': 0}
+
+    def allow(self, client):
+        """Record a request from client; False once it has made rate_limit_per_minute in the last 60s"""
+        now = time.monotonic()
+        with self.lock:
+            requests = self.client_requests.pop(client, None) or deque()
+            while requests and requests[0] <= now - 60:
+                requests.popleft()
+            self.client_requests[client] = requests
+            while len(self.client_requests) > self.max_tracked_clients:
+                self.client_requests.popitem(last=False)
+            if len(requests) >= self.rate_limit_per_minute:
+                self.counts['rate_limited'] += 1
+                return False
+            requests.append(now)
+            return True
+
+    def submit(self, company_name):
+        """Queue a profile warm-up; returns (status, company_id)
+
+        Only companies the resolver already knows (dataset or previously assessed) are
+        prefetched, so free-text keystrokes never turn into GPT-4o calls.
+        """
+        company = get_company_resolver().resolve(company_name)
+        company_id = company['company_id']
+        status = self.skip_reason(company, company_id)
+        with self.lock:
+            if status is None and company_id in self.pending:
+                status = 'in_progress'
+            elif status is None and len(self.pending) >= self.max_pending:
+                status = 'busy'
+            if status is not None:
+                self.counts['skipped'] += 1
+                return status, company_id
+            self.pending.add(company_id)
+            self.counts['queued'] += 1
+        self.executor.submit(self.warm, company_name, company_id)
+        return 'queued', company_id
+
+    def skip_reason(self, company, company_id):
+        if not self.enabled:
+            return 'disabled'
+        if company['source'] == 'new':
+            return 'unknown_company'
+        cache_state = STAGE_CACHES['company_profile'].state(company_id)
+        if cache_state == 'cached':
+            return 'cached'
+        if cache_state == 'pending':
+            return 'in_progress'
+        if PROVIDER_BREAKERS['openai'].state != "closed":
+            return 'provider_unavailable'  # Never spend a half-open trial call on speculation
+        if assessment_flights.snapshot()['in_flight'] >= self.max_active_assessments:
+            return 'busy'
+        return None
+
+    def warm(self, company_name, company_id):
+        try:
+            assessor = EnhancedModernSlaveryAssessment(deadline=AssessmentDeadline(budget_seconds=self.budget_seconds))
+            assessor.company_id = company_id
+            assessor.get_cached_company_profile(company_name)
+            # Governance score lookup also warms the dataset manager for the assessment
+            assessor.governance_manager.get_company_governance_score(company_name, company_id=company_id)
+            outcome = 'completed'
+        except Exception as e:
+            print(f"Prefetch error for {company_name}: {e}")
+            outcome = 'failed'
+        with self.lock:
+            self.pending.discard(company_id)
+            self.counts[outcome] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {'enabled': self.enabled, 'pending': len(self.pending), **self.counts}
+
+profile_prefetcher = ProfilePrefetcher()
+
+# NEW: Incremental per-company news: seen articles plus a last-checked watermark per provider
+NEWS_WATERMARK_OVERLAP_HOURS = 24  # Re-ask a little before the watermark for late-indexed articles
+
+class NewsStore:
+    def __init__(self, db_path=None):
+        """Articles already seen per (company, provider) and when the provider was last checked,
+        so repeat assessments only ask for articles newer than the watermark"""
+        self.db_path = db_path or assessments_db_path()
+        self.lock = threading.Lock()
+        self.counts = {'full_window_fetches': 0, 'incremental_fetches': 0, 'failed_fetches': 0, 'new_articles': 0}
+        with self.connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS news_articles (
+                    company_id TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    published_at TEXT NOT NULL,
+                    first_seen_at TEXT NOT NULL,
+                    article TEXT NOT NULL,
+                    PRIMARY KEY (company_id, provider, url)
+                )
+            """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_news_articles_published ON news_articles (company_id, provider, published_at)"
+            )
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS news_watermarks (
+                    company_id TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    checked_at TEXT NOT NULL,
+                    window_days INTEGER NOT NULL,
+                    PRIMARY KEY (company_id, provider)
+                )
+            """)
+
+    def connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def since(self, company_id, provider, window_days):
+        """Where the next query should start: the watermark less an overlap, or the whole window
+        the first time (or when a longer window than before is asked for)"""
+        window_start = datetime.now() - timedelta(days=window_days)
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT checked_at, window_days FROM news_watermarks WHERE company_id = ? AND provider = ?",
+                (company_id, provider)
+            ).fetchone()
+        if row is None or row[1] < window_days:
+            return window_start, True
+        watermark = datetime.fromisoformat(row[0]) - timedelta(hours=NEWS_WATERMARK_OVERLAP_HOURS)
+        return max(window_start, watermark), False
+
+    def refresh(self, company_id, provider, window_days, fetch, date_key, limit):
+        """Fetch only what is newer than the watermark and return the newest `limit` stored articles
+        in the window. fetch(since) returns (articles, complete); the watermark only moves when every
+        provider call succeeded, so a partial outage is retried from the same point next time."""
+        checked_at = datetime.now()
+        since, full_window = self.since(company_id, provider, window_days)
+        articles, complete = fetch(since)
+        
+        seen_at = checked_at.isoformat(timespec='seconds')
+        rows = []
+        for article in articles:
+            published_at = str(article.get(date_key) or '')[:19]
+            if not re.match(r'\d{4}-\d{2}-\d{2}', published_at):
+                published_at = seen_at  # Undated results count as published when first seen
+            rows.append((company_id, provider, article.get('url') or '', published_at, seen_at, json.dumps(article)))
+        with self.connect() as connection:
+            before = connection.total_changes
+            connection.executemany("INSERT OR IGNORE INTO news_articles VALUES (?, ?, ?, ?, ?, ?)",
+                                   [row for row in rows if row[2]])
+            new_articles = connection.total_changes - before
+            if complete:
+                connection.execute(
+                    "INSERT INTO news_watermarks VALUES (?, ?, ?, ?) ON CONFLICT (company_id, provider) DO UPDATE SET "
+                    "checked_at = excluded.checked_at, window_days = MAX(window_days, excluded.window_days)",
+                    (company_id, provider, seen_at, window_days)
+                )
+            stored = connection.execute(
+                "SELECT article FROM news_articles WHERE company_id = ? AND provider = ? AND published_at >= ? "
+                "ORDER BY published_at DESC LIMIT ?",
+                (company_id, provider, (checked_at - timedelta(days=window_days)).strftime('%Y-%m-%d'), limit)
+            ).fetchall()
+        
+        with self.lock:
+            self.counts['full_window_fetches' if full_window else 'incremental_fetches'] += 1
+            self.counts['new_articles'] += new_articles
+            if not complete:
+                self.counts['failed_fetches'] += 1
+        print(f"📰 {provider}: {new_articles} new of {len(articles)} fetched since {since:%Y-%m-%d %H:%M} "
+              f"({'full window' if full_window else 'incremental'}), {len(stored)} stored in window")
+        return [json.loads(article) for (article,) in stored]
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts)
+
+shared_news_store = None
+news_store_lock = threading.Lock()
+
+def get_news_store():
+    global shared_news_store
+    if shared_news_store is None:
+        with news_store_lock:
+            if shared_news_store is None:
+                shared_news_store = NewsStore()
+    return shared_news_store
+
+# NEW: One de-duplicated, scored article set from the NewsAPI and Tavily results
+NEWS_TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ocid', 'cmpid', 'ref', 'smid', 'taid', 'ito'}
+NEWS_HOST_PREFIXES = ('www.', 'm.', 'amp.', 'mobile.')
+NEWS_SHINGLE_WORDS = 3
+NEWS_MINHASH_BANDS, NEWS_MINHASH_ROWS = 16, 4  # LSH candidates from an estimated similarity of about 0.5
+NEWS_MINHASH_PRIME = (1 << 32) + 15
+NEWS_DUPLICATE_SIMILARITY = float(os.getenv("NEWS_DUPLICATE_SIMILARITY", "0.6"))
+NEWS_RELEVANCE_TERMS = {
+    'forced labor': 3, 'forced labour': 3, 'modern slavery': 3, 'human trafficking': 3, 'child labor': 3,
+    'child labour': 3, 'worker exploitation': 2, 'labor violation': 2, 'labour violation': 2,
+    'workers rights': 1, 'worker rights': 1, 'supply chain': 1, 'audit': 1, 'investigation': 1
+}
+news_minhash_coefficients = None
+
+def canonical_news_url(url):
+    """Scheme, host case, www/m/amp hosts, tracking parameters, fragments, AMP paths and
+    trailing slashes do not make a different article"""
+    url = (url or '').strip()
+    parsed = urlparse(url)
+    if not parsed.netloc:
+        return url.lower()
+    host = parsed.netloc.lower().rsplit('@', 1)[-1]
+    if host.endswith((':80', ':443')):
+        host = host.rsplit(':', 1)[0]
+    for prefix in NEWS_HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    path = re.sub(r'/amp(\.html)?$', '', parsed.path.rstrip('/')).rstrip('/')
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in NEWS_TRACKING_PARAMS
+    ))
+    return host + path + (f"?{query}" if query else '')
+
+def news_shingles(text):
+    """Word 3-grams of the normalized text (the whole text when it is shorter)"""
+    words = normalize_search_text(text).split()
+    if len(words) <= NEWS_SHINGLE_WORDS:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + NEWS_SHINGLE_WORDS]) for i in range(len(words) - NEWS_SHINGLE_WORDS + 1)}
+
+def news_minhash_signatures(shingle_sets):
+    """MinHash signatures (rows) for non-empty shingle sets, all computed in one array pass"""
+    import numpy as np
+    global news_minhash_coefficients
+    permutations = NEWS_MINHASH_BANDS * NEWS_MINHASH_ROWS
+    if news_minhash_coefficients is None:
+        rng = np.random.default_rng(20240601)  # Fixed so signatures are comparable across runs
+        news_minhash_coefficients = (rng.integers(1, 1 << 32, permutations, dtype=np.uint64)[:, None],
+                                     rng.integers(0, 1 << 32, permutations, dtype=np.uint64)[:, None])
+    multipliers, offsets = news_minhash_coefficients
+    hashes = np.array([
+        int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+        for shingles in shingle_sets for shingle in sorted(shingles)
+    ], dtype=np.uint64)
+    starts = np.cumsum([0] + [len(shingles) for shingles in shingle_sets[:-1]])
+    # (a * h + b) mod p stays below 2**64 for 32-bit a, h and b
+    permuted = (multipliers * hashes[None, :] + offsets) % np.uint64(NEWS_MINHASH_PRIME)
+    return np.minimum.reduceat(permuted, starts, axis=1).T
+
+def news_relevance_score(article, copies, now):
+    """0-1 from modern slavery terms (title counts double), recency within two years and syndication"""
+    title = normalize_search_text(article['title'])
+    body = normalize_search_text(article['description'])
+    terms = sum(weight * (2 * (term in title) + (term in body))
+                for term, weight in NEWS_RELEVANCE_TERMS.items() if term in title or term in body)
+    try:
+        age_days = (now - datetime.fromisoformat(article['published_at'][:10])).days
+        recency = 1.0 if age_days <= 90 else max(0.3, 1 - (age_days - 90) / 730)
+    except ValueError:
+        recency = 0.5
+    return round(0.6 * min(terms / 9, 1) + 0.25 * recency + 0.15 * min(copies / 3, 1), 3)
+
+def merge_news_articles(newsapi_articles, tavily_articles):
+    """One de-duplicated, scored article set from both providers.
+
+    Articles are grouped when their canonical URLs match or when the MinHash estimate of the
+    Jaccard similarity of their title + description shingles reaches NEWS_DUPLICATE_SIMILARITY
+    (candidates come from LSH band buckets, so syndicated copies are found without comparing
+    every pair). Each group keeps its most complete article, with the providers and URLs of
+    the copies. Returns (articles sorted by relevance_score, stats).
+    """
+    import numpy as np
+    articles = [{'title': item.get('title') or '', 'url': item.get('url') or '',
+                 'description': item.get('description') or '', 'published_at': item.get('publishedAt') or '',
+                 'outlet': item.get('source') or urlparse(item.get('url') or '').netloc, 'provider': 'newsapi'}
+                for item in newsapi_articles or []]
+    articles += [{'title': item.get('title') or '', 'url': item.get('url') or '',
+                  'description': item.get('content_preview') or '', 'published_at': str(item.get('date') or ''),
+                  'outlet': item.get('domain') or urlparse(item.get('url') or '').netloc, 'provider': 'tavily'}
+                 for item in tavily_articles or []]
+    
+    parents = list(range(len(articles)))
+    def find(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+    def union(i, j):
+        parents[find(i)] = find(j)
+    
+    url_duplicates = near_duplicates = 0
+    first_by_url = {}
+    for i, article in enumerate(articles):
+        article['canonical_url'] = canonical_news_url(article['url'])
+        if article['canonical_url'] in first_by_url:
+            union(i, first_by_url[article['canonical_url']])
+            url_duplicates += 1
+        elif article['canonical_url']:
+            first_by_url[article['canonical_url']] = i
+    
+    shingled = [(i, news_shingles(f"{article['title']} {article['description']}")) for i, article in enumerate(articles)]
+    shingled = [(i, shingles) for i, shingles in shingled if shingles]
+    if len(shingled) > 1:
+        signatures = news_minhash_signatures([shingles for _, shingles in shingled])
+        buckets = defaultdict(list)
+        for position, signature in enumerate(signatures):
+            for band in range(NEWS_MINHASH_BANDS):
+                buckets[(band, signature[band * NEWS_MINHASH_ROWS:(band + 1) * NEWS_MINHASH_ROWS].tobytes())].append(position)
+        checked = set()
+        for members in buckets.values():
+            for a_index, a in enumerate(members):
+                for b in members[a_index + 1:]:
+                    if (a, b) in checked:
+                        continue
+                    checked.add((a, b))
+                    i, j = shingled[a][0], shingled[b][0]
+                    if find(i) != find(j) and np.mean(signatures[a] == signatures[b]) >= NEWS_DUPLICATE_SIMILARITY:
+                        union(i, j)
+                        near_duplicates += 1
+    
+    groups = defaultdict(list)
+    for i in range(len(articles)):
+        groups[find(i)].append(articles[i])
+    now = datetime.now()
+    merged = []
+    for members in groups.values():
+        representative = max(members, key=lambda article: (len(article['description']), bool(article['published_at'])))
+        article = {key: representative[key] for key in ('title', 'url', 'canonical_url', 'description', 'published_at', 'outlet')}
+        article['providers'] = sorted({member['provider'] for member in members})
+        article['duplicate_urls'] = sorted({member['url'] for member in members if member['url'] != representative['url']})
+        article['syndicated_copies'] = len(members) - 1
+        article['relevance_score'] = news_relevance_score(article, len(members) - 1, now)
+        merged.append(article)
+    merged.sort(key=lambda article: (article['relevance_score'], article['published_at']), reverse=True)
+    return merged, {'fetched': len(articles), 'unique': len(merged), 'url_duplicates': url_duplicates,
+                    'near_duplicates': near_duplicates}
+
+# NEW: Heavy assessment sections served separately, keyed by assessment_id
+# URL slug -> keys of the full /assess response that the section provides
+ASSESSMENT_SECTIONS = {
+    'supply-chain-map': ('manufacturing_locations', 'supply_chain_map'),
+    'industry-benchmark': ('industry_benchmarking',),
+    'enhanced-news': ('enhanced_data',),
+    'hybrid-breakdown': ('hybrid_assessment',)
+}
+
+# NEW: Assessment tiers and the frontend's options decide which stages run
+ASSESSMENT_TIERS = ('quick', 'standard', 'deep')
+ASSESSMENT_TYPE_ALIASES = {'comprehensive': 'deep'}
+MAX_TIMEFRAME_MONTHS = 120
+
+# Deferred section -> frontend options that feed it; it runs only if none of them is turned off
+SECTION_OPTIONS = {
+    'supply-chain-map': ('include_supply_chain', 'include_mapping'),
+    'enhanced-news': ('include_news', 'include_financial'),
+    'industry-benchmark': ('include_benchmarking',)
+}
+
+def plan_assessment(assessment_type=None, options=None, lazy_sections=False):
+    """Resolve assessment_type/options into the stages to run.
+
+    quick: governance dataset + local geographic/industry scoring only (no LLM or network calls).
+    standard: AI profile, news and analysis; heavy sections are left to /assessments/<id>/<section>.
+    deep: everything (the default, and what the frontend's 'comprehensive' means).
+    """
+    if not isinstance(assessment_type, (str, type(None))):
+        raise ValueError("assessment_type must be a string")
+    if not isinstance(options, (dict, type(None))):
+        raise ValueError("options must be an object")
+    tier = ASSESSMENT_TYPE_ALIASES.get(assessment_type, assessment_type) or 'deep'
+    if tier not in ASSESSMENT_TIERS:
+        raise ValueError(f"Unknown assessment_type '{assessment_type}' (use one of {', '.join(ASSESSMENT_TIERS)})")
+    
+    options = options or {}
+    run_sections = tier == 'deep' and not lazy_sections
+    plan = {
+        'tier': tier,
+        'use_ai': tier != 'quick',
+        'news_search': tier != 'quick' and options.get('include_news', True) is not False
+    }
+    for section, option_names in SECTION_OPTIONS.items():
+        plan[section] = run_sections and all(options.get(name, True) is not False for name in option_names)
+    # Always computed; only decides whether the raw breakdown is returned inline
+    plan['hybrid-breakdown'] = run_sections
+    return plan
+
+class AssessmentStore:
+    def __init__(self, max_entries=None, ttl_seconds=None):
+        """Bounded LRU of recent assessments, so detail sections can be fetched (or computed) later"""
+        self.max_entries = max_entries or int(os.getenv("ASSESSMENT_STORE_MAX", "200"))
+        self.ttl_seconds = ttl_seconds or float(os.getenv("ASSESSMENT_STORE_TTL_SECONDS", "3600"))
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def save(self, assessment_id, context, data):
+        """Store the inputs needed to compute deferred sections plus any already computed data"""
+        entry = {
+            'created': time.monotonic(),
+            'context': context,
+            'data': data,
+            'section_locks': {section: threading.Lock() for section in ASSESSMENT_SECTIONS}
+        }
+        with self.lock:
+            self.entries[assessment_id] = entry
+            self.entries.move_to_end(assessment_id)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get(self, assessment_id):
+        with self.lock:
+            entry = self.entries.get(assessment_id)
+            if entry is None:
+                return None
+            if time.monotonic() - entry['created'] > self.ttl_seconds:
+                del self.entries[assessment_id]
+                return None
+            self.entries.move_to_end(assessment_id)
+            return entry
+
+    def get_section(self, assessment_id, section):
+        """Return a section's data, computing it on first access; None for unknown/expired ids"""
+        entry = self.get(assessment_id)
+        if entry is None:
+            return None
+
+        keys = ASSESSMENT_SECTIONS[section]
+        # One computation per section; other sections of the same assessment are not blocked
+        with entry['section_locks'][section]:
+            if not all(key in entry['data'] for key in keys):
+                print(f"🧩 Computing deferred section '{section}' for {assessment_id}")
+                assessor = EnhancedModernSlaveryAssessment()
+                entry['data'].update(assessor.compute_deferred_section(section, entry['context']))
+        return {key: entry['data'][key] for key in keys}
+
+    def section_status(self, assessment_id):
+        """Section URLs and whether each one has been computed yet"""
+        entry = self.get(assessment_id)
+        data = entry['data'] if entry else {}
+        return {
+            section: {
+                'url': f"/assessments/{assessment_id}/{section}",
+                'computed': all(key in data for key in keys)
+            }
+            for section, keys in ASSESSMENT_SECTIONS.items()
+        }
+
+assessment_store = AssessmentStore()
+
+# NEW: Watchlist of monitored suppliers, re-assessed in the background on staggered cadences
+WATCHLIST_DEFAULT_CADENCE_HOURS = float(os.getenv("WATCHLIST_DEFAULT_CADENCE_HOURS", "168"))
+WATCHLIST_MIN_CADENCE_HOURS = 1
+WATCHLIST_MAX_CADENCE_HOURS = 24 * 366
+WATCHLIST_CHANGE_THRESHOLD = float(os.getenv("WATCHLIST_CHANGE_THRESHOLD", "1.0"))  # Component points
+WATCHLIST_MAX_ENTRIES_PER_REQUEST = 1000
+
+class WatchlistScheduler:
+    def __init__(self, db_path=None):
+        """Re-assesses watched companies one at a time, at most one start per min_interval_seconds.
+
+        Each entry's first run is offset by a stable hash of its company_id within its cadence,
+        so a batch of hundreds of suppliers spreads over the cadence instead of running at once.
+        Stage caches are shared with live requests, so unexpired profiles and news are reused.
+        """
+        self.db_path = db_path or assessments_db_path()
+        self.enabled = os.getenv("WATCHLIST_SCHEDULER_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+        self.tick_seconds = float(os.getenv("WATCHLIST_TICK_SECONDS", "30"))
+        self.min_interval_seconds = float(os.getenv("WATCHLIST_MIN_INTERVAL_SECONDS", "120"))
+        self.retry_seconds = float(os.getenv("WATCHLIST_RETRY_SECONDS", "900"))
+        # Live assessments take priority: nothing new starts while this many are running
+        self.max_active_assessments = int(os.getenv("WATCHLIST_MAX_ACTIVE_ASSESSMENTS", 2))
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+        self.last_started = 0.0
+        self.running = None
+        self.counts = {'completed': 0, 'failed': 0, 'changed': 0, 'deferred': 0}
+        with self.connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS watchlist (
+                    company_id TEXT PRIMARY KEY,
+                    company_name TEXT NOT NULL,
+                    assessment_type TEXT NOT NULL,
+                    cadence_hours REAL NOT NULL,
+                    added_at TEXT,
+                    next_run_at REAL NOT NULL,
+                    last_run_at TEXT,
+                    last_assessment_id TEXT,
+                    final_risk_score REAL,
+                    final_risk_level TEXT,
+                    changed INTEGER NOT NULL DEFAULT 0,
+                    changes TEXT,
+                    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT
+                )
+            """)
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_watchlist_next_run ON watchlist (next_run_at)")
+
+    def connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def add(self, company_names, cadence_hours=None, assessment_type=None):
+        """Add or update entries; returns [{'company_id', 'company_name', 'next_run_at'}]"""
+        if cadence_hours is None:
+            cadence_hours = WATCHLIST_DEFAULT_CADENCE_HOURS
+        if isinstance(cadence_hours, bool) or not isinstance(cadence_hours, (int, float)):
+            raise TypeError("cadence_hours must be a number")
+        cadence_hours = float(cadence_hours)
+        if not WATCHLIST_MIN_CADENCE_HOURS <= cadence_hours <= WATCHLIST_MAX_CADENCE_HOURS:  # Also rejects NaN
+            raise ValueError(f"cadence_hours must be between {WATCHLIST_MIN_CADENCE_HOURS} and {WATCHLIST_MAX_CADENCE_HOURS}")
+        assessment_type = plan_assessment(assessment_type or 'standard')['tier']
+        cadence_seconds = cadence_hours * 3600
+        resolver = get_company_resolver()
+        now = time.time()
+        added = {}
+        for name in company_names:
+            company = resolver.resolve(name)
+            offset = int(hashlib.sha1(company['company_id'].encode('utf-8')).hexdigest()[:12], 16) % int(cadence_seconds)
+            added[company['company_id']] = (company['company_id'], company['canonical_name'], assessment_type,
+                                            cadence_hours, datetime.now().isoformat(timespec='seconds'), now + offset)
+        with self.connect() as connection:
+            connection.executemany(
+                "INSERT INTO watchlist (company_id, company_name, assessment_type, cadence_hours, added_at, next_run_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (company_id) DO UPDATE SET assessment_type = excluded.assessment_type, "
+                "cadence_hours = excluded.cadence_hours, next_run_at = MIN(next_run_at, excluded.next_run_at)",
+                list(added.values())
+            )
+            rows = connection.execute(
+                f"SELECT company_id, company_name, next_run_at FROM watchlist WHERE company_id IN ({','.join('?' * len(added))})",
+                list(added)
+            ).fetchall() if added else []
+        self.start()
+        return [{'company_id': company_id, 'company_name': name, 'next_run_at': self.timestamp(next_run_at)}
+                for company_id, name, next_run_at in rows]
+
+    def remove(self, company_id):
+        with self.connect() as connection:
+            return connection.execute("DELETE FROM watchlist WHERE company_id = ?", (company_id,)).rowcount > 0
+
+    def acknowledge(self, company_id):
+        """Clear the changed flag once the change has been reviewed"""
+        with self.connect() as connection:
+            return connection.execute("UPDATE watchlist SET changed = 0 WHERE company_id = ?", (company_id,)).rowcount > 0
+
+    def entries(self, changed_only=False):
+        with self.connect() as connection:
+            connection.row_factory = sqlite3.Row
+            rows = connection.execute(
+                "SELECT * FROM watchlist" + (" WHERE changed = 1" if changed_only else "") + " ORDER BY next_run_at"
+            ).fetchall()
+        entries = []
+        for row in rows:
+            entry = dict(row)
+            entry['changed'] = bool(entry['changed'])
+            entry['changes'] = json.loads(entry['changes']) if entry['changes'] else None
+            entry['next_run_at'] = self.timestamp(entry['next_run_at'])
+            entry['result_url'] = f"/history/{entry['last_assessment_id']}" if entry['last_assessment_id'] else None
+            entries.append(entry)
+        return entries
+
+    @staticmethod
+    def timestamp(epoch_seconds):
+        return datetime.fromtimestamp(epoch_seconds).isoformat(timespec='seconds')
+
+    def start(self):
+        with self.lock:
+            if not self.enabled or (self.thread and self.thread.is_alive()):
+                return False
+            self.thread = threading.Thread(target=self.loop, name="watchlist-scheduler", daemon=True)
+            self.thread.start()
+            return True
+
+    def loop(self):
+        while True:
+            self.wakeup.wait(self.tick_seconds)
+            self.wakeup.clear()
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"❌ Watchlist scheduler error: {e}")
+
+    def tick(self):
+        """Run the most overdue entry if pacing, provider health and live load allow it"""
+        if time.monotonic() - self.last_started < self.min_interval_seconds:
+            return False
+        with self.connect() as connection:
+            due = connection.execute(
+                "SELECT company_id, company_name, assessment_type, cadence_hours, next_run_at, consecutive_failures "
+                "FROM watchlist WHERE next_run_at <= ? ORDER BY next_run_at LIMIT 1", (time.time(),)
+            ).fetchone()
+        if due is None:
+            return False
+        if (assessment_flights.snapshot()['in_flight'] >= self.max_active_assessments or
+                any(breaker.state == "open" for breaker in PROVIDER_BREAKERS.values())):
+            self.counts['deferred'] += 1
+            return False
+        self.last_started = time.monotonic()
+        self.run_entry(*due)
+        return True
+
+    def run_entry(self, company_id, company_name, assessment_type, cadence_hours, next_run_at, failures):
+        self.running = company_id
+        try:
+            # Same single-flight path as /assess: coalesces with a live request for the company
+            # and counts towards the in_flight figure live traffic is measured by
+            deadline = AssessmentDeadline()
+            assessor = EnhancedModernSlaveryAssessment(deadline=deadline)
+            plan = plan_assessment(assessment_type)
+            result, _ = assessment_flights.run(
+                assessment_flight_key(company_id, plan, assessor.news_window_days), deadline,
+                assessor.assess_company, company_name, plan, watch_client=False
+            )
+        except Exception as e:
+            result = {'status': 'failed', 'error': str(e)}
+        finally:
+            self.running = None
+        
+        now = time.time()
+        cadence_seconds = cadence_hours * 3600
+        with self.connect() as connection:
+            if result.get('status') != 'completed':
+                failures += 1
+                # Back off on failures, but never beyond the regular cadence
+                retry_at = now + min(cadence_seconds, self.retry_seconds * 2 ** (failures - 1))
+                connection.execute(
+                    "UPDATE watchlist SET next_run_at = ?, consecutive_failures = ?, last_error = ? WHERE company_id = ?",
+                    (retry_at, failures, result.get('error'), company_id)
+                )
+                self.counts['failed'] += 1
+                return result
+            
+            changes = self.detect_changes(company_id)
+            # Keep each entry's phase so the staggering survives; skip missed slots after downtime
+            next_run_at += cadence_seconds
+            if next_run_at <= now:
+                next_run_at = now + cadence_seconds
+            connection.execute(
+                "UPDATE watchlist SET next_run_at = ?, last_run_at = ?, last_assessment_id = ?, final_risk_score = ?, "
+                "final_risk_level = ?, changed = MAX(changed, ?), changes = COALESCE(?, changes), "
+                "consecutive_failures = 0, last_error = NULL WHERE company_id = ?",
+                (next_run_at, result['assessment_date'], result['assessment_id'], result['overall_risk_score'],
+                 result['overall_risk_level'], int(changes is not None),
+                 json.dumps(changes) if changes is not None else None, company_id)
+            )
+        self.counts['completed'] += 1
+        if changes is not None:
+            self.counts['changed'] += 1
+            print(f"🔔 Watchlist change for {company_name}: {changes}")
+        return result
+
+    def detect_changes(self, company_id):
+        """Level and component changes against the company's previous stored assessment, or None"""
+        points = get_assessment_history().trend(company_id, limit=2)
+        if len(points) < 2:
+            return None
+        latest = points[-1]
+        components = {component: delta for component, delta in latest['delta'].items()
+                      if abs(delta) >= WATCHLIST_CHANGE_THRESHOLD}
+        if not components and not latest['level_changed']:
+            return None
+        return {
+            'since_assessment_id': points[0]['assessment_id'],
+            'final_risk_level': [points[0]['final_risk_level'], latest['final_risk_level']] if latest['level_changed'] else None,
+            'components': components
+        }
+
+    def snapshot(self):
+        with self.connect() as connection:
+            total, due, changed = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(next_run_at <= ?), 0), COALESCE(SUM(changed), 0) FROM watchlist",
+                (time.time(),)
+            ).fetchone()
+        return {'enabled': self.enabled, 'running': self.running, 'entries': total, 'due': due,
+                'changed': changed, 'min_interval_seconds': self.min_interval_seconds, **self.counts}
+
+shared_watchlist = None
+watchlist_lock = threading.Lock()
+
+def get_watchlist():
+    global shared_watchlist
+    if shared_watchlist is None:
+        with watchlist_lock:
+            if shared_watchlist is None:
+                shared_watchlist = WatchlistScheduler()
+    return shared_watchlist
+
+def start_watchlist_scheduler():
+    """Resume the scheduler after a restart if anything is being watched (never creates the table)"""
+    try:
+        with sqlite3.connect(assessments_db_path(), timeout=5) as connection:
+            watched = connection.execute("SELECT COUNT(*) FROM watchlist").fetchone()[0]
+    except sqlite3.Error:
+        return  # No watchlist yet
+    if watched:
+        get_watchlist().start()
+
+class EnhancedModernSlaveryAssessment:
+    def __init__(self, deadline=None):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-        # Initialize governance dataset manager
-        self.governance_manager = GovernanceDatasetManager()
+        configure_http_transport(self.session)
+        # Shared governance dataset manager (waits for the warm-up if it is still loading)
+        self.governance_manager = get_governance_manager()
         
-        # NEW: Initialize Tavily client
-        self.tavily_client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY", ""))
-    
-    def call_openai_api(self, messages, max_tokens=1500, temperature=0.1):
-        """OpenAI API call with fresh API key"""
+        # NEW: Request-wide deadline shared by every stage of this assessment
+        self.deadline = deadline or AssessmentDeadline()
+
+        # NEW: Per-assessment record of LLM calls (stage, model, latency, tokens)
+        self.llm_usage = []
+
+        # NEW: Per-assessment pipeline stage timings (offsets relative to the assessor's creation)
+        self.started_at = time.perf_counter()
+        self.stage_timings = []
+
+        # NEW: Provider call trace, only collected for profiled requests
+        self.provider_trace = None
+
+        # NEW: Memory record for the running assessment (None unless MEMORY_TRACKING_ENABLED)
+        self.memory_record = None
+
+        # NEW: News look-back window (the frontend's timeframe_months option)
+        self.news_window_days = 730
+
+        # NEW: Resolved company id for the assessed company (keys caches and dataset lookups)
+        self.company_id = None
+
+    def run_stage(self, stage, func, *args, **kwargs):
+        """Run one pipeline stage, recording its wall-clock time (and memory when tracking is on)"""
+        started = time.perf_counter()
+        memory_tracker.stage_started(self.memory_record, stage)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            memory_tracker.stage_finished(self.memory_record)
+            duration = time.perf_counter() - started
+            stage_metrics.record(f"pipeline:{stage}", duration)
+            self.stage_timings.append({
+                'stage': stage,
+                'start_ms': round((started - self.started_at) * 1000, 1),
+                'duration_ms': round(duration * 1000, 1)
+            })
+
+    def provider_request(self, provider, method, url, timeout, **kwargs):
+        """HTTP call to an external provider, guarded by its circuit breaker and the assessment deadline"""
+        breaker = PROVIDER_BREAKERS[provider]
+        effective_timeout = self.deadline.timeout_for(timeout)
+        if not breaker.allow_request():
+            raise ProviderUnavailableError(f"{provider} circuit breaker is open")
+
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, timeout=effective_timeout, **kwargs)
+        except requests.RequestException as e:
+            breaker.record_failure()
+            self.trace_provider_call(provider, method, url, started, error=type(e).__name__)
+            raise
+        self.trace_provider_call(provider, method, url, started, status=response.status_code)
+
+        # Client errors are our fault, not a provider outage
+        if response.status_code >= 500 or response.status_code == 429:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def rate_limit_pause(self, seconds):
+        """Pause between provider calls, scaled by RATE_LIMIT_SLEEP_SCALE (set 0 against stubs or replay)"""
+        self.deadline.sleep(seconds * float(os.getenv("RATE_LIMIT_SLEEP_SCALE", 1)))
+
+    def trace_provider_call(self, provider, method, url, started, status=None, error=None):
+        """Add a provider call to the waterfall of a profiled request"""
+        if self.provider_trace is None:
+            return
+        self.provider_trace.append({
+            'provider': provider,
+            'request': f"{method} {urlparse(url).path}",
+            'start_ms': round((started - self.started_at) * 1000, 1),
+            'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+            'status': status,
+            'error': error
+        })
+
+    def tavily_search(self, query, **options):
+        """Tavily search over our own session so breaker, deadline and timeouts apply"""
+        data = {
+            "query": query,
+            "search_depth": options.get("search_depth", "basic"),
+            "topic": options.get("topic", "general"),
+            "days": options.get("days", 3),
+            "max_results": options.get("max_results", 5),
+            "include_answer": options.get("include_answer", False),
+            "include_raw_content": options.get("include_raw_content", False),
+            "include_images": False,
+            "api_key": os.getenv("TAVILY_API_KEY", "")
+        }
+        if options.get("start_date"):
+            data["start_date"] = options["start_date"]
+        response = self.provider_request(
+            'tavily', 'POST', provider_url('tavily', '/search'), timeout=20,
+            json=data, headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def call_openai_api(self, messages, max_tokens=None, temperature=0.1, stage="default"):
+        """OpenAI API call with fresh API key, routed to a model by pipeline stage"""
+        route = model_router.resolve(stage)
+        model = route['model']
+        started = time.perf_counter()
         try:
             # Get fresh API key each time
             current_openai_key = os.getenv("OPENAI_API_KEY", "")
-            
-            url = "https://api.openai.com/v1/chat/completions"
+
+            url = provider_url('openai', '/chat/completions')
             headers = {
                 "Authorization": f"Bearer {current_openai_key}",
                 "Content-Type": "application/json"
             }
             data = {
-                "model": "gpt-4o",
+                "model": model,
                 "messages": messages,
-                "max_tokens": max_tokens,
+                "max_tokens": max_tokens or route['max_tokens'],
                 "temperature": temperature
             }
-            
-            response = requests.post(url, headers=headers, json=data, timeout=45)
-            
+
+            response = self.provider_request('openai', 'POST', url, route['timeout'], headers=headers, json=data)
+
             if response.status_code == 200:
                 result = response.json()
+                usage = result.get('usage') or {}
+                self.record_llm_call(stage, model, started, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0))
                 return result['choices'][0]['message']['content']
             else:
-                print(f"OpenAI API Error: {response.status_code} - {response.text}")
+                print(f"OpenAI API Error ({stage}/{model}): {response.status_code} - {response.text}")
+                self.record_llm_call(stage, model, started, success=False)
                 return None
-                
+
+        except Exception as e:
+            print(f"Error calling OpenAI API ({stage}/{model}): {e}")
+            self.record_llm_call(stage, model, started, success=False)
+            return None
+
+    def record_llm_call(self, stage, model, started, prompt_tokens=0, completion_tokens=0, success=True):
+        """Record an LLM call in the global stage metrics and this assessment's usage log"""
+        duration = time.perf_counter() - started
+        stage_metrics.record(stage, duration, model, prompt_tokens, completion_tokens, success)
+        self.llm_usage.append({
+            'stage': stage,
+            'model': model,
+            'latency_ms': round(duration * 1000, 1),
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'success': success
+        })
+
+    def stream_openai_json_array(self, messages, array_key, on_element=None, temperature=0.1, stage="default"):
+        """Stream a chat completion and hand each element of `array_key` to on_element as it completes.
+
+        Returns the list of parsed elements, or None if the call failed before anything was parsed.
+        """
+        route = model_router.resolve(stage)
+        model = route['model']
+        started = time.perf_counter()
+        parser = IncrementalJSONArrayParser(array_key)
+        full_text = []
+        usage = {}
+        try:
+            current_openai_key = os.getenv("OPENAI_API_KEY", "")
+
+            url = provider_url('openai', '/chat/completions')
+            headers = {
+                "Authorization": f"Bearer {current_openai_key}",
+                "Content-Type": "application/json"
+            }
+            data = {
+                "model": model,
+                "messages": messages,
+                "max_tokens": route['max_tokens'],
+                "temperature": temperature,
+                "stream": True,
+                "stream_options": {"include_usage": True}
+            }
+
+            with self.provider_request('openai', 'POST', url, route['timeout'], headers=headers, json=data, stream=True) as response:
+                if response.status_code != 200:
+                    print(f"OpenAI streaming error ({stage}/{model}): {response.status_code} - {response.text}")
+                    self.record_llm_call(stage, model, started, success=False)
+                    return None
+
+                for line in response.iter_lines(decode_unicode=True):
+                    if self.deadline.exhausted():
+                        raise ProviderUnavailableError("assessment deadline reached while streaming")
+                    if not line or not line.startswith('data:'):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == '[DONE]':
+                        break
+
+                    chunk = json.loads(payload)
+                    if chunk.get('usage'):
+                        usage = chunk['usage']
+                    for choice in chunk.get('choices', []):
+                        delta = (choice.get('delta') or {}).get('content')
+                        if delta:
+                            full_text.append(delta)
+                            for element in parser.feed(delta):
+                                if on_element:
+                                    on_element(element)
+
+            self.record_llm_call(stage, model, started, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0))
+
+            # The model may have formatted the JSON in a way the parser never saw the array start
+            if not parser.elements and full_text:
+                try:
+                    parsed = json.loads(clean_json_response("".join(full_text)))
+                    for element in parsed.get(array_key, []):
+                        parser.elements.append(element)
+                        if on_element:
+                            on_element(element)
+                except (json.JSONDecodeError, AttributeError) as e:
+                    print(f"Error parsing streamed response ({stage}): {e}")
+
+            return parser.elements
+
         except Exception as e:
-            print(f"Error calling OpenAI API: {e}")
-            return None
+            print(f"Error streaming OpenAI API ({stage}/{model}): {e}")
+            self.record_llm_call(stage, model, started, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0), success=False)
+            # Keep whatever arrived before the failure
+            return parser.elements or None
     
     # NEW: Modern Slavery Statement Analysis Functions
     def analyze_modern_slavery_statement_if_recent(self, company_name):
@@ -206,7 +3451,7 @@ class EnhancedModernSlaveryAssessment:
             for query in statement_queries:
                 try:
                     print(f"🔍 Statement search: {query}")
-                    tavily_results = self.tavily_client.search(
+                    tavily_results = self.tavily_search(
                         query=query,
                         search_depth="advanced",
                         max_results=3,
@@ -241,7 +3486,7 @@ class EnhancedModernSlaveryAssessment:
                                 else:
                                     print(f"⚠️ Found Modern Slavery Statement but too old ({publication_year})")
                     
-                    time.sleep(0.5)  # Rate limiting between queries
+                    self.rate_limit_pause(0.5)  # Rate limiting between queries
                     
                 except Exception as query_error:
                     print(f"❌ Error with statement query '{query}': {query_error}")
@@ -331,7 +3576,7 @@ class EnhancedModernSlaveryAssessment:
                 {"role": "user", "content": analysis_prompt}
             ]
             
-            ai_response = self.call_openai_api(messages, max_tokens=800, temperature=0.1)
+            ai_response = self.call_openai_api(messages, temperature=0.1, stage="statement_analysis")
             
             if ai_response:
                 try:
@@ -408,7 +3653,7 @@ class EnhancedModernSlaveryAssessment:
                 {"role": "user", "content": prompt}
             ]
             
-            ai_response = self.call_openai_api(messages, max_tokens=1000, temperature=0.1)
+            ai_response = self.call_openai_api(messages, temperature=0.1, stage="operational_assessment")
             
             if ai_response:
                 try:
@@ -443,11 +3688,15 @@ class EnhancedModernSlaveryAssessment:
             }
     
     # MODIFIED: Enhanced hybrid risk assessment with Modern Slavery Statement integration
-    def calculate_hybrid_risk_assessment(self, company_name, profile, geographic_risk, industry_risk, enhanced_api_data):
-        """Calculate risk using hybrid approach: dataset governance + AI operational + Modern Slavery Statement analysis"""
+    def calculate_hybrid_risk_assessment(self, company_name, profile, geographic_risk, industry_risk, enhanced_api_data, use_ai=True):
+        """Calculate risk using hybrid approach: dataset governance + AI operational + Modern Slavery Statement analysis
+
+        With use_ai=False (quick tier) the statement analysis is skipped and operational
+        scores use the conservative defaults, so no LLM or network calls are made.
+        """
         
         # Step 1: Check governance dataset
-        governance_data = self.governance_manager.get_company_governance_score(company_name)
+        governance_data = self.governance_manager.get_company_governance_score(company_name, self.company_id)
         
         if governance_data:
             print(f"✅ Found {company_name} in governance dataset")
@@ -457,6 +3706,14 @@ class EnhancedModernSlaveryAssessment:
             confidence = "high"
             statement_analysis = None
             
+        elif not use_ai:
+            print(f"⚠️ {company_name} not found in governance dataset, quick assessment uses local scoring only")
+            history_modifier = 1.0
+            governance_score = 0
+            data_source = "local_scoring"
+            confidence = "low"
+            statement_analysis = None
+            
         else:
             print(f"⚠️ {company_name} not found in governance dataset, checking for Modern Slavery Statement")
             history_modifier = 1.0
@@ -493,7 +3750,19 @@ class EnhancedModernSlaveryAssessment:
             'business_model': profile.get('business_model', '')
         }
         
-        operational_assessment = self.assess_operational_mitigation_with_ai(company_name, company_context)
+        if use_ai:
+            operational_assessment = self.assess_operational_mitigation_with_ai(company_name, company_context)
+        else:
+            # Same conservative scores as the AI fallback
+            operational_assessment = {
+                "due_diligence_score": 12,
+                "supply_chain_mapping_score": 8,
+                "worker_protection_score": 6,
+                "evidence_quality": "low",
+                "key_findings": ["Operational practices not assessed in a quick assessment"],
+                "data_gaps": ["All operational areas"],
+                "assessment_method": "quick_default"
+            }
         
         # Step 3: Calculate total mitigation score
         total_mitigation_score = (
@@ -507,26 +3776,19 @@ class EnhancedModernSlaveryAssessment:
         final_mitigation_score = total_mitigation_score * history_modifier
         
         # UPDATED: Less generous risk reduction (max 50% instead of 75%)
-        max_possible_score = 100  # 35 + 30 + 20 + 15
-        risk_reduction_factor = min(final_mitigation_score / max_possible_score * 0.5, 0.5)
+        params = HYBRID_SCORING_PARAMS
+        max_possible_score = sum(params['component_max_scores'].values())  # 35 + 30 + 20 + 15
+        risk_reduction_factor = min(final_mitigation_score / max_possible_score * params['max_risk_reduction'],
+                                    params['max_risk_reduction'])
         
         # Step 4: Calculate final risk score
         inherent_score = (geographic_risk['score'] + industry_risk['score']) / 2
         final_risk_score = inherent_score * (1 - risk_reduction_factor)
-        final_risk_score = max(5, min(95, final_risk_score))
+        final_risk_score = max(params['final_score_bounds'][0], min(params['final_score_bounds'][1], final_risk_score))
         
         # UPDATED: Use new risk level thresholds
-        if final_risk_score >= 75: risk_level = "Very High"
-        elif final_risk_score >= 55: risk_level = "High"
-        elif final_risk_score >= 35: risk_level = "Medium"
-        elif final_risk_score >= 20: risk_level = "Low"
-        else: risk_level = "Very Low"
-        
-        if risk_reduction_factor >= 0.4: grade = 'A'
-        elif risk_reduction_factor >= 0.3: grade = 'B'
-        elif risk_reduction_factor >= 0.2: grade = 'C'
-        elif risk_reduction_factor >= 0.1: grade = 'D'
-        else: grade = 'F'
+        risk_level = threshold_label(final_risk_score, params['risk_level_thresholds'], "Very Low")
+        grade = threshold_label(risk_reduction_factor, params['grade_thresholds'], 'F')
         
         return {
             'final_risk_score': round(final_risk_score, 1),
@@ -547,10 +3809,32 @@ class EnhancedModernSlaveryAssessment:
                 'confidence_level': confidence,
                 'governance_from_dataset': governance_data is not None,
                 'governance_from_statement': statement_analysis is not None and statement_analysis.get('found', False),
-                'assessment_date': date.today().isoformat()
+                'assessment_date': date.today().isoformat(),
+                'risk_index_version': get_risk_indexes().active_version
             }
         }
 
+    def get_dataset_company_profile(self, company_name):
+        """Company profile from the governance dataset alone (quick tier)"""
+        record = self.governance_manager.get_company_governance_score(company_name, self.company_id) or {}
+        headquarters = ISO2_COUNTRY_NAMES.get(record.get('Headquarters'))
+        industries = split_sectors(record.get('Sectors'))
+        
+        return {
+            "name": company_name,
+            "headquarters": headquarters,
+            "primary_industry": industries[0] if industries else "Unknown",
+            "revenue": "Unknown",
+            "operating_countries": [headquarters] if headquarters else [],
+            "all_industries": industries,
+            "employees": None,
+            "business_model": "",
+            "supply_chain_complexity": "unknown",
+            "known_controversies": [],
+            "risk_indicators": [],
+            "profile_source": "governance_dataset" if record else "none"
+        }
+
     # UPDATED: Enhanced company profile with revenue
     def get_company_profile(self, company_name):
         """Enhanced company profile with AI intelligence including revenue"""
@@ -595,7 +3879,7 @@ class EnhancedModernSlaveryAssessment:
                 """}
             ]
             
-            ai_response = self.call_openai_api(messages, max_tokens=1000, temperature=0.1)
+            ai_response = self.call_openai_api(messages, temperature=0.1, stage="company_profile")
             
             if ai_response:
                 try:
@@ -642,7 +3926,7 @@ class EnhancedModernSlaveryAssessment:
                 country_scores = [COUNTRY_RISK_INDEX.get(country, 50) for country in operating_countries]
                 avg_operating_risk = sum(country_scores) / len(country_scores)
                 # 60% headquarters, 40% average of operating countries
-                final_score = int(0.6 * hq_risk + 0.4 * avg_operating_risk)
+                final_score = int(HQ_RISK_WEIGHT * hq_risk + OPERATIONS_RISK_WEIGHT * avg_operating_risk)
             else:
                 final_score = hq_risk
         else:
@@ -678,27 +3962,9 @@ class EnhancedModernSlaveryAssessment:
         industry_scores = []
         risk_details = []
         
-        # STRICTER high-risk business model keywords
-        high_risk_keywords = {
-            "fast fashion": 95,
-            "ultra fast fashion": 98,
-            "disposable fashion": 95,
-            "athletic apparel": 88,  # NEW: Nike/Adidas etc
-            "footwear": 90,          # NEW: Shoe manufacturing
-            "sportswear": 88,        # NEW: Sports brands
-            "apparel": 85,           # NEW: General clothing
-            "garment": 90,
-            "textile": 85,
-            "manufacturing": 70,
-            "mining": 88,
-            "construction": 80
-        }
-        
-        business_model_lower = business_model.lower() if business_model else ""
-        for keyword, score in high_risk_keywords.items():
-            if keyword in business_model_lower:
-                industry_scores.append(score)
-                risk_details.append(f"High-risk business model: {keyword} (score: {score})")
+        for keyword, score in business_model_risk_keywords(business_model):
+            industry_scores.append(score)
+            risk_details.append(f"High-risk business model: {keyword} (score: {score})")
         
         # Enhanced industry matching with STRICTER scores
         for industry in industries:
@@ -706,24 +3972,16 @@ class EnhancedModernSlaveryAssessment:
             best_match = None
             
             # Special handling for athletic/footwear brands
-            industry_lower = industry.lower()
-            if any(term in industry_lower for term in ["athletic", "sport", "footwear", "apparel", "fashion"]):
-                best_score = 85  # Minimum score for clothing/footwear
+            if is_athletic_apparel_industry(industry):
+                best_score = ATHLETIC_APPAREL_MIN_RISK  # Minimum score for clothing/footwear
                 best_match = "Athletic Apparel/Footwear"
             
             # Original matching logic
-            for risk_industry, score in INDUSTRY_RISK_INDEX.items():
-                industry_words = industry.lower().split()
-                risk_words = risk_industry.lower().split()
-                
-                if (any(word in risk_industry.lower() for word in industry_words) or
-                    any(word in industry.lower() for word in risk_words) or
-                    industry.lower() in risk_industry.lower() or 
-                    risk_industry.lower() in industry.lower()):
-                    
-                    if score > best_score:  # Take highest risk, not most extreme
-                        best_match = risk_industry
-                        best_score = score
+            for risk_industry in industry_risk_matches(industry):
+                score = INDUSTRY_RISK_INDEX[risk_industry]
+                if score > best_score:  # Take highest risk, not most extreme
+                    best_match = risk_industry
+                    best_score = score
             
             if best_match and best_score > 50:
                 industry_scores.append(best_score)
@@ -778,34 +4036,24 @@ class EnhancedModernSlaveryAssessment:
                 """}
             ]
             
-            ai_response = self.call_openai_api(messages, max_tokens=1500, temperature=0.1)
-            
-            if ai_response:
-                try:
-                    cleaned_response = clean_json_response(ai_response)
-                    location_data = json.loads(cleaned_response)
-                    
-                    # Enhance with geocoding and risk data
-                    enhanced_locations = []
-                    for site in location_data.get('manufacturing_sites', []):
-                        coordinates = self.geocode_location(f"{site['city']}, {site['country']}")
-                        
-                        # Add country risk level
-                        country_risk = COUNTRY_RISK_INDEX.get(site['country'], 50)
+            # NEW: Stream the site list and geocode each site while the rest is still being generated
+            if llm_streaming_enabled():
+                streamed_locations = self.get_streamed_manufacturing_locations(messages)
+                if streamed_locations:
+                    return streamed_locations
+            else:
+                ai_response = self.call_openai_api(messages, temperature=0.1, stage="manufacturing_locations")
+                
+                if ai_response:
+                    try:
+                        cleaned_response = clean_json_response(ai_response)
+                        location_data = json.loads(cleaned_response)
                         
-                        enhanced_site = {
-                            **site,
-                            'coordinates': coordinates,
-                            'country_risk_score': country_risk,
-                            'country_risk_level': self.score_to_level(country_risk)
-                        }
+                        # Enhance with geocoding and risk data
+                        return [self.enhance_manufacturing_site(site) for site in location_data.get('manufacturing_sites', [])]
                         
-                        enhanced_locations.append(enhanced_site)
-                    
-                    return enhanced_locations
-                    
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing location data: {e}")
+                    except json.JSONDecodeError as e:
+                        print(f"Error parsing location data: {e}")
             
             # Fallback: create basic locations from operating countries
             fallback_locations = []
@@ -829,10 +4077,49 @@ class EnhancedModernSlaveryAssessment:
             print(f"Error getting manufacturing locations: {e}")
             return []
 
+    def enhance_manufacturing_site(self, site):
+        """Add coordinates and country risk data to an AI-supplied manufacturing site"""
+        coordinates = self.geocode_location(f"{site.get('city', '')}, {site.get('country', '')}")
+        
+        # Add country risk level
+        country_risk = COUNTRY_RISK_INDEX.get(site.get('country'), 50)
+        
+        return {
+            **site,
+            'coordinates': coordinates,
+            'country_risk_score': country_risk,
+            'country_risk_level': self.score_to_level(country_risk)
+        }
+
+    def get_streamed_manufacturing_locations(self, messages):
+        """Stream manufacturing sites from the LLM, geocoding each one as soon as it is parsed"""
+        # Single worker keeps Nominatim at one request per second while the stream keeps flowing
+        geocoder = ThreadPoolExecutor(max_workers=1)
+        pending_sites = []
+        try:
+            sites = self.stream_openai_json_array(
+                messages,
+                'manufacturing_sites',
+                on_element=lambda site: pending_sites.append(geocoder.submit(self.enhance_manufacturing_site, site)),
+                temperature=0.1,
+                stage="manufacturing_locations"
+            )
+            if not sites:
+                return []
+            
+            print(f"📍 Streamed {len(sites)} manufacturing sites, finishing geocoding...")
+            return [future.result() for future in pending_sites]
+        finally:
+            geocoder.shutdown(wait=False, cancel_futures=True)
+
     def geocode_location(self, location_query):
+        """Geocode location, cached across assessments (hits skip the Nominatim rate-limit pause)"""
+        return self.cached('geocode', " ".join(location_query.lower().split()), self.fetch_geocode, location_query)
+
+    def fetch_geocode(self, location_query):
         """Geocode location using free OpenStreetMap Nominatim API"""
         try:
-            url = "https://nominatim.openstreetmap.org/search"
+            url = provider_url('nominatim', '/search')
             params = {
                 'q': location_query,
                 'format': 'json',
@@ -842,8 +4129,8 @@ class EnhancedModernSlaveryAssessment:
                 'User-Agent': 'ModernSlaveryAssessmentTool/1.0'
             }
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            time.sleep(1)  # Respect rate limits
+            response = self.provider_request('nominatim', 'GET', url, 10, params=params, headers=headers)
+            self.rate_limit_pause(1)  # Respect rate limits
             
             if response.status_code == 200:
                 data = response.json()
@@ -989,11 +4276,11 @@ class EnhancedModernSlaveryAssessment:
                 print(f"🌍 Fetching data for {country} (mapped to: {wb_country})")
                 
                 # World Bank API for GDP per capita
-                wb_url = f"https://api.worldbank.org/v2/country/{wb_country}/indicator/NY.GDP.PCAP.CD"
+                wb_url = provider_url('worldbank', f"/country/{wb_country}/indicator/NY.GDP.PCAP.CD")
                 params = {'format': 'json', 'date': '2022:2023', 'per_page': 5}
                 
                 try:
-                    response = requests.get(wb_url, params=params, timeout=15)
+                    response = self.provider_request('worldbank', 'GET', wb_url, 15, params=params)
                     print(f"📊 World Bank API response for {country}: {response.status_code}")
                     
                     if response.status_code == 200:
@@ -1026,7 +4313,7 @@ class EnhancedModernSlaveryAssessment:
                 except Exception as country_error:
                     print(f"❌ Error fetching data for {country}: {country_error}")
                 
-                time.sleep(1)  # Rate limiting
+                self.rate_limit_pause(1)  # Rate limiting
             
             # If no real data, add some sample data for testing
             if not economic_data and countries:
@@ -1053,74 +4340,15 @@ class EnhancedModernSlaveryAssessment:
         try:
             print(f"📰 Getting focused news data for {company_name} via Tavily")
             
-            enhanced_news = []
-            
-            # Targeted searches - BOTH company name AND modern slavery terms required
-            news_queries = [
-                f'"{company_name}" AND ("modern slavery" OR "forced labor") -wikipedia -definition',
-                f'"{company_name}" AND ("labor violations" OR "worker exploitation") -wikipedia'
-            ]
-            
-            for query in news_queries:
-                try:
-                    print(f"🔍 News search: {query}")
-                    tavily_results = self.tavily_client.search(
-                        query=query,
-                        search_depth="advanced",
-                        max_results=2,
-                        include_answer=False,
-                        include_raw_content=False
-                    )
-                    
-                    if tavily_results and 'results' in tavily_results:
-                        for result in tavily_results['results']:
-                            # Quality filtering - check relevance
-                            title = result.get('title', '').lower()
-                            content = result.get('content', '').lower()
-                            url = result.get('url', '').lower()
-                            
-                            # Must contain BOTH company name AND modern slavery topics
-                            company_mentioned = company_name.lower() in title or company_name.lower() in content
-                            
-                            relevant_keywords = [
-                                'modern slavery', 'forced labor', 'human trafficking', 
-                                'labor violation', 'worker exploitation', 'supply chain audit',
-                                'labor investigation', 'worker rights', 'child labor'
-                            ]
-                            
-                            slavery_topic_mentioned = any(keyword in title or keyword in content for keyword in relevant_keywords)
-                            
-                            # Skip irrelevant content
-                            skip_keywords = [
-                                'wikipedia', 'definition of', 'what is modern slavery',
-                                'general information', 'historical context', 'academic research',
-                                'stock price', 'earnings report', 'financial results',
-                                'biography', 'company history', 'product launch'
-                            ]
-                            
-                            should_skip = any(skip_term in title or skip_term in content or skip_term in url for skip_term in skip_keywords)
-                            
-                            # Only include if genuinely relevant and not irrelevant
-                            if company_mentioned and slavery_topic_mentioned and not should_skip:
-                                enhanced_news.append({
-                                    'title': result.get('title', 'No title'),
-                                    'url': result.get('url', ''),
-                                    'date': result.get('published_date', '2024'),
-                                    'content_preview': result.get('content', '')[:200],
-                                    'domain': result.get('url', '').split('/')[2] if result.get('url') else 'unknown',
-                                    'language': 'en',
-                                    'relevance': 'high',
-                                    'source': 'tavily_real'  # MARK AS REAL DATA
-                                })
-                                
-                                # Stop at 3 high-quality results total
-                                if len(enhanced_news) >= 3:
-                                    break
-                    
-                    time.sleep(0.5)  # Rate limiting
-                    
-                except Exception as query_error:
-                    print(f"❌ Error with news query '{query}': {query_error}")
+            # NEW: Only results newer than the last check are fetched for a resolved company
+            if self.company_id is None:
+                enhanced_news = self.fetch_enhanced_news(
+                    company_name, datetime.now() - timedelta(days=self.news_window_days))[0]
+            else:
+                enhanced_news = get_news_store().refresh(
+                    self.company_id, 'tavily', self.news_window_days,
+                    lambda since: self.fetch_enhanced_news(company_name, since), 'date', limit=3
+                )
             
             # FIXED: If no real results found, return empty array with clear message
             if enhanced_news:
@@ -1135,6 +4363,84 @@ class EnhancedModernSlaveryAssessment:
             print(f"📰 No recent modern slavery-related news available for {company_name}")
             return []  # RETURN EMPTY - NO FAKE DATA
 
+    def fetch_enhanced_news(self, company_name, since):
+        """Relevant Tavily results published after since; returns (articles, every query succeeded)"""
+        enhanced_news = []
+        complete = True
+        
+        # Targeted searches - BOTH company name AND modern slavery terms required
+        news_queries = [
+            f'"{company_name}" AND ("modern slavery" OR "forced labor") -wikipedia -definition',
+            f'"{company_name}" AND ("labor violations" OR "worker exploitation") -wikipedia'
+        ]
+        
+        for query in news_queries:
+            try:
+                print(f"🔍 News search: {query}")
+                tavily_results = self.tavily_search(
+                    query=query,
+                    search_depth="advanced",
+                    max_results=2,
+                    include_answer=False,
+                    include_raw_content=False,
+                    start_date=since.strftime('%Y-%m-%d')
+                )
+                
+                if tavily_results and 'results' in tavily_results:
+                    for result in tavily_results['results']:
+                        # Quality filtering - check relevance
+                        title = result.get('title', '').lower()
+                        content = result.get('content', '').lower()
+                        url = result.get('url', '').lower()
+                        
+                        # Must contain BOTH company name AND modern slavery topics
+                        company_mentioned = get_company_resolver().mentions(
+                            self.company_id, company_name, f"{title} {content}"
+                        )
+                        
+                        relevant_keywords = [
+                            'modern slavery', 'forced labor', 'human trafficking', 
+                            'labor violation', 'worker exploitation', 'supply chain audit',
+                            'labor investigation', 'worker rights', 'child labor'
+                        ]
+                        
+                        slavery_topic_mentioned = any(keyword in title or keyword in content for keyword in relevant_keywords)
+                        
+                        # Skip irrelevant content
+                        skip_keywords = [
+                            'wikipedia', 'definition of', 'what is modern slavery',
+                            'general information', 'historical context', 'academic research',
+                            'stock price', 'earnings report', 'financial results',
+                            'biography', 'company history', 'product launch'
+                        ]
+                        
+                        should_skip = any(skip_term in title or skip_term in content or skip_term in url for skip_term in skip_keywords)
+                        
+                        # Only include if genuinely relevant and not irrelevant
+                        if company_mentioned and slavery_topic_mentioned and not should_skip:
+                            enhanced_news.append({
+                                'title': result.get('title', 'No title'),
+                                'url': result.get('url', ''),
+                                'date': result.get('published_date', '2024'),
+                                'content_preview': result.get('content', '')[:200],
+                                'domain': result.get('url', '').split('/')[2] if result.get('url') else 'unknown',
+                                'language': 'en',
+                                'relevance': 'high',
+                                'source': 'tavily_real'  # MARK AS REAL DATA
+                            })
+                            
+                            # Stop at 3 high-quality results total
+                            if len(enhanced_news) >= 3:
+                                break
+                
+                self.rate_limit_pause(0.5)  # Rate limiting
+                
+            except Exception as query_error:
+                print(f"❌ Error with news query '{query}': {query_error}")
+                complete = False
+        
+        return enhanced_news, complete
+
     def analyze_api_risk_factors(self, enhanced_data):
         """Analyze risk factors from API data with IMPROVED logic"""
         risk_factors = []
@@ -1345,7 +4651,7 @@ class EnhancedModernSlaveryAssessment:
                 """}
             ]
             
-            ai_response = self.call_openai_api(messages, max_tokens=2000, temperature=0.1)
+            ai_response = self.call_openai_api(messages, temperature=0.1, stage="industry_analysis")
             
             if ai_response:
                 try:
@@ -1364,7 +4670,7 @@ class EnhancedModernSlaveryAssessment:
         """Get ESG performance data using free APIs"""
         try:
             # Use GDELT to find ESG-related news for the industry
-            gdelt_url = "https://api.gdeltproject.org/api/v2/doc/doc"
+            gdelt_url = provider_url('gdelt', '/doc/doc')
             
             params = {
                 'query': f'"{industry}" AND ("ESG" OR "sustainability" OR "labor practices" OR "supply chain" OR "modern slavery")',
@@ -1373,7 +4679,7 @@ class EnhancedModernSlaveryAssessment:
                 'format': 'json'
             }
             
-            response = requests.get(gdelt_url, params=params, timeout=15)
+            response = self.provider_request('gdelt', 'GET', gdelt_url, 15, params=params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -1401,7 +4707,7 @@ class EnhancedModernSlaveryAssessment:
             recent_incidents = 0
             
             # GDELT for incident tracking
-            gdelt_url = "https://api.gdeltproject.org/api/v2/doc/doc"
+            gdelt_url = provider_url('gdelt', '/doc/doc')
             
             incident_queries = [
                 f'"{industry}" AND ("forced labor" OR "modern slavery" OR "labor violation")',
@@ -1416,7 +4722,7 @@ class EnhancedModernSlaveryAssessment:
                     'format': 'json'
                 }
                 
-                response = requests.get(gdelt_url, params=params, timeout=10)
+                response = self.provider_request('gdelt', 'GET', gdelt_url, 10, params=params)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -1436,7 +4742,7 @@ class EnhancedModernSlaveryAssessment:
                             except ValueError:
                                 pass
                 
-                time.sleep(0.5)  # Rate limiting
+                self.rate_limit_pause(0.5)  # Rate limiting
             
             # Calculate industry incident risk level
             incident_risk = 'high' if total_incidents > 100 else 'medium' if total_incidents > 20 else 'low'
@@ -1505,7 +4811,11 @@ class EnhancedModernSlaveryAssessment:
             print(f"Getting dynamic industry benchmark for {primary_industry}...")
             
             # Step 1: Use OpenAI to get comprehensive industry intelligence
-            industry_intelligence = self.get_ai_industry_analysis(primary_industry, all_industries)
+            industry_intelligence = self.cached(
+                'industry_analysis',
+                (str(primary_industry).lower(), tuple(sorted(str(industry).lower() for industry in all_industries or []))),
+                self.get_ai_industry_analysis, primary_industry, all_industries
+            )
             
             # Step 2: Get ESG/CSR data from free sources
             esg_data = self.get_industry_esg_data(primary_industry)
@@ -1524,102 +4834,85 @@ class EnhancedModernSlaveryAssessment:
             print(f"Error getting dynamic industry benchmark: {e}")
             return None
 
-    def calculate_dynamic_percentile(self, company_score, industry_avg, risk_distribution):
-        """Calculate percentile based on actual industry distribution"""
-        try:
-            if not risk_distribution:
-                # Fallback to simple calculation
-                return self.calculate_percentile(company_score, industry_avg)
-            
-            # Use actual distribution if available
-            low_pct = risk_distribution.get('low', 30)
-            medium_pct = risk_distribution.get('medium', 50)
-            high_pct = risk_distribution.get('high', 20)
-            
-            if company_score <= 35:
-                return f"Top {low_pct}% (Low Risk)"
-            elif company_score <= 65:
-                return f"Middle {medium_pct}% (Medium Risk)"
-            else:
-                return f"Bottom {high_pct}% (High Risk)"
-                
-        except Exception as e:
-            return "Percentile calculation unavailable"
-
-    def calculate_percentile(self, company_score, industry_avg):
-        """Calculate approximate percentile ranking"""
-        # Simplified percentile calculation
-        if company_score <= industry_avg - 20:
-            return "Top 10%"
-        elif company_score <= industry_avg - 10:
-            return "Top 25%"
-        elif company_score <= industry_avg + 5:
-            return "Average (50th percentile)"
-        elif company_score <= industry_avg + 15:
-            return "Below average (75th percentile)"
-        else:
-            return "Bottom 10%"
+    def generate_industry_comparison(self, company_score, company_industries, primary_industry,
+                                     governance_score=None, company_id=None, headquarters=None):
+        """Generate dynamic industry comparison
 
-    def generate_industry_comparison(self, company_score, company_industries, primary_industry):
-        """Generate dynamic industry comparison"""
+        Averages, percentile and peers come from the governance dataset: the company's governance
+        score (0-35, higher is better) is compared with its sector in the sector benchmark index,
+        and peer companies come from the local peer finder. The AI industry benchmark only adds
+        common risks, best practices and regulatory focus, when INDUSTRY_BENCHMARK_LLM_ENABLED is set.
+        """
         try:
-            # Get dynamic benchmark data
-            benchmark_data = self.get_dynamic_industry_benchmark(
-                "", primary_industry, company_industries
-            )
-            
-            if not benchmark_data:
+            industries = [primary_industry] + list(company_industries or [])
+            benchmarks = get_sector_benchmarks()
+            if governance_score is not None:
+                dataset_benchmark = benchmarks.benchmark(governance_score, company_id, industries)
+                distribution = dataset_benchmark
+            else:
+                dataset_benchmark = None
+                distribution = benchmarks.distribution(benchmarks.benchmark_sector(company_id, industries))
+            if not distribution:
                 return None
             
-            industry_avg = benchmark_data['industry_average_score']
-            performance_vs_peers = "above average" if company_score < industry_avg else "below average"
-            score_difference = abs(company_score - industry_avg)
-            
-            # Calculate percentile based on industry distribution
-            percentile = self.calculate_dynamic_percentile(
-                company_score, 
-                industry_avg, 
-                benchmark_data.get('performance_insights', {}).get('risk_distribution', {})
+            industry_avg = distribution['average_score']
+            if governance_score is not None:
+                performance_vs_peers = "above average" if governance_score >= industry_avg else "below average"
+                score_difference = round(abs(governance_score - industry_avg), 1)
+                percentile = dataset_benchmark['percentile_ranking']
+            else:
+                performance_vs_peers = score_difference = None
+                percentile = "Unavailable (no governance score)"
+            peers = get_peer_finder().find_peers(
+                k=8, company_id=company_id, headquarters=headquarters, governance_score=governance_score,
+                sectors=benchmarks.sectors_for(industries=industries)
             )
             
+            benchmark_data = {}
+            if INDUSTRY_BENCHMARK_LLM_ENABLED:
+                benchmark_data = self.get_dynamic_industry_benchmark("", primary_industry, company_industries) or {}
+            
             return {
-                "matched_industry": benchmark_data['matched_industry'],
+                "matched_industry": distribution['sector'],
                 "industry_average_score": industry_avg,
-                "company_score": company_score,
+                "company_score": governance_score,
+                "risk_score": company_score,
+                "score_max": 35,  # Governance scores: higher is better
                 "performance_vs_peers": performance_vs_peers,
                 "score_difference": score_difference,
                 "percentile_ranking": percentile,
-                "peer_companies": benchmark_data['peer_companies'],
-                "industry_common_risks": benchmark_data['industry_common_risks'],
-                "industry_best_practices": benchmark_data['industry_best_practices'],
-                "regulatory_focus": benchmark_data['regulatory_focus'],
+                "dataset_benchmark": dataset_benchmark,
+                "peer_companies": [peer['name'] for peer in peers],
+                "peer_details": peers,
+                "industry_common_risks": benchmark_data.get('industry_common_risks', []),
+                "industry_best_practices": benchmark_data.get('industry_best_practices', []),
+                "regulatory_focus": benchmark_data.get('regulatory_focus', []),
                 "benchmark_insights": self.generate_benchmark_insights(
-                    company_score, industry_avg, performance_vs_peers, benchmark_data
+                    governance_score, distribution, performance_vs_peers, benchmark_data
                 ),
-                "data_quality": benchmark_data.get('benchmark_quality', 'medium'),
-                "last_updated": benchmark_data.get('last_updated')
+                "data_quality": "high" if distribution['companies'] >= SECTOR_BENCHMARK_MIN_COMPANIES else "medium",
+                "last_updated": datetime.now().strftime("%Y-%m-%d")
             }
             
         except Exception as e:
             print(f"Error generating dynamic industry comparison: {e}")
             return None
 
-    def generate_benchmark_insights(self, company_score, industry_avg, performance, benchmark_data):
-        """Generate insights based on dynamic benchmark data"""
+    def generate_benchmark_insights(self, governance_score, distribution, performance, benchmark_data):
+        """Generate insights from the sector distribution (and the AI benchmark, when enabled)"""
         insights = []
+        sector = distribution['sector']
+        industry_avg = distribution['average_score']
         
-        score_diff = abs(company_score - industry_avg)
-        
-        if performance == "above average":
-            insights.append(f"Company risk score is {score_diff} points below industry average of {industry_avg}")
-            insights.append("Performance is better than typical industry peers")
-            
-            # Add specific insights based on benchmark data
-            if benchmark_data.get('performance_insights', {}).get('esg_sentiment') == 'high':
-                insights.append("Industry has high ESG focus - company aligns with positive trend")
+        if governance_score is None:
+            insights.append(f"No governance score available to compare with the {sector} average of {industry_avg}/35")
+        elif performance == "above average":
+            insights.append(f"Governance score of {governance_score}/35 is {round(governance_score - industry_avg, 1)} points above the {sector} average of {industry_avg}")
+            if governance_score >= distribution['p75_score']:
+                insights.append(f"In the top quarter of {distribution['companies']} {sector} companies")
         else:
-            insights.append(f"Company risk score is {score_diff} points above industry average of {industry_avg}")
-            insights.append("Higher risk profile requires attention to industry-specific challenges")
+            insights.append(f"Governance score of {governance_score}/35 is {round(industry_avg - governance_score, 1)} points below the {sector} average of {industry_avg}")
+            insights.append(f"Reaching the sector median of {distribution['median_score']} would require stronger policies and due diligence disclosure")
             
             # Add specific improvement areas
             if benchmark_data.get('industry_common_risks'):
@@ -1668,21 +4961,24 @@ class EnhancedModernSlaveryAssessment:
                 {"role": "user", "content": context_prompt}
             ]
             
-            ai_response = self.call_openai_api(messages, max_tokens=200, temperature=0.1)
+            ai_response = self.call_openai_api(messages, temperature=0.1, stage="modern_slavery_summary")
             
             if ai_response and ai_response.strip():
                 return ai_response.strip()
             else:
-                # Fallback summary
-                risk_level = hybrid_assessment['final_risk_level'].lower()
-                industry = profile.get('primary_industry', 'this industry')
-                return f"{company_name} presents a {risk_level} modern slavery risk profile operating in {industry}. The company's risk assessment reflects both geographic and industry-specific factors. Enhanced due diligence and supply chain monitoring would strengthen their risk management approach."
+                return self.fallback_modern_slavery_summary(company_name, profile, hybrid_assessment)
                 
         except Exception as e:
             print(f"Error generating modern slavery summary: {e}")
             # Simple fallback
             return f"{company_name} has been assessed for modern slavery risks based on industry, geographic, and operational factors."
     
+    def fallback_modern_slavery_summary(self, company_name, profile, hybrid_assessment):
+        """Template summary used without the LLM (fallback and quick tier)"""
+        risk_level = hybrid_assessment['final_risk_level'].lower()
+        industry = profile.get('primary_industry', 'this industry')
+        return f"{company_name} presents a {risk_level} modern slavery risk profile operating in {industry}. The company's risk assessment reflects both geographic and industry-specific factors. Enhanced due diligence and supply chain monitoring would strengthen their risk management approach."
+
     # UPDATED: Stricter AI analysis for Nike-type companies
     def comprehensive_ai_analysis(self, company_data):
         """Enhanced AI analysis with STRICTER scoring for athletic/footwear brands"""
@@ -1765,7 +5061,7 @@ class EnhancedModernSlaveryAssessment:
                 {"role": "user", "content": context_prompt}
             ]
             
-            ai_response = self.call_openai_api(messages, max_tokens=2000, temperature=0.1)
+            ai_response = self.call_openai_api(messages, temperature=0.1, stage="comprehensive_analysis")
             
             if ai_response:
                 try:
@@ -1801,19 +5097,21 @@ class EnhancedModernSlaveryAssessment:
     # UPDATED: New risk level thresholds
     def score_to_level(self, score):
         """Enhanced risk level distribution with NEW thresholds"""
-        if score >= 75:
-            return "very-high"
-        elif score >= 55:
-            return "high"
-        elif score >= 35:
-            return "medium"
-        elif score >= 20:
-            return "low"
-        else:
-            return "very-low"
+        return risk_score_level(score)
     
     def search_news_incidents(self, company_name):
-        """Search for news about labor practices"""
+        """Search for news about labor practices; for a resolved company only articles newer
+        than the last check are fetched and merged into its stored set"""
+        if self.company_id is None:
+            return self.fetch_news_incidents(company_name, datetime.now() - timedelta(days=self.news_window_days))[0]
+        return get_news_store().refresh(
+            self.company_id, 'newsapi', self.news_window_days,
+            lambda since: self.fetch_news_incidents(company_name, since), 'publishedAt', limit=6
+        )
+
+    def fetch_news_incidents(self, company_name, since):
+        """NewsAPI articles published after since; returns (articles, every query succeeded)"""
+        news_results = []
         try:
             # Get fresh API key each time
             current_news_key = os.getenv("NEWS_API_KEY", "")
@@ -1824,19 +5122,19 @@ class EnhancedModernSlaveryAssessment:
                 f"{company_name} labor violations investigation"
             ]
             
-            news_results = []
+            complete = True
             for query in queries[:2]:
-                url = "https://newsapi.org/v2/everything"
+                url = provider_url('newsapi', '/everything')
                 params = {
                     'q': query,
                     'sortBy': 'publishedAt',
                     'pageSize': 3,
                     'apiKey': current_news_key,
                     'language': 'en',
-                    'from': (datetime.now() - timedelta(days=730)).strftime('%Y-%m-%d')  # 2 years
+                    'from': since.strftime('%Y-%m-%dT%H:%M:%S')
                 }
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = self.provider_request('newsapi', 'GET', url, 10, params=params)
                 if response.status_code == 200:
                     news_data = response.json()
                     for article in news_data.get('articles', []):
@@ -1847,60 +5145,152 @@ class EnhancedModernSlaveryAssessment:
                             'publishedAt': article['publishedAt'],
                             'source': article['source']['name']
                         })
+                else:
+                    complete = False
                 
-                time.sleep(0.5)
+                self.rate_limit_pause(0.5)
             
-            return news_results
+            return news_results, complete
             
         except Exception as e:
             print(f"Error searching news: {e}")
-            return []
+            return news_results, False
     
     # FIXED: Main assessment function with complete AI analysis + hybrid scoring
-    def assess_company(self, company_name):
-        """Main comprehensive assessment function with HYBRID approach - UPDATED VERSION"""
+    def cached(self, cache_name, key, func, *args, should_cache=None):
+        """Serve func(*args) from a shared stage cache; degraded results from a cancelled or
+        exhausted deadline are never cached"""
+        def cacheable(value):
+            return (value is not None and not self.deadline.is_cancelled() and not self.deadline.exhausted()
+                    and (should_cache is None or should_cache(value)))
+        return STAGE_CACHES[cache_name].get_or_compute(key, lambda: func(*args), cacheable, self.deadline.remaining())
+
+    def get_cached_company_profile(self, company_name):
+        """get_company_profile through the shared stage cache, keyed by self.company_id"""
+        return self.cached(
+            'company_profile', self.company_id,
+            self.get_company_profile, company_name,
+            should_cache=lambda profile: bool(profile.get('operating_countries'))  # Skip fallback profiles
+        )
+
+    def compute_deferred_section(self, section, context):
+        """Compute one of the heavy ASSESSMENT_SECTIONS from the stored assessment context"""
+        company_name = context['company_name']
+        self.company_id = self.company_id or context.get('company_id')
+        if section == 'supply-chain-map':
+            manufacturing_locations = self.run_stage(
+                'manufacturing_locations', self.get_manufacturing_locations,
+                company_name,
+                context['operating_countries']
+            )
+            supply_chain_map = self.run_stage(
+                'supply_chain_map', self.generate_supply_chain_map_data,
+                manufacturing_locations,
+                company_name
+            )
+            return {'manufacturing_locations': manufacturing_locations, 'supply_chain_map': supply_chain_map}
+        
+        if section == 'enhanced-news':
+            print("🚀 Getting enhanced API data...")
+            enhanced_api_data = self.run_stage(
+                'enhanced_api_data', self.enhance_assessment_with_apis,
+                company_name,
+                context['operating_countries']
+            )
+            return {'enhanced_data': enhanced_api_data}
+        
+        if section == 'industry-benchmark':
+            industry_comparison = self.run_stage(
+                'industry_benchmark', self.generate_industry_comparison,
+                context['final_risk_score'],  # Use hybrid score for benchmarking
+                context['all_industries'],
+                context['primary_industry'],
+                context.get('governance_score'),
+                context.get('company_id'),
+                context.get('headquarters')
+            )
+            return {'industry_benchmarking': industry_comparison}
+        
+        # hybrid-breakdown is always stored with the assessment itself
+        raise ValueError(f"Section '{section}' cannot be computed on demand")
+
+    def assess_company(self, company_name, plan=None):
+        """Main comprehensive assessment function with HYBRID approach - UPDATED VERSION
+
+        plan (see plan_assessment) selects the tier and stages; sections that are not run
+        are left out and computed on first request to /assessments/<assessment_id>/<section>.
+        """
         try:
-            print(f"Starting hybrid assessment for: {company_name}")
+            plan = plan or plan_assessment()
+            print(f"Starting hybrid assessment for: {company_name} ({plan['tier']})")
+            company = get_company_resolver().resolve(company_name, register=True)
+            self.company_id = company['company_id']
+            self.memory_record = memory_tracker.begin()
+            get_risk_indexes()  # Score with the active risk index version
             
             # Step 1: Build comprehensive company profile with AI (now includes revenue)
-            profile = self.get_company_profile(company_name)
+            if plan['use_ai']:
+                profile = self.run_stage('company_profile', self.get_cached_company_profile, company_name)
+            else:
+                profile = self.run_stage('dataset_profile', self.get_dataset_company_profile, company_name)
             print(f"Profile: {profile.get('name')} - {profile.get('primary_industry')} - Revenue: {profile.get('revenue', 'Unknown')}")
             
             # Step 2: Calculate enhanced geographic risk (using updated country scores)
-            geo_risk_score, geo_details = self.calculate_geographic_risk(
+            geo_risk_score, geo_details = self.run_stage(
+                'geographic_risk', self.calculate_geographic_risk,
                 profile.get('operating_countries', []),
                 profile.get('headquarters')
             )
             print(f"Geographic risk: {geo_risk_score}")
             
             # Step 3: Calculate enhanced industry risk (updated scores)
-            industry_risk_score, industry_details = self.calculate_industry_risk(
+            industry_risk_score, industry_details = self.run_stage(
+                'industry_risk', self.calculate_industry_risk,
                 profile.get('all_industries', []),
                 profile.get('business_model', '')
             )
             print(f"Industry risk: {industry_risk_score}")
             
-            # Step 4: Get manufacturing locations and map data
-            manufacturing_locations = self.get_manufacturing_locations(
-                company_name, 
-                profile.get('operating_countries', [])
-            )
+            assessment_id = f"HYBRID_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+            section_context = {
+                'company_name': company_name,
+                'company_id': self.company_id,
+                'operating_countries': profile.get('operating_countries', []),
+                'all_industries': profile.get('all_industries', []),
+                'primary_industry': profile.get('primary_industry'),
+                'headquarters': profile.get('headquarters')
+            }
             
-            supply_chain_map = self.generate_supply_chain_map_data(
-                manufacturing_locations, 
-                company_name
-            )
+            # Step 4: Get manufacturing locations and map data
+            if plan['supply-chain-map']:
+                section_data = self.compute_deferred_section('supply-chain-map', section_context)
+                manufacturing_locations = section_data['manufacturing_locations']
+                supply_chain_map = section_data['supply_chain_map']
+            else:
+                manufacturing_locations = supply_chain_map = None
             
             # Step 5: Gather news data
-            news_data = self.search_news_incidents(company_name)
+            if plan['news_search']:
+                news_data = self.run_stage(
+                    'news_search', self.cached, 'news_search', (self.company_id, self.news_window_days),
+                    self.search_news_incidents, company_name,
+                    should_cache=bool  # An empty result may just be a provider outage
+                )
+            else:
+                news_data = []
             print(f"Found {len(news_data)} news articles")
             
             # Step 6: Enhanced API data
-            print("🚀 Getting enhanced API data...")
-            enhanced_api_data = self.enhance_assessment_with_apis(
-                company_name,
-                profile.get('operating_countries', [])
+            if plan['enhanced-news']:
+                enhanced_api_data = self.compute_deferred_section('enhanced-news', section_context)['enhanced_data']
+            else:
+                enhanced_api_data = None
+            
+            # NEW: Both news sources merged into one de-duplicated, scored set
+            news_articles, news_merge_stats = self.run_stage(
+                'news_merge', merge_news_articles, news_data, (enhanced_api_data or {}).get('enhanced_news', [])
             )
+            print(f"📰 {news_merge_stats['unique']} unique news articles from {news_merge_stats['fetched']} fetched")
             
             # Step 7: ALWAYS run comprehensive AI analysis first
             geographic_risk = {'score': geo_risk_score, 'details': geo_details}
@@ -1910,32 +5300,51 @@ class EnhancedModernSlaveryAssessment:
                 'profile': profile,
                 'geographic_risk': geographic_risk,
                 'industry_risk': industry_risk,
-                'news': news_data
+                'news': news_articles
             }
             
-            print("Performing comprehensive AI analysis...")
-            ai_analysis = self.comprehensive_ai_analysis(company_data)
+            if plan['use_ai']:
+                print("Performing comprehensive AI analysis...")
+                ai_analysis = self.run_stage('comprehensive_analysis', self.comprehensive_ai_analysis, company_data)
+            else:
+                ai_analysis = {}
             
             # Step 8: THEN enhance with hybrid assessment for better scoring
-            hybrid_assessment = self.calculate_hybrid_risk_assessment(
-                company_name, profile, geographic_risk, industry_risk, enhanced_api_data
+            hybrid_assessment = self.run_stage(
+                'hybrid_assessment', self.calculate_hybrid_risk_assessment,
+                company_name, profile, geographic_risk, industry_risk, enhanced_api_data or {}, plan['use_ai']
             )
             
             # Step 9: Generate industry benchmarking using hybrid score
-            industry_comparison = self.generate_industry_comparison(
-                hybrid_assessment['final_risk_score'],  # Use hybrid score for benchmarking
-                profile.get('all_industries', []),
-                profile.get('primary_industry')
-            )
+            section_context['final_risk_score'] = hybrid_assessment['final_risk_score']
+            metadata = hybrid_assessment['assessment_metadata']
+            industries = [profile.get('primary_industry')] + profile.get('all_industries', [])
+            if metadata['governance_from_dataset'] or metadata['governance_from_statement']:
+                section_context['governance_score'] = hybrid_assessment['mitigation_assessment']['governance_score']
+                if metadata['governance_from_statement']:
+                    get_sector_benchmarks().add_assessed(self.company_id, industries, section_context['governance_score'])
+            if not metadata['governance_from_dataset']:
+                get_peer_finder().add_assessed(
+                    self.company_id, company['canonical_name'], get_sector_benchmarks().sectors_for(industries=industries),
+                    profile.get('headquarters'), section_context.get('governance_score')
+                )
+            if plan['industry-benchmark']:
+                industry_comparison = self.compute_deferred_section('industry-benchmark', section_context)['industry_benchmarking']
+            else:
+                industry_comparison = None
             
             # Step 10: Generate modern slavery summary
-            modern_slavery_summary = self.generate_modern_slavery_summary(
-                company_name, profile, hybrid_assessment, ai_analysis
-            )
+            if plan['use_ai']:
+                modern_slavery_summary = self.run_stage(
+                    'modern_slavery_summary', self.generate_modern_slavery_summary,
+                    company_name, profile, hybrid_assessment, ai_analysis
+                )
+            else:
+                modern_slavery_summary = self.fallback_modern_slavery_summary(company_name, profile, hybrid_assessment)
             
             # Step 11: Merge API risk factors with AI risk factors
             merged_risk_factors = ai_analysis.get('risk_factors', [])
-            if enhanced_api_data.get('api_risk_factors'):
+            if enhanced_api_data and enhanced_api_data.get('api_risk_factors'):
                 # Convert API risk factors to match AI format
                 for api_factor in enhanced_api_data['api_risk_factors']:
                     merged_risk_factors.append({
@@ -1947,7 +5356,11 @@ class EnhancedModernSlaveryAssessment:
             # Step 12: Format final response with COMPLETE data
             final_assessment = {
                 'company_name': company_name,
-                'assessment_id': f"HYBRID_{int(time.time())}",
+                'assessment_id': assessment_id,
+                
+                # NEW: Resolved entity (stable across name variants)
+                'company_id': self.company_id,
+                'canonical_name': company['canonical_name'],
                 'assessment_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 
                 # Use hybrid scoring for accuracy
@@ -2020,28 +5433,75 @@ class EnhancedModernSlaveryAssessment:
                 'industry_benchmarking': industry_comparison,
                 'enhanced_data': enhanced_api_data,
                 
+                # NEW: NewsAPI and Tavily articles de-duplicated (URL + near-duplicate text) and scored
+                'news_articles': news_articles,
+                
                 # FIXED: Data sources bug
                 'data_sources': {
                     'total_sources': (
-                        len(news_data) + 
+                        len(news_articles) + 
                         len(profile.get('operating_countries', [])) + 
                         len(profile.get('all_industries', [])) + 
-                        len(manufacturing_locations) + 
-                        len(enhanced_api_data.get('data_sources_used', []))
+                        len(manufacturing_locations or []) + 
+                        len((enhanced_api_data or {}).get('data_sources_used', []))
                     ),
-                    'news_articles': len(news_data),
+                    'news_articles': len(news_articles),
+                    'duplicate_news_articles': news_merge_stats['fetched'] - news_merge_stats['unique'],
                     'geographic_data': len(profile.get('operating_countries', [])),
                     'industry_data': len(profile.get('all_industries', [])),
-                    'manufacturing_sites': len(manufacturing_locations),
-                    'api_sources': len(enhanced_api_data.get('data_sources_used', [])),
+                    'manufacturing_sites': len(manufacturing_locations) if manufacturing_locations is not None else None,
+                    'api_sources': len(enhanced_api_data.get('data_sources_used', [])) if enhanced_api_data is not None else None,
                     'governance_dataset': hybrid_assessment['assessment_metadata']['governance_from_dataset'],
                     'governance_from_statement': hybrid_assessment['assessment_metadata']['governance_from_statement'],
                     'ai_analysis_quality': ai_analysis.get('confidence_level', 'medium')
                 },
                 
+                # NEW: Per-stage model routing and token usage for this assessment
+                'llm_usage': self.llm_usage,
+                
+                # NEW: Wall-clock timing of each pipeline stage
+                'stage_timings': self.stage_timings,
+                
+                # NEW: Peak memory and top allocating stages (when MEMORY_TRACKING_ENABLED)
+                'memory': memory_tracker.finish(self.memory_record),
+                
+                # NEW: How much of the request-wide deadline this assessment used
+                'deadline': {
+                    'budget_seconds': self.deadline.budget_seconds,
+                    'remaining_seconds': round(self.deadline.remaining(), 1),
+                    'exhausted': self.deadline.exhausted(),
+                    'cancel_reason': self.deadline.cancel_reason
+                },
+                
                 'status': 'completed'
             }
             
+            # NEW: Keep the heavy sections addressable by assessment_id; lazy responses only link to them
+            assessment_store.save(assessment_id, section_context, {
+                key: final_assessment[key]
+                for keys in ASSESSMENT_SECTIONS.values() for key in keys
+                if final_assessment[key] is not None
+            })
+            deferred_sections = {}
+            for section, keys in ASSESSMENT_SECTIONS.items():
+                if not plan[section]:
+                    for key in keys:
+                        deferred_sections[key] = final_assessment.pop(key)
+            final_assessment['sections'] = assessment_store.section_status(assessment_id)
+            
+            # NEW: Saved scoring inputs let stored results be re-scored when the risk indexes change
+            assessment_rescorer.record(
+                assessment_id, self.company_id, company['canonical_name'], profile, hybrid_assessment,
+                geo_risk_score, industry_risk_score
+            )
+            
+            # NEW: Which tier ran and which stages it actually executed
+            final_assessment['assessment_tier'] = plan['tier']
+            final_assessment['stages_run'] = [timing['stage'] for timing in self.stage_timings]
+            
+            # NEW: Durable history for /companies/trend
+            get_assessment_history().record({**final_assessment, **deferred_sections}, hybrid_assessment, plan['tier'])
+            
             print(f"✅ Hybrid assessment completed for {company_name}")
             print(f"📊 Data source: {hybrid_assessment['assessment_metadata']['data_source']}")
             print(f"📊 Governance from dataset: {hybrid_assessment['assessment_metadata']['governance_from_dataset']}")
@@ -2055,6 +5515,7 @@ class EnhancedModernSlaveryAssessment:
             
         except Exception as e:
             print(f"Error in hybrid assessment: {e}")
+            memory_tracker.finish(self.memory_record)
             return {
                 'error': f'Assessment failed: {str(e)}',
                 'company_name': company_name,
@@ -2094,22 +5555,217 @@ class EnhancedModernSlaveryAssessment:
             ]
         }
 
+# NEW: Cancel in-flight assessments when the client goes away
+def client_disconnected():
+    """Best-effort check whether the HTTP client has closed its connection"""
+    client_socket = request.environ.get('werkzeug.socket')
+    if client_socket is None:
+        return False
+    try:
+        readable, _, _ = select.select([client_socket], [], [], 0)
+        if readable:
+            # A readable socket with no pending bytes means the peer closed it
+            return client_socket.recv(1, socket.MSG_PEEK) == b''
+    except (OSError, ValueError):
+        return True
+    return False
+
+def run_assessment_watching_client(deadline, func, *args, profiler=None):
+    """Run an assessment in a worker thread, cancelling its deadline if the client disconnects"""
+    outcome = {}
+
+    def worker():
+        if profiler:
+            profiler.start(threading.get_ident())
+        try:
+            outcome['result'] = func(*args)
+        except Exception as e:
+            outcome['error'] = e
+        finally:
+            if profiler:
+                profiler.stop()
+
+    worker_thread = threading.Thread(target=worker, name="assessment-worker", daemon=True)
+    worker_thread.start()
+    while worker_thread.is_alive():
+        worker_thread.join(0.5)
+        if worker_thread.is_alive() and not deadline.is_cancelled() and client_disconnected():
+            deadline.cancel("client disconnected")
+
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
 # Flask API endpoints
+# NEW: Compact responses - field selection, location references, fast encoder, compression
+ALWAYS_INCLUDED_FIELDS = ('company_name', 'assessment_id', 'status', 'error')
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+def select_fields(payload, fields):
+    """Keep only the requested top-level or dotted fields (e.g. 'supply_chain_map.risk_summary')"""
+    selected = {key: payload[key] for key in ALWAYS_INCLUDED_FIELDS if key in payload}
+    for field in fields:
+        source, target = payload, selected
+        parts = field.split('.')
+        for depth, part in enumerate(parts):
+            if not isinstance(source, dict) or part not in source:
+                break
+            if depth == len(parts) - 1:
+                target[part] = source[part]
+            else:
+                source = source[part]
+                target = target.setdefault(part, {})
+    return selected
+
+def compact_location_refs(payload):
+    """Replace the location copies inside supply_chain_map with indexes into manufacturing_locations"""
+    locations = payload.get('manufacturing_locations')
+    supply_chain_map = payload.get('supply_chain_map')
+    if not isinstance(locations, list) or not isinstance(supply_chain_map, dict):
+        return payload
+
+    index_of = {id(location): index for index, location in enumerate(locations)}
+
+    def to_refs(items):
+        if isinstance(items, list) and all(id(item) in index_of for item in items):
+            return [index_of[id(item)] for item in items]
+        return items
+
+    compact_map = dict(supply_chain_map)
+    compact_map['locations'] = to_refs(supply_chain_map.get('locations'))
+    if isinstance(supply_chain_map.get('supply_chain_tiers'), dict):
+        compact_map['supply_chain_tiers'] = {
+            tier: to_refs(items) for tier, items in supply_chain_map['supply_chain_tiers'].items()
+        }
+    compact_map['location_refs'] = 'manufacturing_locations'
+    return {**payload, 'supply_chain_map': compact_map}
+
+def json_response(payload, status=200):
+    """Serialize with orjson when available (sorted keys, like jsonify)"""
+    started = time.perf_counter()
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    else:
+        body = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    stage_metrics.record('response:serialize', time.perf_counter() - started)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+def assessment_response(result):
+    """Shape an assessment result according to ?fields= and ?compact=1"""
+    fields = [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()]
+    if fields:
+        result = select_fields(result, fields)
+    if request.args.get('compact') == '1':
+        result = compact_location_refs(result)
+    return json_response(result)
+
+def negotiate_encoding(accept_encoding):
+    """Pick br or gzip from an Accept-Encoding header, honouring q=0"""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    if brotli is not None and accepted.get('br', 0) > 0:
+        return 'br'
+    if accepted.get('gzip', 0) > 0:
+        return 'gzip'
+    return None
+
+@app.after_request
+def compress_response(response):
+    if (response.direct_passthrough or response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers or response.mimetype != 'application/json'):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding(request.headers.get('Accept-Encoding', ''))
+    body = response.get_data()
+    if encoding is None or len(body) < COMPRESSION_MIN_BYTES:
+        return response
+
+    if encoding == 'br':
+        response.set_data(brotli.compress(body, quality=5))
+    else:
+        response.set_data(gzip.compress(body, compresslevel=6))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
 @app.route('/assess', methods=['POST'])
 def assess_company():
     try:
         data = request.get_json()
         company_name = data.get('company_name')
         
-        if not company_name:
+        if not isinstance(company_name, str) or not company_name.strip():
             return jsonify({'error': 'Company name required'}), 400
         
         print(f"Received assessment request for: {company_name}")
         
-        assessor = EnhancedModernSlaveryAssessment()
-        result = assessor.assess_company(company_name)
+        # NEW: Opt-in profiling for a single request (admin only, off unless PROFILING_ENABLED)
+        profile_requested = request.headers.get('X-Profile-Request') == '1' or request.args.get('profile') == '1'
+        if profile_requested and not (profiling_enabled() and is_admin_request()):
+            return jsonify({'error': 'Request profiling requires PROFILING_ENABLED and an admin token'}), 403
         
-        return jsonify(result)
+        # NEW: assessment_type (quick/standard/deep) and the frontend's options pick the stages;
+        # ?sections=lazy defers the map, benchmark and enhanced news to /assessments/<id>/<section>
+        options = data.get('options') or {}
+        try:
+            plan = plan_assessment(data.get('assessment_type'), options, request.args.get('sections') == 'lazy')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        deadline = AssessmentDeadline()
+        assessor = EnhancedModernSlaveryAssessment(deadline=deadline)
+        timeframe_months = options.get('timeframe_months')
+        if timeframe_months is not None:
+            if (isinstance(timeframe_months, bool) or not isinstance(timeframe_months, (int, float))
+                    or not 0 < timeframe_months <= MAX_TIMEFRAME_MONTHS):  # Also rejects NaN and Infinity
+                return jsonify({'error': f'options.timeframe_months must be a number between 0 and {MAX_TIMEFRAME_MONTHS}'}), 400
+            assessor.news_window_days = max(1, int(timeframe_months * 30))
+        
+        if not profile_requested:
+            # NEW: Identical concurrent requests attach to one running assessment
+            company_id = get_company_resolver().resolve(company_name)['company_id']
+            flight_key = assessment_flight_key(company_id, plan, assessor.news_window_days)
+            result, coalesced = assessment_flights.run(flight_key, deadline, assessor.assess_company, company_name, plan)
+            if result is None:
+                return jsonify({'error': 'Client disconnected'}), 499
+            response = assessment_response(result)
+            if coalesced:
+                response.headers['X-Coalesced'] = '1'
+            return response
+        
+        profile_id = uuid.uuid4().hex[:12]
+        profiler = SamplingProfiler()
+        assessor.provider_trace = []
+        request_started = time.perf_counter()
+        result = run_assessment_watching_client(deadline, assessor.assess_company, company_name, plan,
+                                                profiler=profiler)
+        
+        save_profile_artifact(profile_id, {
+            'profile_id': profile_id,
+            'company_name': company_name,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'total_ms': round((time.perf_counter() - request_started) * 1000, 1),
+            'status': result.get('status'),
+            'waterfall': {
+                'stages': assessor.stage_timings,
+                'provider_calls': assessor.provider_trace,
+                'llm_calls': assessor.llm_usage
+            },
+            'cpu_profile': profiler.report()
+        })
+        result['profile_id'] = profile_id
+        response = assessment_response(result)
+        response.headers['X-Profile-Id'] = profile_id
+        return response
         
     except Exception as e:
         print(f"API Error: {e}")
@@ -2121,7 +5777,7 @@ def test_openai():
         assessor = EnhancedModernSlaveryAssessment()
         response = assessor.call_openai_api([
             {"role": "user", "content": "Hello, please respond with 'Enhanced AI OpenAI system working correctly!'"}
-        ], max_tokens=20)
+        ], stage="connectivity_test")
         
         if response:
             return jsonify({"status": "success", "response": response})
@@ -2139,10 +5795,12 @@ def get_status():
     current_news_key = os.getenv("NEWS_API_KEY", "")
     current_tavily_key = os.getenv("TAVILY_API_KEY", "")
     
-    # Check governance dataset
-    governance_manager = GovernanceDatasetManager()
-    governance_available = governance_manager.is_available()
+    # Check governance dataset without blocking on the background warm-up
+    governance_manager = get_governance_manager(wait=False)
+    governance_available = governance_manager is not None and governance_manager.is_available()
     governance_count = len(governance_manager.governance_df) if governance_available else 0
+    if STARTUP_REPORT['first_health_seconds'] is None:
+        STARTUP_REPORT['first_health_seconds'] = round(time.perf_counter() - MODULE_IMPORT_STARTED, 3)
     
     return jsonify({
         'status': 'healthy',
@@ -2168,7 +5826,30 @@ def get_status():
             'Differentiated risk scoring (5-95 range)',
             'Company-specific intelligence gathering',
             'FIXED: Stricter scoring for athletic/footwear brands',
-            'FIXED: Control effectiveness data for frontend display'
+            'FIXED: Control effectiveness data for frontend display',
+            'NEW: Per-stage model routing with latency/token metrics (/config/model-routing, /metrics/stages)',
+            'NEW: Streamed manufacturing sites geocoded as they arrive (LLM_STREAMING_ENABLED)',
+            'NEW: Per-provider circuit breakers and request-wide assessment deadline (ASSESSMENT_DEADLINE_SECONDS)',
+            'NEW: Record/replay HTTP transport and local stub providers for offline runs (HTTP_TRANSPORT_MODE, STUB_PROVIDERS_URL)',
+            'NEW: Opt-in per-request profiling with stage waterfall (/assess?profile=1, /profiles/<id>)',
+            'NEW: Per-assessment peak memory tracking (MEMORY_TRACKING_ENABLED, /metrics/memory)',
+            'NEW: Fast cold start - lazy pandas import and background dataset warm-up',
+            'NEW: Compact responses (/assess?fields=...&compact=1) with gzip/brotli compression',
+            'NEW: Lazily loaded detail sections (/assess?sections=lazy, /assessments/<id>/<section>)',
+            'NEW: Assessment tiers (quick/standard/deep) and frontend options decide which stages run',
+            'NEW: Single-flight /assess coalescing and shared sub-stage caches (see /metrics/stages)',
+            'NEW: Company entity resolution - name variants share one company_id (/companies/resolve)',
+            'UPDATED: /search/companies is a real typeahead over dataset and assessed companies',
+            'NEW: Speculative company profile prefetch from the search box (POST /prefetch, PREFETCH_ENABLED)',
+            'NEW: Industry percentiles from real sector distributions in the governance dataset (/benchmarks/sectors)',
+            'NEW: Local peer-company finder over dataset and assessed companies (/companies/peers)',
+            'NEW: Precomputed industry x country inherent-risk matrix and bulk screening (/risk-matrix, /risk-matrix/screen)',
+            'NEW: Versioned risk indexes with background re-scoring of stored assessments (/risk-indexes)',
+            'NEW: What-if scenarios for hybrid scoring weights over stored assessments (/scenarios)',
+            'NEW: Durable assessment history with per-company trends (/companies/trend, /history/<assessment_id>)',
+            'NEW: Watchlist with staggered background re-assessment and change flags (/watchlist)',
+            'NEW: Incremental news monitoring - only articles newer than the last check are fetched',
+            'NEW: NewsAPI and Tavily articles merged with URL canonicalization and MinHash near-duplicate detection'
         ],
         'api_keys_configured': {
             'openai': bool(current_openai_key and len(current_openai_key) > 20),
@@ -2179,8 +5860,11 @@ def get_status():
         'governance_dataset': {
             'available': governance_available,
             'companies_count': governance_count,
-            'path': 'governance_assessment_results.csv'
-        }
+            'path': 'governance_assessment_results.csv',
+            'loaded': governance_manager is not None
+        },
+        'circuit_breakers': {provider: breaker.snapshot() for provider, breaker in PROVIDER_BREAKERS.items()},
+        'startup': STARTUP_REPORT
     })
 
 @app.route('/debug-health', methods=['GET'])
@@ -2220,16 +5904,356 @@ def debug_env():
         'all_api_vars': {k: v[:15] + "..." if v and len(v) > 15 else v for k, v in os.environ.items() if 'API' in k.upper()}
     })
 
+# NEW: Admin guard for runtime configuration endpoints
+def is_admin_request():
+    """Check the X-Admin-Token header against ADMIN_API_TOKEN (runtime config is disabled when unset)"""
+    admin_token = os.getenv("ADMIN_API_TOKEN", "")
+    return bool(admin_token) and request.headers.get('X-Admin-Token', '') == admin_token
+
+# NEW: Runtime-configurable model routing
+@app.route('/config/model-routing', methods=['GET', 'PUT'])
+def model_routing_config():
+    if request.method == 'GET':
+        return jsonify({'tiers': MODEL_TIERS, 'routing': model_router.snapshot()})
+
+    if not is_admin_request():
+        return jsonify({'error': 'Admin token required to change model routing'}), 403
+
+    try:
+        model_router.update(request.get_json(silent=True) or {})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    print(f"🔧 Model routing updated for: {list((request.get_json(silent=True) or {}).keys())}")
+    return jsonify({'tiers': MODEL_TIERS, 'routing': model_router.snapshot()})
+
+# NEW: Company entity resolution
+@app.route('/companies/resolve', methods=['GET'])
+def resolve_company():
+    company_name = request.args.get('name', '').strip()
+    if not company_name:
+        return jsonify({'error': 'name parameter required'}), 400
+    return jsonify({'name': company_name, **get_company_resolver().resolve(company_name)})
+
+@app.route('/companies/peers', methods=['GET'])
+def find_company_peers():
+    company_name = request.args.get('name', '').strip()
+    if not company_name:
+        return jsonify({'error': 'name parameter required'}), 400
+    try:
+        k = min(max(int(request.args.get('k', 10)), 1), 50)
+    except ValueError:
+        return jsonify({'error': 'k must be an integer'}), 400
+    
+    company = get_company_resolver().resolve(company_name)
+    peer_finder = get_peer_finder()
+    if company['company_id'] not in peer_finder.rows:
+        return jsonify({'error': f"'{company_name}' is not in the governance dataset and has not been assessed yet"}), 404
+    return jsonify({'name': company_name, **company, 'peers': peer_finder.find_peers(k=k, company_id=company['company_id'])})
+
+@app.route('/companies/aliases', methods=['POST'])
+def add_company_alias():
+    if not is_admin_request():
+        return jsonify({'error': 'Admin token required'}), 403
+    
+    data = request.get_json(silent=True) or {}
+    alias, company_id = data.get('alias', '').strip(), data.get('company_id', '').strip()
+    if not alias or not company_id:
+        return jsonify({'error': 'alias and company_id required'}), 400
+    try:
+        alias_key = get_company_resolver().add_alias(alias, company_id)
+    except KeyError:
+        return jsonify({'error': f"Unknown company_id '{company_id}'"}), 404
+    return jsonify({'alias': alias, 'alias_key': alias_key, 'company_id': company_id})
+
+# NEW: Sector governance score distributions and percentiles from the governance dataset
+@app.route('/benchmarks/sectors', methods=['GET'])
+def get_sector_benchmark():
+    benchmarks = get_sector_benchmarks()
+    sector = request.args.get('sector', '').strip()
+    industry = request.args.get('industry', '').strip()
+    if not sector and industry:
+        sector = benchmarks.match_sector(industry)
+    if not sector:
+        return jsonify({**benchmarks.snapshot(), 'available_sectors': sorted(s for s in benchmarks.scores if s != ALL_SECTORS)})
+    
+    distribution = benchmarks.distribution(sector)
+    if distribution is None:
+        return jsonify({'error': f"Unknown sector '{sector}'"}), 404
+    score = request.args.get('score')
+    if score is not None:
+        try:
+            distribution['percentile'] = benchmarks.percentile(sector, float(score))
+        except ValueError:
+            return jsonify({'error': 'score must be a number'}), 400
+    return jsonify(distribution)
+
+# NEW: Industry x country inherent-risk matrix and bulk screening
+RISK_SCREEN_MAX_COMPANIES = int(os.getenv("RISK_SCREEN_MAX_COMPANIES", "50000"))
+
+@app.route('/risk-matrix', methods=['GET'])
+def get_risk_matrix_slice():
+    industry, country = request.args.get('industry', '').strip(), request.args.get('country', '').strip()
+    risk_matrix = get_risk_matrix()
+    if not industry and not country:
+        return json_response(risk_matrix.snapshot())
+    try:
+        return json_response(risk_matrix.slice(industry or None, country or None))
+    except KeyError as e:
+        return jsonify({'error': f"Unknown industry or country {e}", 'industries': risk_matrix.industries,
+                        'countries': risk_matrix.countries}), 404
+
+@app.route('/risk-matrix/screen', methods=['POST'])
+def screen_inherent_risk():
+    data = request.get_json(silent=True) or {}
+    companies = data.get('companies')
+    if not isinstance(companies, list) or not companies or not all(isinstance(c, dict) for c in companies):
+        return jsonify({'error': 'companies must be a non-empty list of objects'}), 400
+    if len(companies) > RISK_SCREEN_MAX_COMPANIES:
+        return jsonify({'error': f"At most {RISK_SCREEN_MAX_COMPANIES} companies per request"}), 400
+    for index, company in enumerate(companies):
+        if not isinstance(company.get('headquarters'), (str, type(None))):
+            return jsonify({'error': f"companies[{index}].headquarters must be a string"}), 400
+        for field in ('operating_countries', 'industries'):
+            values = company.get(field)
+            if values is not None and not (isinstance(values, list) and all(isinstance(value, str) for value in values)):
+                return jsonify({'error': f"companies[{index}].{field} must be a list of strings"}), 400
+        floor = company.get('industry_floor')
+        if floor is not None and (isinstance(floor, bool) or not isinstance(floor, (int, float)) or not 0 <= floor <= 100):
+            return jsonify({'error': f"companies[{index}].industry_floor must be a number between 0 and 100"}), 400
+    
+    results, unmatched_industries = get_risk_matrix().screen(companies)
+    return json_response({'results': results, 'unmatched_industries': unmatched_industries})
+
+# NEW: Versioned risk indexes and re-scoring of stored assessments
+@app.route('/risk-indexes', methods=['GET'])
+def list_risk_indexes():
+    registry = get_risk_indexes()
+    return jsonify({
+        'active': registry.active,
+        'versions': registry.versions(),
+        'rescoring': assessment_rescorer.status,
+        **assessment_rescorer.counts()
+    })
+
+@app.route('/risk-indexes/<int:version>', methods=['GET'])
+def get_risk_index_version(version):
+    indexes = get_risk_indexes().version_indexes(version)
+    if indexes is None:
+        return jsonify({'error': f"Unknown risk index version {version}"}), 404
+    return jsonify({'version': version, **indexes})
+
+@app.route('/risk-indexes', methods=['POST'])
+def publish_risk_indexes():
+    if not is_admin_request():
+        return jsonify({'error': 'Admin token required'}), 403
+    
+    data = request.get_json(silent=True) or {}
+    country_updates, industry_updates = data.get('country') or {}, data.get('industry') or {}
+    if not isinstance(country_updates, dict) or not isinstance(industry_updates, dict) or not (country_updates or industry_updates):
+        return jsonify({'error': 'country and/or industry must map names to risk scores'}), 400
+    try:
+        active = get_risk_indexes().publish(country_updates, industry_updates, data.get('note'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    assessment_rescorer.start()
+    return jsonify({'active': active, 'rescoring': assessment_rescorer.status}), 201
+
+@app.route('/risk-indexes/rescore', methods=['POST'])
+def rescore_stored_assessments():
+    if not is_admin_request():
+        return jsonify({'error': 'Admin token required'}), 403
+    get_risk_indexes()
+    started = assessment_rescorer.start()
+    return jsonify({'started': started, 'rescoring': assessment_rescorer.status}), 202 if started else 200
+
+# NEW: Per-company assessment history
+@app.route('/companies/trend', methods=['GET'])
+def get_company_trend():
+    company_id = request.args.get('company_id', '').strip()
+    company_name = request.args.get('name', '').strip()
+    if not company_id and not company_name:
+        return jsonify({'error': 'name or company_id parameter required'}), 400
+    if not company_id:
+        company_id = get_company_resolver().resolve(company_name)['company_id']
+    try:
+        limit = min(max(int(request.args.get('limit', HISTORY_MAX_POINTS)), 1), HISTORY_MAX_POINTS)
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    
+    points = get_assessment_history().trend(company_id, request.args.get('from'), request.args.get('to'), limit)
+    summary = None
+    if points:
+        first, last = points[0], points[-1]
+        change = round(last['final_risk_score'] - first['final_risk_score'], 1) if None not in (first['final_risk_score'], last['final_risk_score']) else None
+        summary = {
+            'first_date': first['assessment_date'],
+            'last_date': last['assessment_date'],
+            'score_change': change,
+            'level_change': f"{first['final_risk_level']} → {last['final_risk_level']}" if first['final_risk_level'] != last['final_risk_level'] else None,
+            'direction': None if change is None else 'worsening' if change > 0 else 'improving' if change < 0 else 'stable'
+        }
+    return json_response({'company_id': company_id, 'assessments': len(points), 'summary': summary, 'points': points})
+
+@app.route('/history/<assessment_id>', methods=['GET'])
+def get_stored_assessment(assessment_id):
+    result = get_assessment_history().full_result(assessment_id)
+    if result is None:
+        return jsonify({'error': 'Unknown assessment_id'}), 404
+    return json_response(result)
+
+# NEW: Watchlist with background re-assessment
+@app.route('/watchlist', methods=['GET'])
+def get_watchlist_entries():
+    watchlist = get_watchlist()
+    return json_response({'scheduler': watchlist.snapshot(),
+                          'entries': watchlist.entries(changed_only=request.args.get('changed') == '1')})
+
+@app.route('/watchlist', methods=['POST'])
+def add_watchlist_entries():
+    if not is_admin_request():
+        return jsonify({'error': 'Admin token required'}), 403
+    data = request.get_json(silent=True) or {}
+    company_names = data.get('companies') or ([data['company_name']] if data.get('company_name') else [])
+    if not isinstance(company_names, list) or not company_names or not all(isinstance(name, str) and name.strip() for name in company_names):
+        return jsonify({'error': 'companies (list of names) or company_name required'}), 400
+    if len(company_names) > WATCHLIST_MAX_ENTRIES_PER_REQUEST:
+        return jsonify({'error': f'At most {WATCHLIST_MAX_ENTRIES_PER_REQUEST} companies per request'}), 400
+    try:
+        added = get_watchlist().add(company_names, data.get('cadence_hours'), data.get('assessment_type'))
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    return json_response({'added': added}, status=201)
+
+@app.route('/watchlist/<company_id>', methods=['DELETE'])
+def remove_watchlist_entry(company_id):
+    if not is_admin_request():
+        return jsonify({'error': 'Admin token required'}), 403
+    if not get_watchlist().remove(company_id):
+        return jsonify({'error': 'Not on the watchlist'}), 404
+    return jsonify({'removed': company_id})
+
+@app.route('/watchlist/<company_id>/acknowledge', methods=['POST'])
+def acknowledge_watchlist_change(company_id):
+    if not is_admin_request():
+        return jsonify({'error': 'Admin token required'}), 403
+    if not get_watchlist().acknowledge(company_id):
+        return jsonify({'error': 'Not on the watchlist'}), 404
+    return jsonify({'acknowledged': company_id})
+
+# NEW: What-if scenarios for the hybrid scoring parameters over stored assessments
+@app.route('/scenarios', methods=['GET'])
+def get_scenario_defaults():
+    get_risk_indexes()
+    return jsonify({'params': HYBRID_SCORING_PARAMS, **assessment_rescorer.counts()})
+
+@app.route('/scenarios', methods=['POST'])
+def run_scoring_scenario():
+    data = request.get_json(silent=True) or {}
+    company_ids = data.get('company_ids')
+    if company_ids is not None and not isinstance(company_ids, list):
+        return jsonify({'error': 'company_ids must be a list'}), 400
+    try:
+        params = scenario_params(data.get('params'))
+        max_changes = min(max(int(data.get('max_changes', SCENARIO_MAX_CHANGES)), 0), 10000)
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': str(e)}), 400
+    
+    get_risk_indexes()
+    return json_response(scenario_portfolio.run(params, company_ids, max_changes))
+
+# NEW: Speculative profile warm-up, called when the user settles on a suggestion
+@app.route('/prefetch', methods=['POST'])
+def prefetch_company():
+    data = request.get_json(silent=True) or {}
+    company_name = data.get('company_name')
+    if not isinstance(company_name, str) or not company_name.strip():
+        return jsonify({'error': 'company_name required'}), 400
+    if not profile_prefetcher.allow(request.remote_addr):
+        return jsonify({'error': 'Too many prefetch requests'}), 429, {'Retry-After': '60'}
+    status, company_id = profile_prefetcher.submit(company_name.strip())
+    return jsonify({'status': status, 'company_id': company_id}), 202 if status == 'queued' else 200
+
+# NEW: Heavy assessment sections, computed on first access and cached with the assessment
+@app.route('/assessments/<assessment_id>/<section>', methods=['GET'])
+def get_assessment_section(assessment_id, section):
+    if section not in ASSESSMENT_SECTIONS:
+        return jsonify({'error': f"Unknown section '{section}'", 'sections': list(ASSESSMENT_SECTIONS)}), 404
+    
+    try:
+        section_data = assessment_store.get_section(assessment_id, section)
+    except Exception as e:
+        print(f"Section error: {e}")
+        return jsonify({'error': str(e)}), 500
+    
+    if section_data is None:
+        return jsonify({'error': 'Unknown or expired assessment_id'}), 404
+    return json_response({'assessment_id': assessment_id, 'section': section, **section_data})
+
+# NEW: Aggregated per-assessment memory metrics
+@app.route('/metrics/memory', methods=['GET'])
+def get_memory_metrics():
+    return jsonify(memory_tracker.snapshot())
+
+# NEW: Download saved request profiles
+@app.route('/profiles/<profile_id>', methods=['GET'])
+def get_request_profile(profile_id):
+    if not (profiling_enabled() and is_admin_request()):
+        return jsonify({'error': 'Admin token required'}), 403
+    if not re.fullmatch(r'[0-9a-f]{12}', profile_id):
+        return jsonify({'error': 'Invalid profile id'}), 400
+
+    path = profile_artifact_path(profile_id)
+    if not os.path.exists(path):
+        return jsonify({'error': 'Profile not found'}), 404
+
+    with open(path, encoding='utf-8') as artifact_file:
+        artifact = json.load(artifact_file)
+
+    # Collapsed stacks can be piped straight into flamegraph.pl / speedscope
+    if request.args.get('format') == 'collapsed':
+        return "\n".join(artifact['cpu_profile']['collapsed_stacks']) + "\n", 200, {'Content-Type': 'text/plain; charset=utf-8'}
+    return jsonify(artifact)
+
+# NEW: Per-stage latency and token metrics
+@app.route('/metrics/stages', methods=['GET'])
+def get_stage_metrics():
+    return jsonify({
+        'stages': stage_metrics.snapshot(),
+        'stage_caches': {name: cache.snapshot() for name, cache in STAGE_CACHES.items()},
+        'assessment_flights': assessment_flights.snapshot(),
+        'prefetch': profile_prefetcher.snapshot(),
+        'news_store': shared_news_store.snapshot() if shared_news_store is not None else None
+    })
+
 @app.route('/search/companies', methods=['GET'])
 def search_companies():
+    # UPDATED: Real typeahead over governance dataset names and previously assessed companies
     query = request.args.get('q', '')
-    suggestions = [
-        {"name": query, "description": "Exact match", "industry": "Various"},
-        {"name": f"{query} Inc.", "description": "Corporation", "industry": "Technology"},
-        {"name": f"{query} Corporation", "description": "Large corporation", "industry": "Manufacturing"}
-    ]
+    try:
+        limit = max(1, min(int(request.args.get('limit', 10)), 50))
+    except ValueError:
+        limit = 10
+    
+    suggestions = []
+    for match in get_company_resolver().search(query, limit):
+        in_dataset = match['source'] == 'governance_dataset'
+        suggestions.append({
+            "name": match['name'],
+            "company_id": match['company_id'],
+            "description": "In governance dataset" if in_dataset else "Previously assessed",
+            "industry": match['industry'],
+            "headquarters": match['headquarters'],
+            "in_dataset": in_dataset
+        })
     return jsonify({"companies": suggestions})
 
+# NEW: Startup report - module import time, then dataset loading continues in the background
+STARTUP_REPORT['import_seconds'] = round(time.perf_counter() - MODULE_IMPORT_STARTED, 3)
+print(f"⏱️ App module imported in {STARTUP_REPORT['import_seconds'] * 1000:.0f} ms")
+start_background_warmup()
+start_watchlist_scheduler()
+
 if __name__ == '__main__':
     print("🚀 Enhanced AI-Powered Modern Slavery Assessment API with Hybrid Framework + FIXED News Handling Starting...")
     print("📡 Backend running on: http://localhost:5000")
@@ -2245,14 +6269,11 @@ if __name__ == '__main__':
     print("🔑 News API Key configured:", "✅" if startup_news_key and len(startup_news_key) > 10 else "❌")
     print("🔑 Tavily API Key configured:", "✅" if startup_tavily_key and len(startup_tavily_key) > 10 else "❌")
     
-    # Check governance dataset
-    governance_manager = GovernanceDatasetManager()
-    if governance_manager.is_available():
-        print(f"✅ Governance dataset loaded: {len(governance_manager.governance_df)} companies")
-    else:
-        print("⚠️ Governance dataset not found - will use AI-only assessments")
+    # Governance dataset loads in the background warm-up (or on the first assessment)
+    print("📊 Governance dataset loading in background - /health reports when it is ready")
     
     print("🧠 Using GPT-4o for intelligent, differentiated risk assessment")
+    print(f"🧠 Model tiers: strong={MODEL_TIERS['strong']}, fast={MODEL_TIERS['fast']} (routing per stage)")
     print("🎯 FIXED News Handling:")
     print("   ✅ NO MORE FAKE NEWS ARTICLES - real data only")
     print("   ✅ Empty arrays returned when no real news found")
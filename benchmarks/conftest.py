@@ -0,0 +1,16 @@
+# Shared setup for the parity and unit tests next to the benchmarks
+#
+#   python -m pytest benchmarks
+#
+# Like the benchmarks, the app is imported against a throwaway database with the
+# watchlist scheduler off, so running the tests never writes repo state.
+import os
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+os.chdir(REPO_ROOT)  # The governance dataset path is relative to the repo root
+os.environ['ASSESSMENTS_DB_PATH'] = os.path.join(tempfile.mkdtemp(prefix='app-tests-'), 'assessments.db')
+os.environ['WATCHLIST_SCHEDULER_ENABLED'] = 'false'
+os.environ.setdefault('BACKGROUND_WARMUP', 'false')
@@ -0,0 +1,344 @@
+# End-to-end load test harness for the Flask API
+#
+# Drives /assess, /health and /search/companies at a configurable concurrency
+# (closed loop) or arrival rate (open loop, Poisson arrivals) and reports
+# throughput, latency percentiles, error rates and a per-stage breakdown of
+# /assess taken from each response's stage_timings.
+#
+# Without --target the harness starts the local stub providers and the app
+# in-process, so no provider quota is used:
+#
+#   python benchmarks/load_test.py --concurrency 8 --duration 60
+#   python benchmarks/load_test.py --rate 2 --duration 120 --stub-latency openai=800,tavily=300
+#   python benchmarks/load_test.py --ramp 1,2,4,8,16 --duration 30      # find the saturation point
+#   python benchmarks/load_test.py --target http://staging:5000 --mix assess=1,health=0,search=0
+#
+# Reports are written to benchmarks/results/load-<timestamp>.json and compared
+# with the previous report.
+import argparse
+import glob
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_RESULTS_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+DEFAULT_COMPANIES = ["Nike", "Adidas", "Tesco", "Apple", "Unilever", "H&M", "Primark", "Samsung",
+                     "Nestle", "Inditex", "Burberry", "Marks and Spencer"]
+
+def start_local_stack(stub_latency, stub_error_rate):
+    """Start stub providers and the app on free ports; returns the app base URL"""
+    import stub_providers
+    from stub_providers import parse_provider_values
+
+    _, stub_url = stub_providers.start_stub_server(
+        latency_ms=parse_provider_values(stub_latency),
+        error_rate=parse_provider_values(stub_error_rate)
+    )
+    os.environ['STUB_PROVIDERS_URL'] = stub_url
+    os.environ.setdefault('RATE_LIMIT_SLEEP_SCALE', '0')
+    os.environ.setdefault('OPENAI_API_KEY', 'stub-key')
+    os.environ.setdefault('TAVILY_API_KEY', 'stub-key')
+    os.environ.setdefault('NEWS_API_KEY', 'stub-key')
+    # Never write repo state: the app's tables go to a throwaway database, and no background re-assessments
+    os.environ['ASSESSMENTS_DB_PATH'] = os.path.join(tempfile.mkdtemp(prefix='load-test-'), 'assessments.db')
+    os.environ['WATCHLIST_SCHEDULER_ENABLED'] = 'false'
+
+    os.chdir(REPO_ROOT)
+    from werkzeug.serving import make_server
+    import app
+
+    server = make_server('127.0.0.1', 0, app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, name="load-test-app", daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+def parse_mix(text):
+    mix = {}
+    for item in filter(None, text.split(',')):
+        name, _, weight = item.partition('=')
+        mix[name.strip()] = float(weight)
+    unknown = set(mix) - {'assess', 'health', 'search'}
+    if unknown:
+        raise SystemExit(f"Unknown endpoints in --mix: {sorted(unknown)}")
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+class LoadRunner:
+    def __init__(self, base_url, mix, companies, timeout, seed):
+        self.base_url = base_url.rstrip('/')
+        self.mix = mix
+        self.companies = companies
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.samples = []
+        self.samples_lock = threading.Lock()
+        self.local = threading.local()
+
+    def session(self):
+        if not hasattr(self.local, 'session'):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def pick(self):
+        with self.rng_lock:
+            endpoint = self.rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+            company = self.rng.choice(self.companies)
+        return endpoint, company
+
+    def one_request(self):
+        endpoint, company = self.pick()
+        sample = {'endpoint': endpoint, 'started': time.time()}
+        started = time.perf_counter()
+        try:
+            if endpoint == 'assess':
+                response = self.session().post(f"{self.base_url}/assess", json={'company_name': company}, timeout=self.timeout)
+            elif endpoint == 'health':
+                response = self.session().get(f"{self.base_url}/health", timeout=self.timeout)
+            else:
+                response = self.session().get(f"{self.base_url}/search/companies", params={'q': company[:3]}, timeout=self.timeout)
+
+            sample['status'] = response.status_code
+            sample['bytes'] = len(response.content)
+            ok = response.status_code < 400
+            if endpoint == 'assess' and ok:
+                body = response.json()
+                ok = body.get('status') == 'completed'
+                sample['stage_timings'] = body.get('stage_timings', [])
+            sample['ok'] = ok
+        except requests.RequestException as e:
+            sample['status'] = None
+            sample['ok'] = False
+            sample['error'] = type(e).__name__
+        sample['latency'] = time.perf_counter() - started
+        with self.samples_lock:
+            self.samples.append(sample)
+
+    def run_closed_loop(self, concurrency, duration, total_requests):
+        """`concurrency` workers issue requests back to back"""
+        deadline = time.time() + duration if duration else None
+        issued = [0]
+        issued_lock = threading.Lock()
+
+        def worker():
+            while True:
+                with issued_lock:
+                    if total_requests and issued[0] >= total_requests:
+                        return
+                    issued[0] += 1
+                if deadline and time.time() >= deadline:
+                    return
+                self.one_request()
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def run_open_loop(self, rate, concurrency, duration, total_requests):
+        """Poisson arrivals at `rate` req/s, with at most `concurrency` requests in flight"""
+        in_flight = threading.BoundedSemaphore(concurrency)
+        dropped = 0
+        issued = 0
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            next_arrival = started
+            while True:
+                if total_requests and issued >= total_requests:
+                    break
+                if duration and next_arrival - started >= duration:
+                    break
+                time.sleep(max(0.0, next_arrival - time.time()))
+                if in_flight.acquire(blocking=False):
+                    issued += 1
+
+                    def task():
+                        try:
+                            self.one_request()
+                        finally:
+                            in_flight.release()
+
+                    executor.submit(task)
+                else:
+                    dropped += 1
+                with self.rng_lock:
+                    next_arrival += self.rng.expovariate(rate)
+        return dropped
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+def summarize(samples, wall_seconds, dropped=0):
+    summary = {'wall_seconds': round(wall_seconds, 2), 'dropped_arrivals': dropped, 'endpoints': {}, 'assess_stages': {}}
+    all_latencies = [s['latency'] for s in samples]
+    summary['total'] = {
+        'requests': len(samples),
+        'throughput_rps': round(len(samples) / wall_seconds, 2) if wall_seconds else 0,
+        'error_rate': round(sum(1 for s in samples if not s['ok']) / len(samples), 4) if samples else 0,
+        'p50_ms': round(percentile(all_latencies, 50) * 1000, 1),
+        'p95_ms': round(percentile(all_latencies, 95) * 1000, 1),
+        'p99_ms': round(percentile(all_latencies, 99) * 1000, 1)
+    }
+
+    for endpoint in sorted({s['endpoint'] for s in samples}):
+        endpoint_samples = [s for s in samples if s['endpoint'] == endpoint]
+        latencies = [s['latency'] for s in endpoint_samples]
+        errors = [s for s in endpoint_samples if not s['ok']]
+        summary['endpoints'][endpoint] = {
+            'requests': len(endpoint_samples),
+            'throughput_rps': round(len(endpoint_samples) / wall_seconds, 2) if wall_seconds else 0,
+            'error_rate': round(len(errors) / len(endpoint_samples), 4),
+            'error_statuses': dict(Counter(str(e.get('status') or e.get('error')) for e in errors)),
+            'p50_ms': round(percentile(latencies, 50) * 1000, 1),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 1),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 1),
+            'max_ms': round(max(latencies) * 1000, 1),
+            'avg_response_bytes': round(statistics.mean(s.get('bytes', 0) for s in endpoint_samples))
+        }
+
+    stage_durations = {}
+    for sample in samples:
+        for timing in sample.get('stage_timings', []):
+            stage_durations.setdefault(timing['stage'], []).append(timing['duration_ms'])
+    for stage, durations in stage_durations.items():
+        summary['assess_stages'][stage] = {
+            'avg_ms': round(statistics.mean(durations), 1),
+            'p50_ms': round(percentile(durations, 50), 1),
+            'p95_ms': round(percentile(durations, 95), 1)
+        }
+    return summary
+
+def print_summary(label, summary):
+    total = summary['total']
+    print(f"\n=== {label} ===")
+    print(f"{total['requests']} requests in {summary['wall_seconds']}s -> {total['throughput_rps']} req/s, "
+          f"errors {total['error_rate']:.2%}, p50 {total['p50_ms']}ms, p95 {total['p95_ms']}ms, p99 {total['p99_ms']}ms")
+    if summary['dropped_arrivals']:
+        print(f"⚠️ {summary['dropped_arrivals']} arrivals dropped because the in-flight limit was reached")
+    print(f"{'endpoint':<10} {'req':>6} {'rps':>7} {'err':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for endpoint, stats in summary['endpoints'].items():
+        print(f"{endpoint:<10} {stats['requests']:>6} {stats['throughput_rps']:>7} {stats['error_rate']:>7.2%} "
+              f"{stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}")
+    if summary['assess_stages']:
+        print(f"{'assess stage':<26} {'avg ms':>9} {'p95 ms':>9}")
+        for stage, stats in sorted(summary['assess_stages'].items(), key=lambda item: -item[1]['avg_ms']):
+            print(f"{stage:<26} {stats['avg_ms']:>9} {stats['p95_ms']:>9}")
+
+def compare_with_previous(report, results_dir, current_path):
+    previous_reports = sorted(p for p in glob.glob(os.path.join(results_dir, 'load-*.json')) if p != current_path)
+    if not previous_reports:
+        return
+    with open(previous_reports[-1], encoding='utf-8') as report_file:
+        previous = json.load(report_file)
+
+    print(f"\nCompared with {os.path.basename(previous_reports[-1])} (git {previous.get('git_revision')}):")
+    previous_steps = {step['label']: step['summary'] for step in previous.get('steps', [])}
+    if not any(step['label'] in previous_steps for step in report['steps']):
+        print("  No steps with matching concurrency/rate to compare")
+    for step in report['steps']:
+        old = previous_steps.get(step['label'])
+        if not old:
+            continue
+        new_total, old_total = step['summary']['total'], old['total']
+        throughput_change = (new_total['throughput_rps'] - old_total['throughput_rps']) / old_total['throughput_rps'] if old_total['throughput_rps'] else 0
+        p95_change = (new_total['p95_ms'] - old_total['p95_ms']) / old_total['p95_ms'] if old_total['p95_ms'] else 0
+        print(f"  {step['label']}: throughput {throughput_change:+.1%}, p95 {p95_change:+.1%}, "
+              f"errors {old_total['error_rate']:.2%} -> {new_total['error_rate']:.2%}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test /assess, /health and /search/companies")
+    parser.add_argument('--target', default='', help="Base URL of a running backend (default: start stubs + app in-process)")
+    parser.add_argument('--mix', default='assess=1,health=2,search=2', help="Endpoint weights (default assess=1,health=2,search=2)")
+    parser.add_argument('--concurrency', type=int, default=4, help="Workers (closed loop) or max in flight (open loop)")
+    parser.add_argument('--rate', type=float, default=0, help="Open-loop arrival rate in req/s (0 = closed loop)")
+    parser.add_argument('--ramp', default='', help="Comma-separated concurrency steps, e.g. 1,2,4,8")
+    parser.add_argument('--duration', type=float, default=30, help="Seconds per step (default 30)")
+    parser.add_argument('--requests', type=int, default=0, help="Stop each step after this many requests")
+    parser.add_argument('--timeout', type=float, default=180, help="Per-request timeout in seconds")
+    parser.add_argument('--companies', default='', help="Comma-separated company names to assess")
+    parser.add_argument('--stub-latency', default='openai=300,tavily=150,newsapi=80,worldbank=60,gdelt=100,nominatim=40',
+                        help="Stub provider latency in ms when running in-process")
+    parser.add_argument('--stub-error-rate', default='', help="Stub provider error rate, e.g. tavily=0.05")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--results-dir', default=DEFAULT_RESULTS_DIR)
+    parser.add_argument('--no-save', action='store_true')
+    args = parser.parse_args()
+
+    base_url = args.target or start_local_stack(args.stub_latency, args.stub_error_rate)
+    mix = parse_mix(args.mix)
+    companies = [c.strip() for c in args.companies.split(',') if c.strip()] or DEFAULT_COMPANIES
+    steps = [int(c) for c in args.ramp.split(',') if c.strip()] or [args.concurrency]
+
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': None,
+        'target': args.target or 'in-process stubs',
+        'config': {k: v for k, v in vars(args).items() if k not in ('results_dir', 'no_save')},
+        'steps': []
+    }
+    try:
+        import subprocess
+        report['git_revision'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                                capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+    # Keep app logging out of the report when running in-process
+    real_stdout = sys.stdout
+    for concurrency in steps:
+        label = f"rate={args.rate}/s,max_in_flight={concurrency}" if args.rate else f"concurrency={concurrency}"
+        runner = LoadRunner(base_url, mix, companies, args.timeout, args.seed)
+        if not args.target:
+            sys.stdout = open(os.devnull, 'w')
+        started = time.time()
+        try:
+            dropped = 0
+            if args.rate:
+                dropped = runner.run_open_loop(args.rate, concurrency, args.duration, args.requests)
+            else:
+                runner.run_closed_loop(concurrency, args.duration, args.requests)
+        finally:
+            if sys.stdout is not real_stdout:
+                sys.stdout.close()
+                sys.stdout = real_stdout
+        summary = summarize(runner.samples, time.time() - started, dropped)
+        report['steps'].append({'label': label, 'concurrency': concurrency, 'summary': summary})
+        print_summary(label, summary)
+
+    if len(steps) > 1:
+        print("\nSaturation curve (assess):")
+        best = 0
+        for step in report['steps']:
+            assess = step['summary']['endpoints'].get('assess', step['summary']['total'])
+            marker = ""
+            if assess['throughput_rps'] <= best * 1.05:
+                marker = "  <- throughput flat, node saturated"
+            best = max(best, assess['throughput_rps'])
+            print(f"  {step['label']:<32} {assess['throughput_rps']:>7} req/s  p95 {assess['p95_ms']}ms{marker}")
+
+    if not args.no_save:
+        os.makedirs(args.results_dir, exist_ok=True)
+        report_path = os.path.join(args.results_dir, f"load-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+        with open(report_path, 'w', encoding='utf-8') as report_file:
+            json.dump(report, report_file, indent=2)
+        print(f"\n📁 Report saved to {report_path}")
+        compare_with_previous(report, args.results_dir, report_path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# Cold start report: import-time breakdown and time to first healthy response
+#
+# Spawns fresh interpreters so nothing is cached in-process:
+#
+#   python benchmarks/startup_time.py                 # 5 cold starts, top 15 imports
+#   python benchmarks/startup_time.py --runs 10 --top 25
+#
+# For each run `python app.py` is started on a free port and /health is polled
+# until it answers 200 (time to first healthy response) and until it reports
+# the governance dataset as loaded (time to warm).
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Never write repo state: spawned apps use a throwaway database and no background re-assessments
+ISOLATED_ENV = {
+    'ASSESSMENTS_DB_PATH': os.path.join(tempfile.mkdtemp(prefix='startup-bench-'), 'assessments.db'),
+    'WATCHLIST_SCHEDULER_ENABLED': 'false'
+}
+
+def import_time_breakdown(top):
+    """Top-level modules by cumulative import time, from `python -X importtime -c 'import app'`"""
+    env = dict(os.environ, BACKGROUND_WARMUP='false', **ISOLATED_ENV)
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], cwd=REPO_ROOT,
+                               env=env, capture_output=True, text=True, timeout=120)
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        # Modules imported directly by app (depth 1) plus app itself
+        if depth == 0 and name.strip() == 'app':
+            entries.append(('app (total)', int(cumulative_us)))
+        elif depth == 1:
+            entries.append((name.strip(), int(cumulative_us)))
+    return sorted(entries, key=lambda entry: -entry[1])[:top]
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def cold_start(timeout):
+    """Seconds from process spawn to the first healthy /health, and to the dataset being loaded"""
+    port = free_port()
+    env = dict(os.environ, PORT=str(port), **ISOLATED_ENV)
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, 'app.py'], cwd=REPO_ROOT, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    first_healthy = warm = None
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                response = requests.get(f'http://127.0.0.1:{port}/health', timeout=2)
+                if response.status_code == 200:
+                    if first_healthy is None:
+                        first_healthy = time.perf_counter() - started
+                    if response.json().get('governance_dataset', {}).get('loaded'):
+                        warm = time.perf_counter() - started
+                        break
+            except requests.RequestException:
+                pass
+            time.sleep(0.01)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return first_healthy, warm
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time and time to first healthy response")
+    parser.add_argument('--runs', type=int, default=5, help="Cold starts to measure (default 5)")
+    parser.add_argument('--top', type=int, default=15, help="Imports to list (default 15)")
+    parser.add_argument('--timeout', type=float, default=60, help="Seconds to wait for each start")
+    args = parser.parse_args()
+
+    print(f"{'module':<40} {'cumulative':>12}")
+    for name, cumulative_us in import_time_breakdown(args.top):
+        print(f"{name:<40} {cumulative_us / 1000:9.1f} ms")
+
+    healthy_times, warm_times = [], []
+    for run in range(args.runs):
+        first_healthy, warm = cold_start(args.timeout)
+        print(f"run {run + 1}: first healthy response "
+              f"{f'{first_healthy:.3f} s' if first_healthy is not None else 'timed out'}, "
+              f"dataset warm {f'{warm:.3f} s' if warm is not None else 'timed out'}")
+        if first_healthy is not None:
+            healthy_times.append(first_healthy)
+        if warm is not None:
+            warm_times.append(warm)
+
+    if healthy_times:
+        print(f"\n⏱️ Time to first healthy response: median {statistics.median(healthy_times):.3f} s "
+              f"(min {min(healthy_times):.3f} s, n={len(healthy_times)})")
+    if warm_times:
+        print(f"⏱️ Time to warm (dataset loaded): median {statistics.median(warm_times):.3f} s")
+
+if __name__ == '__main__':
+    main()
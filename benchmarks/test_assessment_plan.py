@@ -0,0 +1,62 @@
+# plan_assessment: assessment_type tiers and frontend options decide which stages run
+import pytest
+
+import app
+
+SECTIONS = ('supply-chain-map', 'enhanced-news', 'industry-benchmark', 'hybrid-breakdown')
+
+def test_default_is_deep_with_every_section():
+    plan = app.plan_assessment()
+    assert plan['tier'] == 'deep'
+    assert plan['use_ai'] and plan['news_search']
+    assert all(plan[section] for section in SECTIONS)
+
+def test_comprehensive_is_deep():
+    assert app.plan_assessment('comprehensive') == app.plan_assessment('deep')
+
+def test_quick_makes_no_ai_or_news_calls():
+    plan = app.plan_assessment('quick')
+    assert not plan['use_ai'] and not plan['news_search']
+    assert not any(plan[section] for section in SECTIONS)
+
+def test_standard_leaves_sections_to_lazy_loading():
+    plan = app.plan_assessment('standard')
+    assert plan['use_ai'] and plan['news_search']
+    assert not any(plan[section] for section in SECTIONS)
+
+def test_lazy_sections_defer_deep_sections():
+    plan = app.plan_assessment('deep', lazy_sections=True)
+    assert plan['use_ai']
+    assert not any(plan[section] for section in SECTIONS)
+
+def test_options_turn_sections_off():
+    plan = app.plan_assessment('deep', {'include_mapping': False, 'include_news': False})
+    assert not plan['supply-chain-map']
+    assert not plan['enhanced-news'] and not plan['news_search']
+    assert plan['industry-benchmark'] and plan['hybrid-breakdown']
+
+def test_only_false_turns_an_option_off():
+    plan = app.plan_assessment('deep', {'include_benchmarking': 0, 'include_news': None})
+    assert plan['industry-benchmark'] and plan['enhanced-news']
+
+@pytest.mark.parametrize('assessment_type, options', [
+    ('exhaustive', None),
+    (['deep'], None),
+    (3, None),
+    ('deep', ['include_news']),
+    ('deep', 'include_news'),
+])
+def test_invalid_input_raises_value_error(assessment_type, options):
+    with pytest.raises(ValueError):
+        app.plan_assessment(assessment_type, options)
+
+@pytest.mark.parametrize('body', [
+    {'company_name': 'Nike', 'assessment_type': ['deep']},
+    {'company_name': 'Nike', 'options': 'include_news'},
+    {'company_name': 'Nike', 'options': {'timeframe_months': 1e308}},
+    {'company_name': 'Nike', 'options': {'timeframe_months': True}},
+    {'company_name': 'Nike', 'options': {'timeframe_months': '12'}},
+])
+def test_assess_rejects_malformed_plans(body):
+    response = app.app.test_client().post('/assess', json=body)
+    assert response.status_code == 400
@@ -0,0 +1,60 @@
+# score_hybrid_batch must score exactly like calculate_hybrid_risk_assessment
+import random
+
+import numpy as np
+import pytest
+
+import app
+
+@pytest.fixture(scope='module')
+def assessor():
+    assessor = app.EnhancedModernSlaveryAssessment()
+    # LLM-backed steps return whatever the case under test sets
+    assessor.operational = {}
+    assessor.statement_score = 0
+    assessor.assess_operational_mitigation_with_ai = lambda company_name, context: dict(assessor.operational)
+    assessor.analyze_modern_slavery_statement_if_recent = lambda company_name: assessor.statement_score
+    return assessor
+
+def random_cases(rng, count):
+    dataset_names = list(app.get_governance_manager().governance_df['Company_Name'].dropna().unique())
+    for number in range(count):
+        yield {
+            # Dataset companies bring their own governance score and history modifier
+            'company_name': rng.choice(dataset_names) if number % 2 else f"Unlisted Supplier {number}",
+            'geographic': rng.randint(0, 100),
+            'industry': rng.randint(0, 100),
+            'statement_score': rng.choice([0, rng.randint(1, 35), round(rng.uniform(0, 35), 1)]),
+            'operational': {'due_diligence_score': rng.randint(0, 30), 'supply_chain_mapping_score': rng.randint(0, 20),
+                            'worker_protection_score': rng.randint(0, 15)}
+        }
+
+def test_batch_matches_hybrid_assessment(assessor):
+    rng = random.Random(20240601)
+    expected = []
+    for case in random_cases(rng, 1000):
+        assessor.operational = case['operational']
+        assessor.statement_score = case['statement_score']
+        result = assessor.calculate_hybrid_risk_assessment(
+            case['company_name'], {}, {'score': case['geographic']}, {'score': case['industry']}, {})
+        mitigation = result['mitigation_assessment']
+        expected.append((case['geographic'], case['industry'], mitigation['governance_score'],
+                         case['operational']['due_diligence_score'], case['operational']['supply_chain_mapping_score'],
+                         case['operational']['worker_protection_score'], mitigation['history_modifier'], result))
+
+    columns = [np.array([row[i] for row in expected], dtype=np.float64) for i in range(7)]
+    batch = app.score_hybrid_batch(*columns)
+    for row, (*_, result) in enumerate(expected):
+        assert batch['inherent_risk_score'][row] == result['inherent_risk_score']
+        assert batch['final_risk_score'][row] == result['final_risk_score']
+        assert batch['final_risk_level'][row] == result['final_risk_level']
+        assert batch['mitigation_grade'][row] == result['mitigation_assessment']['mitigation_grade']
+        assert round(float(batch['risk_reduction_factor'][row]) * 100, 1) == result['mitigation_assessment']['risk_reduction_percentage']
+
+def test_params_override_history_modifier():
+    ones = np.ones(1)
+    params = app.scenario_params({'history_modifier': 0})
+    batch = app.score_hybrid_batch(80 * ones, 60 * ones, 35 * ones, 30 * ones, 20 * ones, 15 * ones, 1.2 * ones, params)
+    assert batch['risk_reduction_factor'][0] == 0
+    assert batch['final_risk_score'][0] == 70
+    assert batch['mitigation_grade'][0] == 'F'
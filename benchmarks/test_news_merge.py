@@ -0,0 +1,67 @@
+# NewsAPI + Tavily merging: canonical URLs and MinHash near-duplicate grouping
+import pytest
+
+import app
+
+STORY = ("Garment workers at a supplier factory in Dhaka reported forced labor and unpaid overtime, "
+         "according to an investigation published by a labour rights group on Tuesday")
+
+@pytest.mark.parametrize('url, expected', [
+    ("https://www.example.com/news/story", "example.com/news/story"),
+    ("http://EXAMPLE.com/news/story/", "example.com/news/story"),
+    ("https://m.example.com/news/story#comments", "example.com/news/story"),
+    ("https://amp.example.com/news/story/amp", "example.com/news/story"),
+    ("https://example.com/news/story/amp.html", "example.com/news/story"),
+    ("https://example.com:443/news/story", "example.com/news/story"),
+    ("https://user@example.com/news/story", "example.com/news/story"),
+    ("https://example.com/news/story?utm_source=x&utm_medium=y&fbclid=z", "example.com/news/story"),
+    ("https://example.com/news?page=2&id=7&ref=home", "example.com/news?id=7&page=2"),
+    ("  Not a URL  ", "not a url"),
+    (None, ""),
+])
+def test_canonical_news_url(url, expected):
+    assert app.canonical_news_url(url) == expected
+
+def newsapi_article(url, title, description, published_at="2025-05-20T08:00:00Z", source="Example News"):
+    return {'url': url, 'title': title, 'description': description, 'publishedAt': published_at, 'source': source}
+
+def tavily_article(url, title, content_preview, date="2025-05-20", domain="example.org"):
+    return {'url': url, 'title': title, 'content_preview': content_preview, 'date': date, 'domain': domain}
+
+def test_same_article_from_both_providers_is_merged():
+    merged, stats = app.merge_news_articles(
+        [newsapi_article("https://www.example.com/story?utm_source=newsapi", "Factory probe", STORY)],
+        [tavily_article("https://example.com/story/", "Factory probe", STORY[:80])]
+    )
+    assert len(merged) == 1
+    assert merged[0]['providers'] == ['newsapi', 'tavily']
+    assert merged[0]['description'] == STORY  # The most complete copy is kept
+    assert merged[0]['duplicate_urls'] == ["https://example.com/story/"]
+    assert stats == {'fetched': 2, 'unique': 1, 'url_duplicates': 1, 'near_duplicates': 0}
+
+def test_syndicated_copies_are_near_duplicates():
+    merged, stats = app.merge_news_articles(
+        [newsapi_article("https://wire.example.com/a1", "Supplier accused of forced labor", STORY),
+         newsapi_article("https://paper.example.net/world/a1", "Supplier accused of forced labor", STORY + " (Reuters)")],
+        [tavily_article("https://blog.example.org/post", "Supplier accused of forced labor", STORY)]
+    )
+    assert len(merged) == 1
+    assert merged[0]['syndicated_copies'] == 2
+    assert stats['near_duplicates'] == 2 and stats['url_duplicates'] == 0
+
+def test_different_stories_stay_apart_and_are_ranked():
+    merged, stats = app.merge_news_articles(
+        [newsapi_article("https://example.com/earnings", "Quarterly earnings beat forecasts",
+                         "The retailer reported higher sales and raised its outlook for the year"),
+         newsapi_article("https://example.com/probe", "Supplier accused of forced labor", STORY)],
+        []
+    )
+    assert stats['unique'] == 2
+    assert merged[0]['url'] == "https://example.com/probe"
+    assert merged[0]['relevance_score'] > merged[1]['relevance_score']
+
+def test_empty_and_missing_fields():
+    assert app.merge_news_articles([], None) == ([], {'fetched': 0, 'unique': 0, 'url_duplicates': 0, 'near_duplicates': 0})
+    merged, stats = app.merge_news_articles([{'title': None, 'url': None}], [{}])
+    assert stats['fetched'] == 2
+    assert all(article['relevance_score'] >= 0 for article in merged)
@@ -0,0 +1,65 @@
+# RiskMatrix.screen must score exactly like calculate_geographic_risk and calculate_industry_risk
+import random
+
+import pytest
+
+import app
+
+BUSINESS_MODELS = ["", "Designs and markets athletic footwear made by contract manufacturers",
+                   "Fishing fleet and seafood processing", "Software subscriptions"]
+
+@pytest.fixture(scope='module')
+def assessor():
+    return app.EnhancedModernSlaveryAssessment()
+
+def variant(rng, name):
+    """The name itself, or a lower/upper-case variant that only exact matching tells apart"""
+    return rng.choice([name, name, name.lower(), name.upper()])
+
+def random_company(rng):
+    countries = list(app.COUNTRY_RISK_INDEX) + ["Atlantis"]
+    headquarters = rng.choice([None, variant(rng, rng.choice(countries))])
+    operating = [variant(rng, rng.choice(countries)) for _ in range(rng.randint(0, 6))]
+    if headquarters and rng.random() < 0.3:
+        operating.append(headquarters)  # The HQ is not counted again as an operating country
+    industries = [variant(rng, rng.choice(list(app.INDUSTRY_RISK_INDEX) + ["Athletic Apparel", "Software"]))
+                  for _ in range(rng.randint(0, 3))]
+    return headquarters, operating, industries, rng.choice(BUSINESS_MODELS)
+
+def test_screen_matches_per_company_scoring(assessor):
+    rng = random.Random(20240601)
+    inputs = [random_company(rng) for _ in range(5000)]
+    companies = []
+    for headquarters, operating, industries, business_model in inputs:
+        matches, floor = app.industry_risk_inputs(industries, business_model)
+        companies.append({'headquarters': headquarters, 'operating_countries': operating,
+                          'industries': matches, 'industry_floor': floor})
+    results, _ = app.get_risk_matrix().screen(companies)
+
+    mismatches = []
+    for (headquarters, operating, industries, business_model), result in zip(inputs, results):
+        geographic, _ = assessor.calculate_geographic_risk(operating, headquarters)
+        industry, _ = assessor.calculate_industry_risk(industries, business_model)
+        if (result['geographic_risk_score'], result['industry_risk_score']) != (geographic, industry):
+            mismatches.append((headquarters, operating, industries, result, geographic, industry))
+    assert mismatches == []
+
+def test_countries_match_exactly():
+    results, _ = app.get_risk_matrix().screen([{'headquarters': 'China'}, {'headquarters': 'china'}])
+    assert results[0]['geographic_risk_score'] == app.COUNTRY_RISK_INDEX['China']
+    assert results[1]['geographic_risk_score'] == app.DEFAULT_COUNTRY_RISK
+
+def test_unmatched_industries_are_reported():
+    _, unmatched = app.get_risk_matrix().screen([{'industries': ['Quantum widgets', 'Quantum widgets']}])
+    assert unmatched == ['Quantum widgets']
+
+@pytest.mark.parametrize('company', [
+    {'headquarters': 5},
+    {'operating_countries': 'China'},
+    {'industries': ['Apparel', 3]},
+    {'industry_floor': 'high'},
+    {'industry_floor': 1e308},
+])
+def test_screen_endpoint_rejects_malformed_companies(company):
+    response = app.app.test_client().post('/risk-matrix/screen', json={'companies': [company]})
+    assert response.status_code == 400
@@ -0,0 +1,55 @@
+# scenario_params: what-if overrides of HYBRID_SCORING_PARAMS, validated before any re-scoring
+import pytest
+
+import app
+
+def test_no_overrides_is_a_copy_of_the_defaults():
+    params = app.scenario_params(None)
+    assert params == app.HYBRID_SCORING_PARAMS
+    params['component_max_scores']['governance'] = 0
+    assert app.HYBRID_SCORING_PARAMS['component_max_scores']['governance'] == 35
+
+def test_overrides_are_applied():
+    params = app.scenario_params({
+        'hq_weight': 0.5,
+        'max_risk_reduction': 0.6,
+        'history_modifier': 1.2,
+        'final_score_bounds': [0, 100],
+        'component_max_scores': {'governance': 40, 'worker_protection': 10},
+        'risk_level_thresholds': {'Very High': 80},
+        'grade_thresholds': {'A': 0.45}
+    })
+    assert params['hq_weight'] == 0.5
+    assert params['max_risk_reduction'] == 0.6
+    assert params['history_modifier'] == 1.2
+    assert params['final_score_bounds'] == (0, 100)
+    assert params['component_max_scores'] == {'governance': 40, 'due_diligence': 30,
+                                              'supply_chain_mapping': 20, 'worker_protection': 10}
+    assert params['risk_level_thresholds'][0] == (80, 'Very High')
+    assert params['grade_thresholds'][0] == (0.45, 'A')
+
+def test_null_history_modifier_keeps_each_company_own():
+    assert app.scenario_params({'history_modifier': None})['history_modifier'] is None
+
+@pytest.mark.parametrize('overrides', [
+    ['hq_weight'],
+    {'unknown_param': 1},
+    {'hq_weight': 1.5},
+    {'hq_weight': True},
+    {'hq_weight': '0.5'},
+    {'max_risk_reduction': float('nan')},
+    {'history_modifier': 6},
+    {'final_score_bounds': [50]},
+    {'final_score_bounds': [60, 40]},
+    {'final_score_bounds': 'wide'},
+    {'component_max_scores': ['governance']},
+    {'component_max_scores': {'lobbying': 10}},
+    {'component_max_scores': {'governance': 0, 'due_diligence': 0, 'supply_chain_mapping': 0, 'worker_protection': 0}},
+    {'risk_level_thresholds': [75, 55]},
+    {'risk_level_thresholds': {'Extreme': 90}},
+    {'risk_level_thresholds': {'Low': 60}},
+    {'grade_thresholds': {'A': 0.05}},
+])
+def test_invalid_overrides_raise_value_error(overrides):
+    with pytest.raises(ValueError):
+        app.scenario_params(overrides)
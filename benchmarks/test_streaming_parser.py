@@ -0,0 +1,55 @@
+# IncrementalJSONArrayParser: elements come out as soon as they are complete, whatever the chunking
+import json
+
+import app
+
+DOCUMENT = json.dumps({
+    "company": "Nike",
+    "locations": [
+        {"city": "Ho Chi Minh City", "country": "Vietnam", "products": ["footwear", "apparel"]},
+        {"city": "Quote \" and [bracket] {brace}", "country": "China", "nested": {"depth": [1, [2]]}},
+        {"city": "Backslash \\", "country": "Indonesia"}
+    ],
+    "summary": {"locations": 3}
+})
+EXPECTED = json.loads(DOCUMENT)['locations']
+
+def feed_in_chunks(text, size):
+    parser = app.IncrementalJSONArrayParser('locations')
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start:start + size]))
+    return parser, completed
+
+def test_whole_document():
+    parser, completed = feed_in_chunks(DOCUMENT, len(DOCUMENT))
+    assert completed == EXPECTED
+    assert parser.elements == EXPECTED
+    assert parser.finished
+
+def test_every_chunk_size():
+    for size in range(1, 40):
+        parser, completed = feed_in_chunks(DOCUMENT, size)
+        assert completed == EXPECTED, size
+        assert parser.finished
+
+def test_elements_arrive_before_the_document_ends():
+    parser = app.IncrementalJSONArrayParser('locations')
+    first_end = DOCUMENT.index('}') + 1
+    assert parser.feed(DOCUMENT[:first_end]) == EXPECTED[:1]
+    assert not parser.finished
+
+def test_text_after_the_array_is_ignored():
+    parser, _ = feed_in_chunks(DOCUMENT, 7)
+    assert parser.feed('{"locations": [{"city": "late"}]}') == []
+    assert parser.elements == EXPECTED
+
+def test_fenced_response_and_malformed_element():
+    text = '```json\n{"locations": [{"city": "A"}, {"city": B}, {"city": "C"}]}\n```'
+    parser, completed = feed_in_chunks(text, 5)
+    assert completed == [{"city": "A"}, {"city": "C"}]
+
+def test_missing_key_yields_nothing():
+    parser, completed = feed_in_chunks('{"sites": [{"city": "A"}]}', 4)
+    assert completed == []
+    assert not parser.finished
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { MapContainer, TileLayer, Marker, Popup } from 'react-leaflet';
 import 'leaflet/dist/leaflet.css';
 import L from 'leaflet';
@@ -12,6 +12,49 @@ L.Icon.Default.mergeOptions({
   shadowUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.7.1/images/marker-shadow.png',
 });
 
+const API_BASE_URL = 'https://modern-slavery-tool-production.up.railway.app';
+
+// Heavy sections are requested lazily and loaded when their tab is opened
+const TAB_SECTIONS = {
+  benchmarking: 'industry-benchmark',
+  mapping: 'supply-chain-map',
+  enhanced: 'enhanced-news'
+};
+
+const fetchSection = async (results, section) => {
+  const response = await fetch(`${API_BASE_URL}${results.sections[section].url}`);
+  if (!response.ok) {
+    throw new Error(`Server error: ${response.status}`);
+  }
+  return response.json();
+};
+
+const mergeSection = (results, section, data) => {
+  const { assessment_id, section: sectionName, ...sectionData } = data;
+  return {
+    ...results,
+    ...sectionData,
+    sections: { ...results.sections, [section]: { ...results.sections[section], computed: true } }
+  };
+};
+
+const isSectionPending = (results, section) => results?.sections?.[section]?.computed === false;
+
+// Typeahead suggestions; picking one starts a background profile warm-up on the server
+const fetchSuggestions = async (query) => {
+  const response = await fetch(`${API_BASE_URL}/search/companies?q=${encodeURIComponent(query)}&limit=8`);
+  if (!response.ok) return [];
+  const data = await response.json();
+  return data.companies || [];
+};
+
+const prefetchCompany = (companyName) =>
+  fetch(`${API_BASE_URL}/prefetch`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ company_name: companyName })
+  }).catch(err => console.error('Prefetch error:', err));
+
 // Helper function to capitalize first letter
 const capitalizeFirst = (str) => {
   if (!str) return '';
@@ -295,13 +338,19 @@ const IndustryBenchmarking = ({ benchmarkData }) => {
     return performance === 'above average' ? '#28a745' : '#dc3545';
   };
 
+  // Benchmarks compare governance scores (0-score_max, higher is better); colours use the risk scale
+  const scoreMax = benchmarkData.score_max || 100;
+  const toRiskScale = (score) => (benchmarkData.score_max ? 100 - (score / scoreMax) * 100 : score);
+
   const getScoreColor = (score) => {
+    score = toRiskScale(score);
     if (score <= 35) return '#28a745';
     if (score <= 65) return '#ffc107';
     return '#dc3545';
   };
 
   const getScoreBackgroundColor = (score) => {
+    score = toRiskScale(score);
     if (score <= 35) return '#d4edda';
     if (score <= 65) return '#fff3cd';
     return '#f8d7da';
@@ -339,9 +388,9 @@ const IndustryBenchmarking = ({ benchmarkData }) => {
               }}
             >
               {benchmarkData.company_score}
-              <span className="score-suffix">/100</span>
+              <span className="score-suffix">/{scoreMax}</span>
             </div>
-            <div className="score-description">Company Risk Score</div>
+            <div className="score-description">{benchmarkData.score_max ? 'Governance Score' : 'Company Risk Score'}</div>
           </div>
 
           <div className="vs-divider">
@@ -361,7 +410,7 @@ const IndustryBenchmarking = ({ benchmarkData }) => {
               }}
             >
               {benchmarkData.industry_average_score}
-              <span className="score-suffix">/100</span>
+              <span className="score-suffix">/{scoreMax}</span>
             </div>
             <div className="score-description">Industry Benchmark</div>
           </div>
@@ -375,13 +424,13 @@ const IndustryBenchmarking = ({ benchmarkData }) => {
               className="performance-value"
               style={{ color: getPerformanceColor(benchmarkData.performance_vs_peers) }}
             >
-              {benchmarkData.performance_vs_peers.toUpperCase()}
+              {(benchmarkData.performance_vs_peers || 'n/a').toUpperCase()}
             </span>
           </div>
           <div className="score-difference">
             <span className="difference-label">Score Difference:</span>
             <span className="difference-value">
-              {Math.abs(benchmarkData.company_score - benchmarkData.industry_average_score)} points
+              {benchmarkData.score_difference ?? Math.abs(benchmarkData.company_score - benchmarkData.industry_average_score)} points
             </span>
           </div>
           <div className="percentile-ranking">
@@ -930,6 +979,43 @@ function App() {
   const [error, setError] = useState('');
   const [activeTab, setActiveTab] = useState('overview');
   const [progress, setProgress] = useState(0);
+  const [sectionLoading, setSectionLoading] = useState(false);
+  const [suggestions, setSuggestions] = useState([]);
+  const prefetched = useRef(new Set());
+
+  useEffect(() => {
+    const query = companyName.trim();
+    if (query.length < 2) {
+      setSuggestions([]);
+      return;
+    }
+
+    // Settling on a suggestion (picked from the list or typed in full) warms its profile
+    const match = suggestions.find(s => s.name.toLowerCase() === query.toLowerCase());
+    if (match && !prefetched.current.has(match.company_id)) {
+      prefetched.current.add(match.company_id);
+      prefetchCompany(match.name);
+    }
+
+    const timer = setTimeout(() => {
+      fetchSuggestions(query)
+        .then(setSuggestions)
+        .catch(err => console.error('Suggestion error:', err));
+    }, 250);
+    return () => clearTimeout(timer);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [companyName]);
+
+  useEffect(() => {
+    const section = TAB_SECTIONS[activeTab];
+    if (!section || !isSectionPending(results, section)) return;
+
+    setSectionLoading(true);
+    fetchSection(results, section)
+      .then(data => setResults(prev => mergeSection(prev, section, data)))
+      .catch(err => console.error('Section load error:', err))
+      .finally(() => setSectionLoading(false));
+  }, [activeTab, results]);
 
   const handleSubmit = async (e) => {
     e.preventDefault();
@@ -952,7 +1038,7 @@ function App() {
     }, 400);
     
     try {
-      const response = await fetch('https://modern-slavery-tool-production.up.railway.app/assess', {
+      const response = await fetch(`${API_BASE_URL}/assess?sections=lazy`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -1024,9 +1110,21 @@ function App() {
     setActiveTab('overview');
   };
 
-  const handleExport = () => {
+  const handleExport = async () => {
     if (results) {
-      exportToExcel(results, companyName);
+      // Make sure every section is in the export, not just the tabs that were opened
+      let fullResults = results;
+      for (const section of Object.values(TAB_SECTIONS)) {
+        if (isSectionPending(fullResults, section)) {
+          try {
+            fullResults = mergeSection(fullResults, section, await fetchSection(fullResults, section));
+          } catch (err) {
+            console.error('Section load error:', err);
+          }
+        }
+      }
+      setResults(fullResults);
+      exportToExcel(fullResults, companyName);
     }
   };
 
@@ -1064,7 +1162,14 @@ function App() {
                 placeholder="Enter company name (e.g., Apple, Nike, Walmart, Tesla)"
                 className="company-input"
                 disabled={loading}
+                list="company-suggestions"
+                autoComplete="off"
               />
+              <datalist id="company-suggestions">
+                {suggestions.map(s => (
+                  <option key={s.company_id} value={s.name}>{s.industry}</option>
+                ))}
+              </datalist>
               <button 
                 type="submit" 
                 disabled={loading || !companyName.trim()}
@@ -1198,6 +1303,10 @@ function App() {
 
               {/* Tab Content */}
               <div className="tab-content">
+                {sectionLoading && (
+                  <div className="no-data">Loading section...</div>
+                )}
+
                 {activeTab === 'overview' && (
                   <>
                     {/* Control Effectiveness Section - UNCHANGED POSITION */}
@@ -0,0 +1,451 @@
+# Local stub providers for offline benchmarking and load testing
+#
+# Serves deterministic fake responses for every external integration used by
+# EnhancedModernSlaveryAssessment, each under its own prefix:
+#
+#   /openai/chat/completions       OpenAI chat completions (incl. streaming)
+#   /tavily/search                 Tavily search
+#   /newsapi/everything            NewsAPI
+#   /worldbank/country/<c>/indicator/<i>
+#   /gdelt/doc/doc                 GDELT doc API (timelinevol)
+#   /nominatim/search              OpenStreetMap Nominatim
+#
+# Run the stubs, then point the backend at them:
+#
+#   python stub_providers.py --port 5055 --latency openai=800,tavily=300 --error-rate tavily=0.05
+#   STUB_PROVIDERS_URL=http://127.0.0.1:5055 RATE_LIMIT_SLEEP_SCALE=0 python app.py
+#
+# Responses depend only on the request content, so the same assessment produces
+# the same result on every run. Error injection uses a seeded RNG.
+import argparse
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+
+from flask import Flask, Response, jsonify, request
+from werkzeug.serving import make_server
+
+PROVIDERS = ('openai', 'tavily', 'newsapi', 'worldbank', 'gdelt', 'nominatim')
+
+stub_app = Flask(__name__)
+
+class StubConfig:
+    def __init__(self, latency_ms=None, error_rate=None, jitter=0.1, seed=42):
+        """Per-provider latency (ms) and error-injection rate (0-1)"""
+        self.lock = threading.Lock()
+        self.latency_ms = {provider: 0 for provider in PROVIDERS}
+        self.error_rate = {provider: 0.0 for provider in PROVIDERS}
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.request_counts = {provider: 0 for provider in PROVIDERS}
+        self.injected_errors = {provider: 0 for provider in PROVIDERS}
+        self.update(latency_ms=latency_ms, error_rate=error_rate)
+
+    def update(self, latency_ms=None, error_rate=None, jitter=None, seed=None):
+        with self.lock:
+            for provider, value in (latency_ms or {}).items():
+                if provider not in PROVIDERS:
+                    raise ValueError(f"Unknown provider '{provider}'")
+                self.latency_ms[provider] = float(value)
+            for provider, value in (error_rate or {}).items():
+                if provider not in PROVIDERS:
+                    raise ValueError(f"Unknown provider '{provider}'")
+                self.error_rate[provider] = float(value)
+            if jitter is not None:
+                self.jitter = float(jitter)
+            if seed is not None:
+                self.rng = random.Random(seed)
+
+    def next_call(self, provider):
+        """Return (latency_seconds, inject_error) for the next call to a provider"""
+        with self.lock:
+            self.request_counts[provider] += 1
+            latency = self.latency_ms[provider] / 1000
+            if self.jitter and latency:
+                latency *= 1 + self.rng.uniform(-self.jitter, self.jitter)
+            inject_error = self.rng.random() < self.error_rate[provider]
+            if inject_error:
+                self.injected_errors[provider] += 1
+            return latency, inject_error
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'latency_ms': dict(self.latency_ms),
+                'error_rate': dict(self.error_rate),
+                'jitter': self.jitter,
+                'request_counts': dict(self.request_counts),
+                'injected_errors': dict(self.injected_errors)
+            }
+
+stub_config = StubConfig()
+
+def seeded_rng(*parts):
+    """RNG seeded from request content so responses are reproducible"""
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode('utf-8')).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+def simulate(provider):
+    """Apply configured latency; return an error response when one should be injected"""
+    latency, inject_error = stub_config.next_call(provider)
+    if latency:
+        time.sleep(latency)
+    if inject_error:
+        return jsonify({'error': f'Injected {provider} failure'}), 503
+    return None
+
+def quoted_company(text, default="Example Corp"):
+    """First double-quoted phrase in a search query, which is the company name in our queries"""
+    start = text.find('"')
+    end = text.find('"', start + 1)
+    return text[start + 1:end] if start != -1 and end > start else default
+
+# ----------------------------------------------------------------------------
+# OpenAI
+# ----------------------------------------------------------------------------
+STUB_COUNTRIES = ["China", "Vietnam", "Bangladesh", "India", "Indonesia", "Mexico", "Turkey",
+                  "Brazil", "Thailand", "Malaysia", "Germany", "United States", "United Kingdom"]
+STUB_INDUSTRIES = ["Footwear", "Athletic Apparel", "Retail", "Electronics Manufacturing",
+                   "Consumer Goods", "Food Processing", "Software", "Financial Services"]
+STUB_HEADQUARTERS = ["United States", "United Kingdom", "Germany", "Japan", "France", "Netherlands"]
+STUB_CITIES = {
+    "China": "Dongguan", "Vietnam": "Ho Chi Minh City", "Bangladesh": "Dhaka", "India": "Tiruppur",
+    "Indonesia": "Tangerang", "Mexico": "Monterrey", "Turkey": "Istanbul", "Brazil": "Sao Paulo",
+    "Thailand": "Bangkok", "Malaysia": "Penang", "Germany": "Herzogenaurach",
+    "United States": "Portland", "United Kingdom": "Manchester"
+}
+
+def stub_company_profile(rng):
+    countries = rng.sample(STUB_COUNTRIES, 6)
+    return {
+        "headquarters": rng.choice(STUB_HEADQUARTERS),
+        "primary_industry": rng.choice(STUB_INDUSTRIES),
+        "revenue": f"${rng.randint(1, 60)} billion",
+        "operating_countries": countries,
+        "all_industries": rng.sample(STUB_INDUSTRIES, 3),
+        "employees": rng.randint(1000, 200000),
+        "business_model": "Designs and markets products manufactured by contract suppliers across Asia",
+        "supply_chain_complexity": rng.choice(["high", "medium"]),
+        "known_controversies": ["Supplier factory labour audit findings"],
+        "risk_indicators": ["Contract manufacturing in high-risk countries", "Multi-tier sourcing"]
+    }
+
+def stub_manufacturing_sites(rng):
+    sites = []
+    for country in rng.sample(STUB_COUNTRIES, 8):
+        sites.append({
+            "city": STUB_CITIES[country],
+            "country": country,
+            "facility_type": rng.choice(["manufacturing", "supplier", "distribution", "office"]),
+            "products": rng.choice(["Footwear", "Apparel", "Components", "Logistics"]),
+            "workforce_size": f"{rng.randint(1, 20) * 500}",
+            "risk_level": rng.choice(["high", "medium", "low"])
+        })
+    return {"manufacturing_sites": sites}
+
+def stub_operational_assessment(rng):
+    return {
+        "due_diligence_score": rng.randint(10, 22),
+        "supply_chain_mapping_score": rng.randint(6, 14),
+        "worker_protection_score": rng.randint(5, 11),
+        "evidence_quality": "medium",
+        "key_findings": ["Annual tier-1 supplier audits", "Published supplier list"],
+        "data_gaps": ["Tier-2 visibility", "Grievance outcomes"]
+    }
+
+def stub_statement_analysis(rng):
+    scores = {
+        "policies_procedures": rng.randint(6, 13),
+        "due_diligence_monitoring": rng.randint(3, 8),
+        "training_awareness": rng.randint(1, 4),
+        "monitoring_effectiveness": rng.randint(1, 4)
+    }
+    return {
+        **scores,
+        "total_score": sum(scores.values()),
+        "statement_quality": "medium",
+        "key_strengths": ["Board-approved policy"],
+        "key_gaps": ["Limited KPIs"],
+        "analysis_confidence": "medium"
+    }
+
+def stub_industry_analysis(rng, industry):
+    low = rng.randint(15, 35)
+    high = rng.randint(10, 30)
+    return {
+        "industry_name": industry,
+        "risk_profile": {
+            "average_risk_score": rng.randint(40, 75),
+            "risk_score_range": {"min": 20, "max": 90},
+            "risk_level_distribution": {"low": low, "medium": 100 - low - high, "high": high}
+        },
+        "common_risks": ["Unauthorised subcontracting", "Excessive overtime", "Recruitment fees", "Seasonal migrant labour"],
+        "geographic_hotspots": rng.sample(STUB_COUNTRIES, 3),
+        "peer_companies": {
+            "industry_leaders": ["Peer Alpha", "Peer Beta", "Peer Gamma", "Peer Delta"],
+            "best_practice_companies": ["Peer Alpha", "Peer Beta"],
+            "companies_with_issues": ["Peer Gamma", "Peer Delta"]
+        },
+        "regulatory_landscape": ["UK Modern Slavery Act", "German Supply Chain Act", "UFLPA"],
+        "supply_chain_complexity": "high",
+        "vulnerable_supply_chain_points": ["Raw materials", "Subcontractors", "Labour agents"],
+        "industry_best_practices": ["Supplier list disclosure", "Worker voice tools", "Responsible recruitment", "Remediation funds"],
+        "performance_benchmarks": {"policy_coverage": "80%", "audit_completion": "65%", "transparency_level": "medium"}
+    }
+
+def stub_comprehensive_analysis(rng):
+    score = rng.randint(35, 75)
+    return {
+        "overall_risk_score": score,
+        "overall_risk_level": "high" if score >= 55 else "medium",
+        "confidence_level": "medium",
+        "category_scores": {
+            "policy_governance": rng.randint(30, 80),
+            "due_diligence": rng.randint(30, 80),
+            "operational_practices": rng.randint(30, 80),
+            "transparency": rng.randint(30, 80)
+        },
+        "key_findings": [
+            {"description": "Complex multi-tier supply chain in high-risk countries", "severity": "high", "category": "operations"},
+            {"description": "Supplier audits cover tier-1 only", "severity": "medium", "category": "due_diligence"},
+            {"description": "Public supplier list improves transparency", "severity": "low", "category": "transparency"}
+        ],
+        "recommendations": [
+            {"description": "Extend audits to tier-2 suppliers", "priority": "high", "category": "due_diligence"},
+            {"description": "Publish remediation outcomes", "priority": "medium", "category": "transparency"},
+            {"description": "Adopt responsible recruitment standards", "priority": "medium", "category": "operations"}
+        ],
+        "risk_factors": [
+            {"factor": "Contract manufacturing concentration", "impact": "high", "evidence": "Majority of production in high-risk countries"},
+            {"factor": "Subcontracting", "impact": "medium", "evidence": "Limited visibility beyond tier-1"},
+            {"factor": "Migrant workforce", "impact": "medium", "evidence": "Recruitment fee exposure in Malaysia and Thailand"}
+        ]
+    }
+
+def stub_chat_content(messages):
+    """Pick a response shape from the JSON template the prompt asks for"""
+    prompt = "\n".join(m.get('content', '') for m in messages)
+    rng = seeded_rng(prompt)
+
+    if '"manufacturing_sites"' in prompt:
+        return json.dumps(stub_manufacturing_sites(rng), indent=2)
+    if '"policies_procedures"' in prompt:
+        return json.dumps(stub_statement_analysis(rng))
+    if '"due_diligence_score"' in prompt:
+        return json.dumps(stub_operational_assessment(rng))
+    if '"operating_countries"' in prompt:
+        return "```json\n" + json.dumps(stub_company_profile(rng)) + "\n```"
+    if '"industry_name"' in prompt:
+        industry = prompt.split("intelligence for:", 1)[-1].strip().split("\n", 1)[0] if "intelligence for:" in prompt else "Unknown"
+        return json.dumps(stub_industry_analysis(rng, industry))
+    if '"overall_risk_score"' in prompt:
+        return json.dumps(stub_comprehensive_analysis(rng))
+    if 'risk profile summary' in prompt:
+        return ("The company presents an elevated modern slavery risk driven by contract manufacturing in "
+                "high-risk countries. Governance controls are established but supplier monitoring beyond "
+                "tier-1 remains limited.")
+    return "Enhanced AI OpenAI system working correctly!"
+
+@stub_app.route('/openai/chat/completions', methods=['POST'])
+def openai_chat_completions():
+    body = request.get_json(silent=True) or {}
+    content = stub_chat_content(body.get('messages', []))
+    usage = {
+        'prompt_tokens': sum(len(m.get('content', '')) for m in body.get('messages', [])) // 4,
+        'completion_tokens': len(content) // 4
+    }
+    usage['total_tokens'] = usage['prompt_tokens'] + usage['completion_tokens']
+    model = body.get('model', 'gpt-4o')
+
+    if not body.get('stream'):
+        error = simulate('openai')
+        if error:
+            return error
+        return jsonify({
+            'id': 'chatcmpl-stub',
+            'object': 'chat.completion',
+            'model': model,
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+            'usage': usage
+        })
+
+    latency, inject_error = stub_config.next_call('openai')
+    if inject_error:
+        return jsonify({'error': 'Injected openai failure'}), 503
+
+    include_usage = (body.get('stream_options') or {}).get('include_usage', False)
+    chunks = [content[i:i + 24] for i in range(0, len(content), 24)] or [""]
+
+    def generate():
+        # Spread the configured latency over the stream, like token-by-token generation
+        per_chunk = latency / len(chunks)
+        for piece in chunks:
+            if per_chunk:
+                time.sleep(per_chunk)
+            yield "data: " + json.dumps({'model': model, 'choices': [{'index': 0, 'delta': {'content': piece}}]}) + "\n\n"
+        if include_usage:
+            yield "data: " + json.dumps({'model': model, 'choices': [], 'usage': usage}) + "\n\n"
+        yield "data: [DONE]\n\n"
+
+    return Response(generate(), mimetype='text/event-stream')
+
+# ----------------------------------------------------------------------------
+# Search, news and open-data providers
+# ----------------------------------------------------------------------------
+@stub_app.route('/tavily/search', methods=['POST'])
+def tavily_search():
+    error = simulate('tavily')
+    if error:
+        return error
+
+    body = request.get_json(silent=True) or {}
+    query = body.get('query', '')
+    company = quoted_company(query)
+    rng = seeded_rng('tavily', query)
+    slug = company.lower().replace(' ', '-')
+
+    results = []
+    if 'modern slavery statement' in query.lower() or 'transparency report' in query.lower():
+        year = rng.choice([2023, 2024])
+        results.append({
+            'title': f"{company} Modern Slavery Statement {year}",
+            'url': f"https://www.{slug}.example.com/modern-slavery-statement-{year}.pdf",
+            'content': (f"{company} Modern Slavery Statement {year}. This statement sets out the steps taken by "
+                        f"{company} to prevent modern slavery in its operations and supply chains, including our "
+                        "supplier code of conduct, risk assessment, supplier audits, training for buying teams "
+                        "and grievance mechanisms for workers. ") * 3,
+            'published_date': f"{year}-06-30",
+            'score': 0.92
+        })
+    else:
+        for index in range(body.get('max_results', 2)):
+            results.append({
+                'title': f"{company} supplier faces forced labor allegations in report #{index + 1}",
+                'url': f"https://news.example.com/{slug}-forced-labor-{rng.randint(1000, 9999)}",
+                'content': (f"An investigation found forced labor risks at a supplier of {company}. "
+                            "Worker rights groups called for a supply chain audit."),
+                'published_date': f"2025-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+                'score': round(rng.uniform(0.5, 0.9), 2)
+            })
+    return jsonify({'query': query, 'results': results, 'response_time': 0.1})
+
+@stub_app.route('/newsapi/everything', methods=['GET'])
+def newsapi_everything():
+    error = simulate('newsapi')
+    if error:
+        return error
+
+    query = request.args.get('q', '')
+    company = query.split(' ')[0] if query else "Example"
+    rng = seeded_rng('newsapi', query, request.args.get('from', ''))
+    articles = []
+    for index in range(int(request.args.get('pageSize', 3))):
+        articles.append({
+            'title': f"{company} workers rights concerns raised in supply chain review {index + 1}",
+            'url': f"https://press.example.com/{company.lower()}-{rng.randint(10000, 99999)}",
+            'description': f"Campaigners questioned labour conditions at factories supplying {company}.",
+            'publishedAt': f"2025-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T09:00:00Z",
+            'source': {'id': None, 'name': rng.choice(['Example Times', 'Stub Herald', 'Offline Post'])}
+        })
+    return jsonify({'status': 'ok', 'totalResults': len(articles), 'articles': articles})
+
+@stub_app.route('/worldbank/country/<country>/indicator/<indicator>', methods=['GET'])
+def worldbank_indicator(country, indicator):
+    error = simulate('worldbank')
+    if error:
+        return error
+
+    rng = seeded_rng('worldbank', country, indicator)
+    value = round(rng.uniform(1500, 75000), 2)
+    return jsonify([
+        {'page': 1, 'pages': 1, 'per_page': 5, 'total': 2},
+        [
+            {'indicator': {'id': indicator}, 'country': {'id': country}, 'date': '2023', 'value': value},
+            {'indicator': {'id': indicator}, 'country': {'id': country}, 'date': '2022', 'value': round(value * 0.97, 2)}
+        ]
+    ])
+
+@stub_app.route('/gdelt/doc/doc', methods=['GET'])
+def gdelt_doc():
+    error = simulate('gdelt')
+    if error:
+        return error
+
+    rng = seeded_rng('gdelt', request.args.get('query', ''), request.args.get('timespan', ''))
+    timeline = [
+        {'date': f"2025{month:02d}01T000000Z", 'count': rng.randint(0, 40)}
+        for month in range(1, 13)
+    ]
+    return jsonify({'timeline': timeline})
+
+@stub_app.route('/nominatim/search', methods=['GET'])
+def nominatim_search():
+    error = simulate('nominatim')
+    if error:
+        return error
+
+    query = request.args.get('q', '')
+    rng = seeded_rng('nominatim', query)
+    return jsonify([{
+        'lat': f"{rng.uniform(-40, 60):.6f}",
+        'lon': f"{rng.uniform(-120, 140):.6f}",
+        'display_name': query
+    }])
+
+# ----------------------------------------------------------------------------
+# Stub control
+# ----------------------------------------------------------------------------
+@stub_app.route('/_stub/config', methods=['GET', 'POST'])
+def stub_config_endpoint():
+    if request.method == 'POST':
+        body = request.get_json(silent=True) or {}
+        try:
+            stub_config.update(
+                latency_ms=body.get('latency_ms'),
+                error_rate=body.get('error_rate'),
+                jitter=body.get('jitter'),
+                seed=body.get('seed')
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+    return jsonify(stub_config.snapshot())
+
+def start_stub_server(host='127.0.0.1', port=0, latency_ms=None, error_rate=None):
+    """Start the stubs in a background thread; returns (server, base_url)"""
+    stub_config.update(latency_ms=latency_ms, error_rate=error_rate)
+    # Keep per-request access logs out of benchmark output
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server(host, port, stub_app, threaded=True)
+    threading.Thread(target=server.serve_forever, name="stub-providers", daemon=True).start()
+    return server, f"http://{host}:{server.server_port}"
+
+def parse_provider_values(text):
+    """Parse 'openai=800,tavily=300' into a dict"""
+    values = {}
+    for item in filter(None, (text or "").split(',')):
+        provider, _, value = item.partition('=')
+        values[provider.strip()] = float(value)
+    return values
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Local stub providers for offline assessment runs")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--latency', default='', help="Per-provider latency in ms, e.g. openai=800,tavily=300")
+    parser.add_argument('--error-rate', default='', help="Per-provider error rate 0-1, e.g. tavily=0.05")
+    parser.add_argument('--jitter', type=float, default=0.1, help="Latency jitter as a fraction (default 0.1)")
+    parser.add_argument('--seed', type=int, default=42, help="Seed for latency jitter and error injection")
+    args = parser.parse_args()
+
+    stub_config.update(
+        latency_ms=parse_provider_values(args.latency),
+        error_rate=parse_provider_values(args.error_rate),
+        jitter=args.jitter,
+        seed=args.seed
+    )
+    print(f"🧪 Stub providers on http://{args.host}:{args.port} - {stub_config.snapshot()}")
+    print(f"🧪 Point the backend at them with STUB_PROVIDERS_URL=http://{args.host}:{args.port}")
+    make_server(args.host, args.port, stub_app, threaded=True).serve_forever()